@@ -1,18 +1,98 @@
 import os
+import threading
 import pygame
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO, List, Optional, Tuple, Union
+from asset_pack import AssetPack
+from text_cache import TextCache
+from music_player import MusicPlayer
 
 class AssetManager:
+    LOADER_THREADS = 4
+    # SDL_ttf opens every font through one FreeType library, which must not
+    # create faces on several threads at once; sounds and images load in parallel
+    FONT_LOCK = threading.Lock()
+    # Built from assets/ by asset_pack.py for release builds; loose files are the fallback
+    PACK_FILE = 'assets.pak'
+
+    FONT_SIZES = {
+        'pixel_8': 8,
+        'pixel_16': 16,
+        'pixel_24': 24,
+        'pixel_48': 48,
+        'pixel_64': 64,
+    }
+
+    SOUND_FILES = {
+        'jump': 'jump.wav',
+        'collision': 'collision.ogg',
+        'complete': 'complete.wav',
+        'select': 'select.wav',
+        'highlight': 'highlight.wav',
+        'death': 'death.wav',
+        'alarm': 'alarm.wav',
+        'elimination': 'explosion.wav',
+        'victory': 'victory.ogg',
+        'spawn': 'spawn.mp3',
+    }
+
+    # Streamed by the music player, never decoded into the sound cache
+    MUSIC_FILES = {
+        'menu': 'menu.mp3',
+        'music': 'music.mp3',
+    }
+
+    SPRITE_FILES = {
+        'player_stand': 'standing.png',
+        'player_jump_up': 'jumping-up.png',
+        'player_jump_left': 'jumping-left.png',
+        'player_jump_right': 'jumping-right.png',
+    }
+
+    # Everything the menus draw or play; loaded before the rest
+    MENU_ASSETS = ['pixel_16', 'pixel_24', 'pixel_64', 'highlight', 'select',
+                   'player_stand', 'player_jump_up']
+
     def __init__(self):
         self.fonts = {}
         self.sounds = {}
         self.sprites = {}
-        self.current_music = None
-        self.current_music_file = None  # Track current music file
+        # Surfaces that depend on the window size (scaled sprites, overlays)
+        self.display_cache = {}
+        self.display_cache_size = None
         
         # Determine base path
         self.base_path = os.path.join(os.getenv('GAME_ROOT'), 'assets')
-        
+        self.pack = self._open_pack(os.path.join(os.getenv('GAME_ROOT'), self.PACK_FILE))
+
+        if self.pack is None:
+            self._check_asset_dirs()
+
+        pygame.font.init()
+        pygame.mixer.init()
+        self.text = TextCache(self.get_font)
+        self.music = MusicPlayer({name: f'sounds/{file}' for name, file in self.MUSIC_FILES.items()},
+                                 self.open_asset)
+
+        # Assets load on worker threads in manifest order, menu assets first.
+        # Each name maps to its future until the main thread collects the result.
+        self.manifest = self._build_manifest()
+        self.pending = {}
+        self.executor = ThreadPoolExecutor(max_workers=self.LOADER_THREADS)
+        for kind, name, path in self.manifest:
+            self.pending[name] = (kind, self.executor.submit(self._load_asset, kind, name, path))
+        self.executor.shutdown(wait=False)
+
+    def _open_pack(self, pack_path: str) -> Optional[AssetPack]:
+        if not os.path.exists(pack_path):
+            return None
+        try:
+            return AssetPack(pack_path)
+        except (OSError, ValueError) as e:
+            print(f"Warning: Error opening asset pack {pack_path}, using loose files: {str(e)}")
+            return None
+
+    def _check_asset_dirs(self):
         if not os.path.exists(self.base_path):
             raise FileNotFoundError(f"Assets directory not found at: {self.base_path}")
             
@@ -24,111 +104,135 @@ class AssetManager:
         if not os.path.exists(art_path):
             raise FileNotFoundError(f"Art directory not found at: {art_path}")
 
-        self._init_fonts()
-        self._init_sounds()
-        self._init_sprites()
-        
-        
-    def _init_fonts(self):
-        pygame.font.init()
-        font_path = os.path.join(self.base_path, 'fonts', 'pixel.ttf')
-        self.fonts = {
-            'pixel_8': pygame.font.Font(font_path, 8),
-            'pixel_16': pygame.font.Font(font_path, 16),
-            'pixel_24': pygame.font.Font(font_path, 24),
-            'pixel_48': pygame.font.Font(font_path, 48),
-            'pixel_64': pygame.font.Font(font_path, 64),
-        }
-        
-    def _init_sounds(self):
-        pygame.mixer.init()
-        sound_files = {
-            'jump': 'jump.wav',
-            'collision': 'collision.ogg',
-            'complete': 'complete.wav',
-            'select': 'select.wav',
-            'highlight': 'highlight.wav',
-            'music': 'music.mp3',
-            'menu': 'menu.mp3',
-            'death': 'death.wav',
-            'alarm': 'alarm.wav',
-            'elimination': 'explosion.wav',
-            'victory': 'victory.ogg',
-            'spawn': 'spawn.mp3',
-        }
-        
-        for name, file in sound_files.items():
-            try:
-                path = os.path.join(self.base_path, 'sounds', file)
-                if not os.path.exists(path):
-                    print(f"Warning: Sound file not found: {path}")
-                    self.sounds[name] = None  # Store None for missing sounds
-                    continue
-                self.sounds[name] = pygame.mixer.Sound(path)
-            except Exception as e:
-                print(f"Warning: Error loading sound {file}: {str(e)}")
-                self.sounds[name] = None
-
-    def _init_sprites(self):
-        """Load character sprites."""
-        sprite_files = {
-            'player_stand': 'standing.png',
-            'player_jump_up': 'jumping-up.png',
-            'player_jump_left': 'jumping-left.png',
-            'player_jump_right': 'jumping-right.png',
-        }
-        
-        for name, file in sprite_files.items():
-            try:
-                path = os.path.join(self.base_path, 'art', file)
-                if not os.path.exists(path):
-                    print(f"Warning: Sprite file not found: {path}")
-                    self.sprites[name] = None
-                    continue
-                sprite = pygame.image.load(path).convert_alpha()
-                self.sprites[name] = sprite
-            except Exception as e:
-                print(f"Warning: Error loading sprite {file}: {str(e)}")
-                self.sprites[name] = None
+    def open_asset(self, path: str) -> Optional[Union[str, BinaryIO]]:
+        """
+        Resolve a path relative to assets/ (e.g. 'art/icon.png') to something
+        pygame can load: a file object over the pack, or a loose file path.
+        Returns None if the asset does not exist.
+        """
+        if self.pack is not None and path in self.pack:
+            return self.pack.open(path)
+        loose_path = os.path.join(self.base_path, *path.split('/'))
+        return loose_path if os.path.exists(loose_path) else None
+
+    def _build_manifest(self) -> List[Tuple[str, str, str]]:
+        """List (kind, name, path relative to assets/) for every asset, with the menu's assets first"""
+        manifest = [('font', name, 'fonts/pixel.ttf') for name in self.FONT_SIZES]
+        manifest += [('sound', name, f'sounds/{file}') for name, file in self.SOUND_FILES.items()]
+        manifest += [('sprite', name, f'art/{file}') for name, file in self.SPRITE_FILES.items()]
+        manifest.sort(key=lambda entry: entry[1] not in self.MENU_ASSETS)
+        return manifest
+
+    def _load_asset(self, kind: str, name: str, path: str):
+        """Runs on a loader thread. Returns None for missing or broken files."""
+        try:
+            source = self.open_asset(path)
+            if source is None:
+                print(f"Warning: {kind.capitalize()} file not found: {path}")
+                return None
+            if kind == 'font':
+                with self.FONT_LOCK:
+                    return pygame.font.Font(source, self.FONT_SIZES[name])
+            if kind == 'sound':
+                return pygame.mixer.Sound(file=source)
+            # Sprites are converted on the main thread once the display is known
+            return pygame.image.load(source, os.path.basename(path))
+        except Exception as e:
+            print(f"Warning: Error loading {kind} {os.path.basename(path)}: {str(e)}")
+            return None
+
+    def _collect(self, name: str, wait: bool = True) -> bool:
+        """Move a finished asset into its cache. Returns False if it is still loading."""
+        if name not in self.pending:
+            return True
+        kind, future = self.pending[name]
+        if not wait and not future.done():
+            return False
+        asset = future.result()
+        del self.pending[name]
+        if kind == 'font':
+            self.fonts[name] = asset
+        elif kind == 'sound':
+            if asset and hasattr(self, 'options_manager'):
+                options = self.options_manager.options
+                asset.set_volume(options['master_volume'] * options['sfx_volume'])
+            self.sounds[name] = asset
+        else:
+            self.sprites[name] = asset.convert_alpha() if asset else None
+        return True
+
+    def load_progress(self, names: Optional[List[str]] = None) -> float:
+        """Fraction of the given assets (default: all) that have finished loading"""
+        names = names if names is not None else [entry[1] for entry in self.manifest]
+        done = sum(1 for name in names if name not in self.pending or self.pending[name][1].done())
+        return done / len(names) if names else 1.0
+
+    def wait_for(self, names: List[str]):
+        for name in names:
+            self._collect(name)
                 
     def get_font(self, name: str) -> pygame.font.Font:
+        self._collect(name)
         return self.fonts.get(name)
         
     def play_sound(self, name: str):
-        if sound := self.sounds.get(name):
+        # A sound that is still loading is skipped rather than waited for
+        if self._collect(name, wait=False) and (sound := self.sounds.get(name)):
             sound.play()
+
+    def stop_sound(self, name: str):
+        if sound := self.sounds.get(name):
+            sound.stop()
             
     def stop_music(self):
-        if self.current_music:
-            self.current_music.stop()
-        self.current_music = None
-            
+        self.music.stop()
+
     def play_menu_music(self):
-        if menu_music := self.sounds.get('menu'):
-            self.stop_music()
-            pygame.mixer.music.load(os.path.join(self.base_path, 'sounds', 'menu.mp3'))
-            pygame.mixer.music.play(-1)
-            self.current_music = menu_music
-            self.current_music_file = 'menu'
-            # Set initial volume based on options
-            if hasattr(self, 'options_manager'):
-                volume = self.options_manager.options['master_volume'] * self.options_manager.options['music_volume']
-                pygame.mixer.music.set_volume(volume)
+        self.music.play('menu')
 
     def play_game_music(self):
-        if game_music := self.sounds.get('music'):
-            self.stop_music()
-            pygame.mixer.music.load(os.path.join(self.base_path, 'sounds', 'music.mp3'))
-            pygame.mixer.music.play(-1)
-            self.current_music = game_music
-            self.current_music_file = 'music'
-            # Set initial volume based on options
-            if hasattr(self, 'options_manager'):
-                volume = self.options_manager.options['master_volume'] * self.options_manager.options['music_volume']
-                pygame.mixer.music.set_volume(volume)
+        self.music.play('music')
 
     def get_sprite(self, name: str) -> Optional[pygame.Surface]:
+        self._collect(name)
         return self.sprites.get(name)
+
+    def _get_display_cache(self) -> dict:
+        """Return the size-dependent cache, dropping it if the window size changed"""
+        size = pygame.display.get_surface().get_size()
+        if size != self.display_cache_size:
+            self.invalidate_display_cache()
+            self.display_cache_size = size
+        return self.display_cache
+
+    def invalidate_display_cache(self):
+        """Drop scaled sprites and overlays, e.g. after a resize or fullscreen toggle"""
+        self.display_cache = {}
+        self.display_cache_size = None
+
+    def get_scaled_sprite(self, name: str, size: Tuple[int, int]) -> Optional[pygame.Surface]:
+        """Return a sprite scaled to size, scaling it only on first use"""
+        cache = self._get_display_cache()
+        key = ('sprite', name, size)
+        if key not in cache:
+            sprite = self.get_sprite(name)
+            cache[key] = pygame.transform.scale(sprite, size) if sprite else None
+        return cache[key]
+
+    def get_overlay(self, size: Tuple[int, int], color: Tuple[int, int, int] = (0, 0, 0),
+                    alpha: Optional[int] = None) -> pygame.Surface:
+        """Return a reusable solid overlay surface"""
+        cache = self._get_display_cache()
+        key = ('overlay', size, color, alpha)
+        if key not in cache:
+            overlay = pygame.Surface(size)
+            if alpha is not None:
+                overlay.set_alpha(alpha)
+            overlay.fill(color)
+            cache[key] = overlay
+        return cache[key]
     
     def set_options_manager(self, options_manager):
-        self.options_manager = options_manager
\ No newline at end of file
+        self.options_manager = options_manager
+        options = options_manager.options
+        self.music.set_volume(options['master_volume'] * options['music_volume'])
\ No newline at end of file
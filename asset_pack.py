@@ -0,0 +1,125 @@
+import io
+import json
+import mmap
+import os
+import struct
+import sys
+from typing import Dict, Optional, Tuple
+
+class PackedFile(io.RawIOBase):
+    """
+    Read-only file object over one blob of a memory-mapped pack. Reads copy
+    straight from the mapping into the caller's buffer, so pygame loaders get
+    a seekable file without the blob being duplicated into a bytes object first.
+    """
+    def __init__(self, view: memoryview, name: str):
+        self.view = view
+        self.name = name
+        self.position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        count = min(len(buffer), len(self.view) - self.position)
+        if count <= 0:
+            return 0
+        buffer[:count] = self.view[self.position:self.position + count]
+        self.position += count
+        return count
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self.position
+        elif whence == io.SEEK_END:
+            offset += len(self.view)
+        self.position = max(0, offset)
+        return self.position
+
+    def tell(self) -> int:
+        return self.position
+
+class AssetPack:
+    """
+    A single file holding the whole assets/ tree:
+
+        header  magic, format version, index length
+        index   JSON {relative path: [offset, size]}
+        blobs   file contents, each starting on an ALIGNMENT boundary
+
+    The pack is memory-mapped, so opening an asset costs no system calls and
+    pages are read in only when a loader touches them.
+    """
+    MAGIC = b'RPAK'
+    VERSION = 1
+    HEADER = struct.Struct('<4sII')
+    ALIGNMENT = 64
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, 'rb') as file:
+            self.mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, index_size = self.HEADER.unpack_from(self.mapping, 0)
+        if magic != self.MAGIC or version != self.VERSION:
+            self.mapping.close()
+            raise ValueError(f"Not a version {self.VERSION} asset pack: {path}")
+        index_start = self.HEADER.size
+        self.index: Dict[str, Tuple[int, int]] = json.loads(
+            self.mapping[index_start:index_start + index_size].decode('utf-8'))
+        self.view = memoryview(self.mapping)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.index
+
+    def open(self, name: str) -> Optional[PackedFile]:
+        """Open an asset by its path relative to assets/, using forward slashes"""
+        if name not in self.index:
+            return None
+        offset, size = self.index[name]
+        return PackedFile(self.view[offset:offset + size], name)
+
+    @classmethod
+    def build(cls, assets_dir: str, pack_path: str) -> int:
+        """Pack every file under assets_dir into pack_path. Returns the number of files."""
+        names = sorted(
+            os.path.relpath(os.path.join(root, file), assets_dir).replace(os.sep, '/')
+            for root, _, files in os.walk(assets_dir) for file in files)
+        sizes = [os.path.getsize(os.path.join(assets_dir, name)) for name in names]
+
+        # Offsets depend on the index size, and the index holds the offsets, so
+        # lay the blobs out with a placeholder index until the size settles
+        index = {}
+        index_bytes = b''
+        while True:
+            offset = cls._align(cls.HEADER.size + len(index_bytes))
+            for name, size in zip(names, sizes):
+                index[name] = [offset, size]
+                offset = cls._align(offset + size)
+            encoded = json.dumps(index, separators=(',', ':')).encode('utf-8')
+            # Only an index identical to the one the layout assumed is consistent with it
+            if encoded == index_bytes:
+                break
+            index_bytes = encoded
+
+        with open(pack_path, 'wb') as pack:
+            pack.write(cls.HEADER.pack(cls.MAGIC, cls.VERSION, len(index_bytes)))
+            pack.write(index_bytes)
+            for name in names:
+                pack.write(b'\0' * (index[name][0] - pack.tell()))
+                with open(os.path.join(assets_dir, name), 'rb') as file:
+                    pack.write(file.read())
+        return len(names)
+
+    @classmethod
+    def _align(cls, offset: int) -> int:
+        return (offset + cls.ALIGNMENT - 1) // cls.ALIGNMENT * cls.ALIGNMENT
+
+if __name__ == '__main__':
+    # Usage: python asset_pack.py [assets_dir] [pack_path]
+    assets_dir = sys.argv[1] if len(sys.argv) > 1 else 'assets'
+    pack_path = sys.argv[2] if len(sys.argv) > 2 else 'assets.pak'
+    count = AssetPack.build(assets_dir, pack_path)
+    print(f"Packed {count} files from {assets_dir} into {pack_path}")
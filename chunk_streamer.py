@@ -0,0 +1,194 @@
+import json
+import math
+import os
+import sys
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+from level_compiler import LevelCompiler
+
+Cell = Tuple[int, int]
+
+@dataclass
+class Chunk:
+    cell: Cell
+    shapes: List[dict]
+    enemies: List[dict]
+    nbytes: int
+
+class ChunkStreamer:
+    """
+    Streams a chunked level: a folder holding level.json (settings plus a
+    'streaming' block) and one <cx>_<cy>.json per xy cell of chunk_size units.
+    Cells within load_radius of the player are compiled and loaded on a worker
+    thread; cells that are no longer needed stay resident until the memory cap
+    is hit, then the farthest are evicted first. Only resident shapes are
+    sliced and collided against.
+    """
+    LEVEL_FILE = 'level.json'
+    DEFAULT_CHUNK_SIZE = 16.0
+    DEFAULT_LOAD_RADIUS = 24.0
+    DEFAULT_MEMORY_CAP_MB = 64
+
+    def __init__(self, level_dir: str, streaming: dict, cache_dir: str):
+        self.level_dir = level_dir
+        self.chunk_size = float(streaming.get('chunk_size', self.DEFAULT_CHUNK_SIZE))
+        self.load_radius = float(streaming.get('load_radius', self.DEFAULT_LOAD_RADIUS))
+        self.memory_cap = int(streaming.get('memory_cap_mb', self.DEFAULT_MEMORY_CAP_MB) * 1024 * 1024)
+        self.compiler = LevelCompiler(cache_dir)
+        self.cells = set(self._list_cells())
+        self.chunks: Dict[Cell, Chunk] = {}
+        self.pending: Dict[Cell, Future] = {}
+        # Enemies spawn the first time their cell loads, not every time it reloads
+        self.spawned_cells = set()
+        self.new_enemies: List[dict] = []
+        self.shapes: List[dict] = []
+        self.executor = ThreadPoolExecutor(max_workers=1)
+
+    def _list_cells(self) -> List[Cell]:
+        cells = []
+        for filename in os.listdir(self.level_dir):
+            stem, ext = os.path.splitext(filename)
+            if ext == '.json' and filename != self.LEVEL_FILE:
+                try:
+                    cx, cy = stem.split('_')
+                    cells.append((int(cx), int(cy)))
+                except ValueError:
+                    print(f"Warning: Ignoring {filename} in {self.level_dir}, chunks are named <cx>_<cy>.json")
+        return cells
+
+    def _cell_distance(self, cell: Cell, x: float, y: float) -> float:
+        """Distance from (x, y) to the nearest point of the cell"""
+        min_x, min_y = cell[0] * self.chunk_size, cell[1] * self.chunk_size
+        dx = max(min_x - x, 0.0, x - (min_x + self.chunk_size))
+        dy = max(min_y - y, 0.0, y - (min_y + self.chunk_size))
+        return math.hypot(dx, dy)
+
+    def _wanted_cells(self, x: float, y: float) -> List[Cell]:
+        reach = int(math.ceil(self.load_radius / self.chunk_size))
+        cx, cy = int(math.floor(x / self.chunk_size)), int(math.floor(y / self.chunk_size))
+        return [(i, j) for i in range(cx - reach, cx + reach + 1) for j in range(cy - reach, cy + reach + 1)
+                if (i, j) in self.cells and self._cell_distance((i, j), x, y) <= self.load_radius]
+
+    def update(self, user_pos, wait: bool = False) -> bool:
+        """
+        Request the cells around user_pos and collect finished loads. With wait,
+        block until they are resident (used before the level starts). Returns
+        True if the resident shapes changed.
+        """
+        x, y = float(user_pos[0]), float(user_pos[1])
+        wanted = self._wanted_cells(x, y)
+        for cell in wanted:
+            if cell not in self.chunks and cell not in self.pending:
+                self.pending[cell] = self.executor.submit(self._load_chunk, cell)
+
+        changed = False
+        for cell, future in list(self.pending.items()):
+            if not wait and not future.done():
+                continue
+            del self.pending[cell]
+            chunk = future.result()
+            if chunk is None:
+                # Keep the cell out of future requests instead of retrying every update
+                self.cells.discard(cell)
+                continue
+            self.chunks[cell] = chunk
+            if cell not in self.spawned_cells:
+                self.spawned_cells.add(cell)
+                self.new_enemies.extend(chunk.enemies)
+            changed = True
+
+        changed = self._evict(set(wanted), x, y) or changed
+        if changed:
+            self.shapes = [shape for cell in sorted(self.chunks) for shape in self.chunks[cell].shapes]
+        return changed
+
+    def _evict(self, wanted: set, x: float, y: float) -> bool:
+        """Drop the farthest unneeded chunks while resident memory is over the cap"""
+        resident = sum(chunk.nbytes for chunk in self.chunks.values())
+        if resident <= self.memory_cap:
+            return False
+        evicted = False
+        for cell in sorted(self.chunks, key=lambda cell: -self._cell_distance(cell, x, y)):
+            if resident <= self.memory_cap:
+                break
+            if cell in wanted:
+                continue
+            resident -= self.chunks.pop(cell).nbytes
+            evicted = True
+        return evicted
+
+    def _load_chunk(self, cell: Cell) -> Optional[Chunk]:
+        """Runs on the worker thread"""
+        path = os.path.join(self.level_dir, f"{cell[0]}_{cell[1]}.json")
+        try:
+            config = self.compiler.load(path)
+        except Exception as e:
+            print(f"Warning: Error loading chunk {path}: {str(e)}")
+            return None
+        # Instances share their prototype's arrays, so count each array once
+        arrays = {id(shape[key]): shape[key] for shape in config['shapes']
+                  for key in ('points', 'edges', 'planes', 'triangles') if key in shape}
+        nbytes = sum(array.nbytes for array in arrays.values())
+        return Chunk(cell, config['shapes'], config['enemies'], nbytes)
+
+    def take_new_enemies(self) -> List[dict]:
+        """Enemy spawns from cells that became resident for the first time"""
+        enemies, self.new_enemies = self.new_enemies, []
+        return enemies
+
+    def resident_bytes(self) -> int:
+        return sum(chunk.nbytes for chunk in self.chunks.values())
+
+    def shutdown(self):
+        for future in self.pending.values():
+            future.cancel()
+        self.executor.shutdown(wait=False)
+
+    @classmethod
+    def split_level(cls, source_path: str, level_dir: str, chunk_size: float = DEFAULT_CHUNK_SIZE) -> int:
+        """
+        Convert a flat level JSON into a chunked level folder, putting each shape
+        and enemy spawn in the cell holding its xy center (an instance's position).
+        Each chunk carries the prototypes its instances use. Returns the chunk count.
+        """
+        with open(source_path, 'r') as f:
+            config = json.load(f)
+        chunks: Dict[Cell, dict] = {}
+
+        def cell_of(x: float, y: float) -> dict:
+            cell = (int(math.floor(x / chunk_size)), int(math.floor(y / chunk_size)))
+            return chunks.setdefault(cell, {'shapes': [], 'enemies': []})
+
+        prototypes = config.get('prototypes', {})
+        for shape in config.get('shapes', []):
+            if 'prototype' in shape:
+                x, y = shape.get('transform', {}).get('position', [0.0, 0.0, 0.0])[:2]
+                chunk = cell_of(x, y)
+                if shape['prototype'] in prototypes:
+                    chunk.setdefault('prototypes', {})[shape['prototype']] = prototypes[shape['prototype']]
+                chunk['shapes'].append(shape)
+                continue
+            xs = [point[0] for point in shape['points']]
+            ys = [point[1] for point in shape['points']]
+            cell_of((min(xs) + max(xs)) / 2, (min(ys) + max(ys)) / 2)['shapes'].append(shape)
+        for enemy in config.get('enemies', []):
+            cell_of(enemy['position'][0], enemy['position'][1])['enemies'].append(enemy)
+
+        os.makedirs(level_dir, exist_ok=True)
+        settings = dict(config.get('settings', {}))
+        # Shapes can overhang their cell, so load a margin around the player's cell
+        settings['streaming'] = {'chunk_size': chunk_size, 'load_radius': chunk_size * 1.5,
+                                 'memory_cap_mb': cls.DEFAULT_MEMORY_CAP_MB}
+        with open(os.path.join(level_dir, cls.LEVEL_FILE), 'w') as f:
+            json.dump({'settings': settings}, f, indent=2)
+        for (cx, cy), chunk in chunks.items():
+            with open(os.path.join(level_dir, f"{cx}_{cy}.json"), 'w') as f:
+                json.dump(chunk, f)
+        return len(chunks)
+
+if __name__ == '__main__':
+    # Usage: python chunk_streamer.py levels/5.json levels/5 [chunk_size]
+    chunk_size = float(sys.argv[3]) if len(sys.argv) > 3 else ChunkStreamer.DEFAULT_CHUNK_SIZE
+    count = ChunkStreamer.split_level(sys.argv[1], sys.argv[2], chunk_size)
+    print(f"Wrote {count} chunks to {sys.argv[2]}")
@@ -5,6 +5,9 @@ cd /d "%~dp0"
 REM load the .venv python environment
 call .venv\Scripts\activate
 
+REM Pack the assets folder into a single archive next to the executable
+python asset_pack.py assets dist\assets.pak
+
 REM Run the PyInstaller command
 pyinstaller --onefile --noconsole --hidden-import scipy.special._cdflib main.py
 
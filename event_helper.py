@@ -0,0 +1,26 @@
+import pygame
+from typing import List
+
+class EventHelper:
+    """
+    Blocking event waits for menus and modal screens, so they sleep until
+    input arrives (or an animation frame is due) instead of spinning and
+    redrawing at a fixed rate.
+    """
+    # Static screens still wake up this often, e.g. to notice the window being restored
+    IDLE_TIMEOUT_MS = 500
+    # Events that change nothing on screen
+    QUIET_EVENTS = (pygame.MOUSEMOTION, pygame.NOEVENT)
+
+    @staticmethod
+    def wait_events(timeout_ms: int = IDLE_TIMEOUT_MS) -> List[pygame.event.Event]:
+        """Sleep until an event arrives or timeout_ms passes, then drain the queue"""
+        first = pygame.event.wait(max(1, int(timeout_ms)))
+        events = [] if first.type == pygame.NOEVENT else [first]
+        events.extend(pygame.event.get())
+        return events
+
+    @staticmethod
+    def needs_redraw(events: List[pygame.event.Event]) -> bool:
+        """Whether any of the events could change the screen (input, resize, expose, ...)"""
+        return any(event.type not in EventHelper.QUIET_EVENTS for event in events)
@@ -1,7 +1,21 @@
 import numpy as np
-from scipy.spatial import ConvexHull
+from dataclasses import dataclass
 from typing import Tuple, List, Optional, Union
 from settings import Settings
+from mesh_slicer import MeshSlicer
+
+@dataclass
+class PolygonBatch:
+    """
+    Pre-ordered 2D polygons packed into a single vertex array.
+    Polygon i spans vertices[offsets[i]:offsets[i + 1]] and came from source[i].
+    """
+    vertices: np.ndarray
+    offsets: np.ndarray
+    source: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
 
 class GeometryHelper:
     @staticmethod
@@ -60,9 +74,24 @@ class GeometryHelper:
                             user_pos: np.ndarray, 
                             plane_angle: float) -> Tuple[List[Tuple[float, float]], List[Tuple[int, int]]]:
         """
-        Compute intersection points and edges for a single shape.
+        Compute intersection points and edges for a single shape. Placed instances
+        are sliced in their own frame, which gives the same 2D coordinates.
         """
+        user_pos, plane_angle = GeometryHelper.local_pose(shape, user_pos, plane_angle)
         pts_3d = shape['points']
+
+        # Compiled levels carry bounds: skip shapes whose box lies on one side of the plane
+        bounds = shape.get('bounds')
+        if bounds is not None:
+            n = np.array([np.cos(plane_angle), np.sin(plane_angle)])
+            corners = np.array([[bounds[i][0], bounds[j][1]] for i in (0, 1) for j in (0, 1)])
+            distances = (corners - np.asarray(user_pos)[:2]) @ n
+            if distances.min() > 0 or distances.max() < 0:
+                return [], []
+
+        # Triangle meshes may be non-convex and are sliced into polygons with holes
+        if shape.get('triangles') is not None:
+            return MeshSlicer.slice_mesh(shape, user_pos, plane_angle)
         edges = shape['edges']
         
         # Gather intersection points
@@ -79,14 +108,17 @@ class GeometryHelper:
         intersection_points_2d = [GeometryHelper.project_point_onto_plane_2D(pt, user_pos, plane_angle)
                                 for pt in intersection_points_3d]
 
-        # Compute edges based on number of points
+        # Compute edges based on number of points. Points are returned in hull
+        # order so callers can draw and collide against them directly.
         edges_2d = []
         if len(intersection_points_2d) >= 3:
+            # scipy.spatial is slow to import, so it is loaded on the first slice instead of at startup
+            from scipy.spatial import ConvexHull
             try:
                 hull = ConvexHull(intersection_points_2d)
-                hull_indices = hull.vertices
-                edges_2d = [(hull_indices[i], hull_indices[(i+1) % len(hull_indices)])
-                           for i in range(len(hull_indices))]
+                intersection_points_2d = [intersection_points_2d[i] for i in hull.vertices]
+                edges_2d = [(i, (i+1) % len(intersection_points_2d))
+                           for i in range(len(intersection_points_2d))]
             except:
                 pass
         elif len(intersection_points_2d) == 2:
@@ -95,6 +127,14 @@ class GeometryHelper:
         return intersection_points_2d, edges_2d
     
 
+    @staticmethod
+    def local_pose(shape: dict, user_pos: np.ndarray, plane_angle: float) -> Tuple[np.ndarray, float]:
+        """The slicing pose in the shape's frame (unchanged for shapes given in world space)"""
+        transform = shape.get('transform')
+        if transform is None:
+            return user_pos, plane_angle
+        return transform.to_local(user_pos, plane_angle)
+
     @staticmethod
     def get_user_convex_hull(user_pos: np.ndarray, plane_angle: float, settings: Settings) -> List[Tuple[float, float]]:
         """Generate the user's convex hull in 2D plane coordinates"""
@@ -113,13 +153,111 @@ class GeometryHelper:
     def get_convex_hull(shape: dict, user_pos: np.ndarray, plane_angle: float) -> List[Tuple[float, float]]:
         """Get shape's convex hull in current intersection plane"""
         points_2d, _ = GeometryHelper.compute_intersections(shape, user_pos, plane_angle)
-        if len(points_2d) < 3:
-            return points_2d
-        try:
-            hull = ConvexHull(points_2d)
-            return [points_2d[i] for i in hull.vertices]
-        except:
-            return points_2d
+        return points_2d
+
+    @staticmethod
+    def check_halfspace_collision(planes: np.ndarray, user_pos: np.ndarray, plane_angle: float,
+                                  half_width: float, half_height: float, eps: float = 1e-9) -> bool:
+        """
+        Test the player's rectangle, lying in the slicing plane around user_pos,
+        against a convex shape given by its face planes (n.p + d <= 0 inside).
+        Each face becomes a half-plane in the slicing plane's (X, Z) coordinates,
+        so no slice is built.
+        """
+        if len(planes) == 0:
+            return False
+        p_x = np.array([-np.sin(plane_angle), np.cos(plane_angle), 0.0])
+        normals = planes[:, :3]
+        # Half-planes a.(X, Z) <= b, with (X, Z) relative to user_pos like the slices
+        a = np.column_stack([normals @ p_x, normals[:, 2]])
+        b = -(normals @ user_pos + planes[:, 3])
+
+        corners = np.array([[-half_width, -half_height], [half_width, -half_height],
+                            [half_width, half_height], [-half_width, half_height]])
+        inside = corners @ a.T - b <= eps
+        if (~inside).all(axis=0).any():
+            return False  # One face has every corner outside it
+        if inside.all():
+            return True  # The rectangle lies inside the shape
+
+        # Otherwise clip the rectangle by each half-plane; what remains is the overlap
+        polygon = corners
+        for normal, limit in zip(a, b):
+            polygon = GeometryHelper._clip_polygon(polygon, normal, limit, eps)
+            if len(polygon) == 0:
+                return False
+        return True
+
+    @staticmethod
+    def _clip_polygon(polygon: np.ndarray, normal: np.ndarray, limit: float, eps: float) -> np.ndarray:
+        """Clip a convex polygon to normal.p <= limit (Sutherland-Hodgman, one edge)"""
+        values = polygon @ normal - limit
+        if (values <= eps).all():
+            return polygon
+        clipped = []
+        for i in range(len(polygon)):
+            j = (i + 1) % len(polygon)
+            if values[i] <= eps:
+                clipped.append(polygon[i])
+            if (values[i] <= eps) != (values[j] <= eps):
+                t = values[i] / (values[i] - values[j])
+                clipped.append(polygon[i] + t * (polygon[j] - polygon[i]))
+        return np.array(clipped).reshape(-1, 2)
+
+    @staticmethod
+    def check_slice_collision(points_2d: List[Tuple[float, float]], edges: List[Tuple[int, int]],
+                              half_width: float, half_height: float) -> bool:
+        """
+        Test the player's rectangle (centered on the origin) against an arbitrary
+        slice: a hit if any slice edge crosses the rectangle or the rectangle's
+        center lies inside one of the slice's closed polygons.
+        """
+        if not edges:
+            return False
+        points = np.asarray(points_2d, dtype=float)
+        edge_array = np.asarray(edges, dtype=int)
+        start, end = points[edge_array[:, 0]], points[edge_array[:, 1]]
+
+        # Liang-Barsky clip of every edge against the rectangle at once
+        delta = end - start
+        t_enter = np.zeros(len(edge_array))
+        t_exit = np.ones(len(edge_array))
+        rejected = np.zeros(len(edge_array), dtype=bool)
+        for p, q in ((-delta[:, 0], start[:, 0] + half_width), (delta[:, 0], half_width - start[:, 0]),
+                     (-delta[:, 1], start[:, 1] + half_height), (delta[:, 1], half_height - start[:, 1])):
+            parallel = np.abs(p) < 1e-12
+            rejected |= parallel & (q < 0)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                ratio = q / p
+            t_enter = np.where(~parallel & (p < 0), np.maximum(t_enter, ratio), t_enter)
+            t_exit = np.where(~parallel & (p > 0), np.minimum(t_exit, ratio), t_exit)
+        if (~rejected & (t_enter <= t_exit)).any():
+            return True
+
+        # Even-odd test of the center against the closed polygons' edges
+        closed = MeshSlicer.polygons_from_edges(list(map(tuple, points.tolist())), edges)
+        for polygon in closed:
+            if MeshSlicer.contains_point(np.asarray(polygon), np.zeros(2)):
+                return True
+        return False
+
+    @staticmethod
+    def build_polygon_batch(polygons: List[List[Tuple[float, float]]], min_points: int = 2,
+                            sources: Optional[List[int]] = None) -> PolygonBatch:
+        """
+        Pack hull-ordered polygons into a PolygonBatch, skipping ones with too few
+        points. sources gives each polygon's shape index (default: its position).
+        """
+        counts = [len(polygon) if len(polygon) >= min_points else 0 for polygon in polygons]
+        kept = [i for i, count in enumerate(counts) if count]
+        source = np.array([sources[i] for i in kept] if sources is not None else kept, dtype=int)
+        offsets = np.zeros(len(source) + 1, dtype=int)
+        np.cumsum([counts[i] for i in kept], out=offsets[1:])
+        if len(source):
+            vertices = np.array([pt for i in kept for pt in polygons[i]], dtype=float)
+        else:
+            vertices = np.zeros((0, 2), dtype=float)
+        return PolygonBatch(vertices=vertices, offsets=offsets, source=source)
         
     @staticmethod
     def get_collision_normal(hull1: List[Tuple[float, float]], hull2: List[Tuple[float, float]], 
@@ -1,28 +1,108 @@
+import atexit
 import json
 import os
+import queue
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+from leaderboard_store import LeaderboardStore, LevelResult, RunRecord
 
 class HighScoreManager:
-    def __init__(self):
-        self.filename = os.path.join(os.getenv('GAME_ROOT'), 'data', 'high_scores.json')
-        self.high_scores = self._load_high_scores()
+    """
+    Records runs in the leaderboard database (data/leaderboard.db). Finished
+    runs are queued for a writer thread, so the game never waits on the disk;
+    queries wait only for writes still queued, then read through their own
+    connection. SQLite's locking lets several game instances share the file.
+    """
 
-    def _load_high_scores(self):
-        if not os.path.exists(self.filename):
-            return {}
-        with open(self.filename, 'r') as f:
-            return json.load(f)
+    def __init__(self, db_path: Optional[str] = None):
+        self.db_path = db_path or os.path.join(os.getenv('GAME_ROOT'), 'data', 'leaderboard.db')
+        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        # Level results of the run being played, written with it by add_score
+        self.run_levels: List[LevelResult] = []
+        self.store = LeaderboardStore(self.db_path)
+        self.queue: queue.Queue = queue.Queue()
+        self.queue.put(self._import_legacy_scores)
+        self.writer = threading.Thread(target=self._write_loop, daemon=True)
+        self.writer.start()
+        # Menus and the game quit through sys.exit from many places; none may drop queued runs
+        atexit.register(self.save_high_scores)
+
+    def _write_loop(self):
+        """Runs on the writer thread, with its own connection"""
+        store = LeaderboardStore(self.db_path)
+        while True:
+            write = self.queue.get()
+            try:
+                write(store)
+            except Exception as e:
+                print(f"Warning: Could not save high scores to {self.db_path}: {str(e)}")
+            finally:
+                self.queue.task_done()
+
+    def _import_legacy_scores(self, store: LeaderboardStore):
+        """Carry over high_scores.json (and a leftover journal) into a new database"""
+        data_dir = os.path.dirname(self.db_path)
+        json_path = os.path.join(data_dir, 'high_scores.json')
+        journal_path = os.path.join(data_dir, 'high_scores.journal')
+        scores: Dict[str, float] = {}
+        if os.path.exists(json_path):
+            try:
+                with open(json_path, 'r') as f:
+                    scores = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"Warning: Could not read old high scores {json_path}: {str(e)}")
+        if os.path.exists(journal_path):
+            with open(journal_path, 'r') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                        scores[entry['user']] = max(scores.get(entry['user'], entry['score']), entry['score'])
+                    except (ValueError, KeyError, TypeError):
+                        continue
+        if scores:
+            store.import_best_scores(scores, os.path.getmtime(json_path) if os.path.exists(json_path) else 0)
+
+    def _reader(self) -> LeaderboardStore:
+        """The main thread's connection, once queued runs are in"""
+        self.queue.join()
+        return self.store
 
     def save_high_scores(self):
-        with open(self.filename, 'w') as f:
-            json.dump(self.high_scores, f)
-
-    def add_score(self, username, score):
-        if username in self.high_scores:
-            if score > self.high_scores[username]:
-                self.high_scores[username] = score
-        else:
-            self.high_scores[username] = score
-        self.save_high_scores()
-
-    def get_top_scores(self, top_n=10):
-        return sorted(self.high_scores.items(), key=lambda x: x[1], reverse=True)[:top_n]
\ No newline at end of file
+        """Block until every queued run is written"""
+        self.queue.join()
+
+    def start_run(self):
+        """Forget level results of an abandoned run"""
+        self.run_levels = []
+
+    def record_level(self, level: int, score: float, seconds: float):
+        """A level completed in the current run; stored with it by add_score"""
+        self.run_levels.append(LevelResult(level, score, seconds))
+
+    def add_score(self, username, score, completed=False):
+        """Finish the current run and queue it for writing"""
+        levels, self.run_levels = self.run_levels, []
+        write: Callable[[LeaderboardStore], int] = (
+            lambda store: store.record_run(username, score, levels, completed))
+        self.queue.put(write)
+
+    def get_best_score(self, username: str) -> float:
+        return self._reader().best_score(username)
+
+    def get_top_scores(self, top_n=10, offset=0) -> List[Tuple[str, float]]:
+        return self._reader().top_players(top_n, offset)
+
+    def count_players(self) -> int:
+        return self._reader().count_players()
+
+    def get_level_scores(self, level: int, top_n=10, offset=0) -> List[Tuple[str, float, float]]:
+        return self._reader().top_level_results(level, top_n, offset)
+
+    def count_level_scores(self, level: int) -> int:
+        return self._reader().count_level_results(level)
+
+    def get_history(self, username: str, top_n=10, offset=0) -> List[RunRecord]:
+        return self._reader().history(username, top_n, offset)
+
+    def count_history(self, username: str) -> int:
+        return self._reader().count_history(username)
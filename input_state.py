@@ -0,0 +1,40 @@
+import pygame
+from typing import Dict, Iterable, List, Tuple
+
+class InputState:
+    """
+    Gameplay input gathered over one frame. Held keys follow KEYDOWN/KEYUP in
+    event order, so they end the frame as if each event had been applied as it
+    arrived. Wheel ticks are summed into a net step count so the viewer rotates
+    and reslices once per frame however many ticks a fast scroll delivers.
+    """
+    WHEEL_UP = 4
+    WHEEL_DOWN = 5
+
+    def __init__(self, keys: Iterable[int]):
+        self.held: Dict[int, bool] = {key: False for key in keys}
+        # This frame's key transitions in order, as (key, is_down)
+        self.transitions: List[Tuple[int, bool]] = []
+        self.wheel_steps = 0
+
+    def begin_frame(self):
+        self.transitions = []
+        self.wheel_steps = 0
+
+    def handle_event(self, event: pygame.event.Event):
+        if event.type == pygame.KEYDOWN and event.key in self.held:
+            self.held[event.key] = True
+            self.transitions.append((event.key, True))
+        elif event.type == pygame.KEYUP and event.key in self.held:
+            self.held[event.key] = False
+            self.transitions.append((event.key, False))
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            if event.button == self.WHEEL_UP:
+                self.wheel_steps += 1
+            elif event.button == self.WHEEL_DOWN:
+                self.wheel_steps -= 1
+
+    def release(self, keys: Iterable[int]):
+        """Treat keys as up, e.g. after a menu swallowed their KEYUP events"""
+        for key in keys:
+            self.held[key] = False
@@ -0,0 +1,139 @@
+import sqlite3
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+@dataclass
+class LevelResult:
+    level: int
+    score: float
+    seconds: float
+
+@dataclass
+class RunRecord:
+    run_id: int
+    username: str
+    score: float
+    completed: bool
+    finished_at: float
+    levels: int
+
+class LeaderboardStore:
+    """
+    Every run, with its per-level scores and times, in an SQLite database.
+    Best scores per player are kept in their own table so the overall board
+    is an index scan however many runs there are. One store per thread; other
+    game instances may have the same database open.
+    """
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS runs (
+            id INTEGER PRIMARY KEY,
+            username TEXT NOT NULL,
+            score REAL NOT NULL,
+            completed INTEGER NOT NULL,
+            finished_at REAL NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS level_results (
+            run_id INTEGER NOT NULL REFERENCES runs(id),
+            level INTEGER NOT NULL,
+            score REAL NOT NULL,
+            seconds REAL NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS players (
+            username TEXT PRIMARY KEY,
+            best_score REAL NOT NULL,
+            best_run INTEGER REFERENCES runs(id)
+        );
+        CREATE INDEX IF NOT EXISTS players_by_best ON players(best_score DESC);
+        CREATE INDEX IF NOT EXISTS runs_by_user ON runs(username, finished_at DESC);
+        CREATE INDEX IF NOT EXISTS level_results_by_level ON level_results(level, score DESC, seconds);
+        CREATE INDEX IF NOT EXISTS level_results_by_run ON level_results(run_id);
+    """
+    # Another instance's write transaction is short; wait this long for it
+    BUSY_TIMEOUT = 10.0
+
+    def __init__(self, path: str):
+        self.path = path
+        self.connection = sqlite3.connect(path, timeout=self.BUSY_TIMEOUT)
+        # Readers don't block the writer (or other instances) and a commit is one append
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA synchronous=NORMAL')
+        self.connection.executescript(self.SCHEMA)
+
+    def close(self):
+        self.connection.close()
+
+    def record_run(self, username: str, score: float, levels: Sequence[LevelResult] = (),
+                   completed: bool = False, finished_at: Optional[float] = None) -> int:
+        """Store a run and its level results in one transaction. Returns the run id."""
+        with self.connection:
+            return self._insert_run(username, score, levels, completed,
+                                    finished_at if finished_at is not None else time.time())
+
+    def _insert_run(self, username: str, score: float, levels: Sequence[LevelResult],
+                    completed: bool, finished_at: float) -> int:
+        cursor = self.connection.execute(
+            'INSERT INTO runs (username, score, completed, finished_at) VALUES (?, ?, ?, ?)',
+            (username, score, int(completed), finished_at))
+        run_id = cursor.lastrowid
+        self.connection.executemany(
+            'INSERT INTO level_results (run_id, level, score, seconds) VALUES (?, ?, ?, ?)',
+            [(run_id, result.level, result.score, result.seconds) for result in levels])
+        self.connection.execute(
+            'INSERT INTO players (username, best_score, best_run) VALUES (?, ?, ?) '
+            'ON CONFLICT(username) DO UPDATE SET best_score = excluded.best_score, best_run = excluded.best_run '
+            'WHERE excluded.best_score > players.best_score',
+            (username, score, run_id))
+        return run_id
+
+    def import_best_scores(self, scores: Dict[str, float], finished_at: float) -> bool:
+        """
+        Seed an empty leaderboard with one run per player, e.g. from the old
+        high_scores.json. Returns False if there already were players.
+        """
+        with self.connection:
+            # Take the write lock first so two instances starting together import once
+            self.connection.execute('BEGIN IMMEDIATE')
+            if self.connection.execute('SELECT 1 FROM players LIMIT 1').fetchone() is not None:
+                return False
+            for username, score in scores.items():
+                self._insert_run(username, score, (), False, finished_at)
+        return True
+
+    def best_score(self, username: str) -> float:
+        row = self.connection.execute('SELECT best_score FROM players WHERE username = ?', (username,)).fetchone()
+        return row[0] if row else 0
+
+    def top_players(self, limit: int, offset: int = 0) -> List[Tuple[str, float]]:
+        """(username, best score), best first"""
+        return self.connection.execute(
+            'SELECT username, best_score FROM players ORDER BY best_score DESC LIMIT ? OFFSET ?',
+            (limit, offset)).fetchall()
+
+    def count_players(self) -> int:
+        return self.connection.execute('SELECT COUNT(*) FROM players').fetchone()[0]
+
+    def top_level_results(self, level: int, limit: int, offset: int = 0) -> List[Tuple[str, float, float]]:
+        """(username, score, seconds) for one level, best score first and faster first on ties"""
+        return self.connection.execute(
+            'SELECT runs.username, level_results.score, level_results.seconds '
+            'FROM level_results JOIN runs ON runs.id = level_results.run_id '
+            'WHERE level_results.level = ? ORDER BY level_results.score DESC, level_results.seconds '
+            'LIMIT ? OFFSET ?',
+            (level, limit, offset)).fetchall()
+
+    def count_level_results(self, level: int) -> int:
+        return self.connection.execute('SELECT COUNT(*) FROM level_results WHERE level = ?', (level,)).fetchone()[0]
+
+    def history(self, username: str, limit: int, offset: int = 0) -> List[RunRecord]:
+        """A player's runs, newest first"""
+        rows = self.connection.execute(
+            'SELECT id, username, score, completed, finished_at, '
+            '(SELECT COUNT(*) FROM level_results WHERE run_id = runs.id) '
+            'FROM runs WHERE username = ? ORDER BY finished_at DESC LIMIT ? OFFSET ?',
+            (username, limit, offset)).fetchall()
+        return [RunRecord(run_id, name, score, bool(completed), finished_at, levels)
+                for run_id, name, score, completed, finished_at, levels in rows]
+
+    def count_history(self, username: str) -> int:
+        return self.connection.execute('SELECT COUNT(*) FROM runs WHERE username = ?', (username,)).fetchone()[0]
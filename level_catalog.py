@@ -0,0 +1,217 @@
+import hashlib
+import json
+import os
+import numpy as np
+import pygame
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, replace
+from typing import Dict, List, Optional
+from settings import Settings
+from level_compiler import LevelCompiler
+from level_manager import LevelManager
+from chunk_streamer import ChunkStreamer
+from geometry import GeometryHelper
+from mesh_slicer import MeshSlicer
+
+@dataclass
+class LevelEntry:
+    level: str
+    name: str
+    shape_count: int
+    enemy_count: int
+    content_hash: str
+    # Newest st_mtime_ns among the level's files
+    mtime: int
+    thumbnail: str
+
+class LevelCatalog:
+    """
+    Index of the levels for the level select screen: name, shape and enemy
+    counts, content hash and a thumbnail of the view at the spawn point. The
+    index is kept in data/level_catalog.json and thumbnails in data/thumbnails/.
+    refresh() rescans only levels whose mtime changed, on a worker pool, and a
+    level whose content hash is unchanged keeps its thumbnail.
+    """
+    THUMBNAIL_SIZE = (160, 120)
+    # Thumbnails show the spawn view zoomed out by this much
+    THUMBNAIL_SCALE = 0.5
+    WORKERS = 2
+
+    def __init__(self, level_manager: LevelManager):
+        self.level_manager = level_manager
+        data_dir = os.path.join(os.getenv('GAME_ROOT'), 'data')
+        self.index_path = os.path.join(data_dir, 'level_catalog.json')
+        self.thumbnail_dir = os.path.join(data_dir, 'thumbnails')
+        self.compiler = LevelCompiler()
+        self.entries: Dict[str, LevelEntry] = self._load_index()
+        self.pending: Dict[str, Future] = {}
+        self.thumbnails: Dict[str, pygame.Surface] = {}
+        self.executor = ThreadPoolExecutor(max_workers=self.WORKERS)
+
+    def _load_index(self) -> Dict[str, LevelEntry]:
+        if not os.path.exists(self.index_path):
+            return {}
+        try:
+            with open(self.index_path, 'r') as f:
+                return {entry['level']: LevelEntry(**entry) for entry in json.load(f)}
+        except Exception as e:
+            print(f"Warning: Rebuilding unreadable level catalog {self.index_path}: {str(e)}")
+            return {}
+
+    def _save_index(self):
+        try:
+            os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
+            temp_path = self.index_path + '.tmp'
+            with open(temp_path, 'w') as f:
+                json.dump([asdict(entry) for entry in self.entries.values()], f, indent=2)
+            os.replace(temp_path, self.index_path)
+        except OSError as e:
+            print(f"Warning: Could not write level catalog {self.index_path}: {str(e)}")
+
+    def refresh(self):
+        """Queue a rescan of every level that is new or changed since it was indexed"""
+        levels = self.level_manager.list_levels()
+        removed = set(self.entries) - set(levels)
+        for level in removed:
+            del self.entries[level]
+        for level in levels:
+            if level in self.pending:
+                continue
+            entry = self.entries.get(level)
+            if (entry is not None and entry.mtime == self._source_mtime(level)
+                    and os.path.exists(entry.thumbnail)):
+                continue
+            self.pending[level] = self.executor.submit(self._scan, level, entry)
+        if removed:
+            self._save_index()
+
+    def collect(self) -> bool:
+        """Take in finished scans without blocking. Returns True if any entry changed."""
+        changed = False
+        for level, future in list(self.pending.items()):
+            if not future.done():
+                continue
+            del self.pending[level]
+            try:
+                entry = future.result()
+            except Exception as e:
+                print(f"Warning: Could not index level {level}: {str(e)}")
+                continue
+            self.entries[level] = entry
+            self.thumbnails.pop(level, None)
+            changed = True
+        if changed:
+            self._save_index()
+        return changed
+
+    def wait(self):
+        for future in list(self.pending.values()):
+            future.exception()
+        self.collect()
+
+    def get_entries(self) -> List[LevelEntry]:
+        """Indexed levels in play order; levels still being scanned are left out"""
+        return [self.entries[level] for level in self.level_manager.list_levels() if level in self.entries]
+
+    def get_thumbnail(self, level: str) -> Optional[pygame.Surface]:
+        """The level's thumbnail, read from disk the first time it is shown"""
+        if level not in self.thumbnails:
+            entry = self.entries.get(level)
+            if entry is None or not os.path.exists(entry.thumbnail):
+                return None
+            try:
+                self.thumbnails[level] = pygame.image.load(entry.thumbnail).convert()
+            except pygame.error as e:
+                print(f"Warning: Could not load thumbnail {entry.thumbnail}: {str(e)}")
+                return None
+        return self.thumbnails[level]
+
+    def shutdown(self):
+        for future in self.pending.values():
+            future.cancel()
+        self.executor.shutdown(wait=False)
+
+    def _level_files(self, level: str) -> List[str]:
+        path = self.level_manager.get_level_path(int(level))
+        if os.path.isdir(path):
+            return sorted(os.path.join(path, filename) for filename in os.listdir(path) if filename.endswith('.json'))
+        return [path]
+
+    def _source_mtime(self, level: str) -> int:
+        return max((os.stat(path).st_mtime_ns for path in self._level_files(level)), default=0)
+
+    def _scan(self, level: str, previous: Optional[LevelEntry]) -> LevelEntry:
+        """Runs on the worker pool"""
+        files = self._level_files(level)
+        mtime = max((os.stat(path).st_mtime_ns for path in files), default=0)
+        content_hash = hashlib.sha256()
+        for path in files:
+            with open(path, 'rb') as f:
+                content_hash.update(f.read())
+        content_hash = content_hash.hexdigest()
+        if (previous is not None and previous.content_hash == content_hash
+                and os.path.exists(previous.thumbnail)):
+            # Touched but unchanged
+            return replace(previous, mtime=mtime)
+
+        settings, shape_count, enemy_count = self._read_level(level)
+        thumbnail = os.path.join(self.thumbnail_dir, f"{level}.png")
+        self._render_thumbnail(settings, thumbnail)
+        name = settings.config_data.get('settings', {}).get('name', f"Level {level}")
+        return LevelEntry(level, name, shape_count, enemy_count, content_hash, mtime, thumbnail)
+
+    def _read_level(self, level: str):
+        """Settings holding the shapes around the spawn point, plus the level's total counts"""
+        path = self.level_manager.get_level_path(int(level))
+        if not os.path.isdir(path):
+            settings = Settings(path, self.compiler.load(path))
+            return settings, len(settings.shapes), len(settings.enemies)
+
+        with open(os.path.join(path, ChunkStreamer.LEVEL_FILE), 'r') as f:
+            level_settings = json.load(f).get('settings', {})
+        shape_count = enemy_count = 0
+        for chunk_path in self._level_files(level):
+            if os.path.basename(chunk_path) != ChunkStreamer.LEVEL_FILE:
+                with open(chunk_path, 'r') as f:
+                    chunk = json.load(f)
+                shape_count += len(chunk.get('shapes', []))
+                enemy_count += len(chunk.get('enemies', []))
+        settings = Settings(path, {'settings': level_settings, 'shapes': [], 'enemies': []})
+        streamer = ChunkStreamer(path, level_settings.get('streaming', {}),
+                                 os.path.join(self.compiler.cache_dir, str(level)))
+        try:
+            streamer.update(settings.gameplay.spawn_position, wait=True)
+            settings.shapes = streamer.shapes
+        finally:
+            streamer.shutdown()
+        return settings, shape_count, enemy_count
+
+    def _render_thumbnail(self, settings: Settings, thumbnail_path: str):
+        """Draw the spawn-point slice the way the viewer shows it, scaled down, and save it"""
+        width, height = self.THUMBNAIL_SIZE
+        surface = pygame.Surface(self.THUMBNAIL_SIZE)
+        surface.fill(settings.display.background_color)
+        user_pos = np.array(settings.gameplay.spawn_position, dtype=float)
+        scale = settings.display.pixels_per_unit * self.THUMBNAIL_SCALE * width / settings.display.window_size[0]
+        for shape in settings.shapes:
+            points_2d, edges = GeometryHelper.compute_intersections(shape, user_pos, 0.0)
+            if not edges:
+                continue
+            if shape.get('triangles') is not None:
+                polygons = MeshSlicer.polygons_from_edges(points_2d, edges)
+            else:
+                polygons = [points_2d]
+            color = settings.get_shape_color(shape)
+            for polygon in polygons:
+                pixels = [(int(width / 2 + x * scale), int(height / 2 - z * scale)) for x, z in polygon]
+                if len(pixels) == 2:
+                    pygame.draw.line(surface, color, pixels[0], pixels[1])
+                elif len(pixels) > 2:
+                    pygame.draw.polygon(surface, color, pixels)
+        # The player, at the center like in game
+        pygame.draw.circle(surface, settings.display.user_color, (width // 2, height // 2), 2)
+
+        os.makedirs(self.thumbnail_dir, exist_ok=True)
+        temp_path = thumbnail_path + '.tmp.png'
+        pygame.image.save(surface, temp_path)
+        os.replace(temp_path, thumbnail_path)
@@ -0,0 +1,333 @@
+import hashlib
+import json
+import os
+import threading
+import numpy as np
+from typing import Dict, List, Optional
+from rigid_transform import RigidTransform, ShapeMotion
+
+class LevelCompiler:
+    """
+    Compiles levels/*.json into a binary cache (data/levels/<name>.npz) of flat
+    arrays: vertices, edges and mesh triangles for all shapes with per-shape
+    offsets, bounds, face planes, colors, flags and enemy spawns. The cache is keyed on the
+    source's mtime and content hash and rebuilt when either is stale.
+
+    A level may define 'prototypes' (name -> points, edges, triangles) in local
+    space. Shapes that name a prototype are instances: they store only a
+    transform (position, yaw) and an optional motion, and share its arrays.
+
+    load() returns the same config dict shape as the JSON (settings, shapes,
+    enemies), but with each shape's points and edges as numpy array views.
+    """
+    FORMAT_VERSION = 5
+    # Half thickness given to flat shapes so they still have a closed H-representation
+    SLAB_HALF_THICKNESS = 1e-3
+
+    FLAG_TARGET = 1
+    FLAG_HAS_COLOR = 2
+    FLAG_MESH = 4
+    FLAG_PROTOTYPE = 8
+    FLAG_INSTANCE = 16
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        self.cache_dir = cache_dir or os.path.join(os.getenv('GAME_ROOT'), 'data', 'levels')
+
+    def load(self, source_path: str) -> dict:
+        """Return the level's config, compiling it first if the cache is missing or stale"""
+        cache_path = self._cache_path(source_path)
+        mtime = os.stat(source_path).st_mtime_ns
+        cached = self._read_cache(cache_path)
+        if cached is not None and int(cached['source_mtime']) == mtime:
+            return self._to_config(cached)
+
+        with open(source_path, 'rb') as f:
+            source = f.read()
+        source_hash = hashlib.sha256(source).hexdigest()
+        if cached is None or str(cached['source_hash']) != source_hash:
+            arrays = self.compile(json.loads(source), source_path)
+        else:
+            # Touched but unchanged: keep the compiled arrays, just record the new mtime
+            arrays = dict(cached)
+        arrays['source_mtime'] = np.int64(mtime)
+        arrays['source_hash'] = np.array(source_hash)
+        self._write_cache(cache_path, arrays)
+        return self._to_config(arrays)
+
+    def compile(self, config: dict, source_path: str = "") -> dict:
+        """Validate the level's topology and pack it into arrays"""
+        prototypes = self._validate_shapes(
+            [dict(prototype, name=name) for name, prototype in config.get('prototypes', {}).items()],
+            source_path)
+        prototype_index = {prototype['name']: i for i, prototype in enumerate(prototypes)}
+        shapes = self._validate_shapes(config.get('shapes', []), source_path, prototype_index)
+        # Prototypes are stored first so instances can refer back to them
+        records = prototypes + shapes
+
+        vertex_offsets = np.zeros(len(records) + 1, dtype=np.int64)
+        edge_offsets = np.zeros(len(records) + 1, dtype=np.int64)
+        plane_offsets = np.zeros(len(records) + 1, dtype=np.int64)
+        triangle_offsets = np.zeros(len(records) + 1, dtype=np.int64)
+        vertices, edges, planes, triangles = [], [], [], []
+        bounds = np.zeros((len(records), 2, 3), dtype=float)
+        colors = np.zeros((len(records), 3), dtype=float)
+        flags = np.zeros(len(records), dtype=np.uint8)
+        instance_of = np.full(len(records), -1, dtype=np.int64)
+        transforms = np.zeros((len(records), 4), dtype=float)
+        motions = [''] * len(records)
+
+        for i, shape in enumerate(records):
+            if 'prototype' in shape:
+                # Instances add no geometry, only where the prototype is placed
+                points = np.zeros((0, 3))
+                shape_edges = np.zeros((0, 2), dtype=np.int32)
+                shape_triangles = np.zeros((0, 3), dtype=np.int32)
+                shape_planes = np.zeros((0, 4))
+                instance_of[i] = prototype_index[shape['prototype']]
+                transform = shape.get('transform', {})
+                transforms[i, :3] = transform.get('position', [0.0, 0.0, 0.0])
+                transforms[i, 3] = transform.get('yaw', 0.0)
+                if 'motion' in shape:
+                    motions[i] = json.dumps(shape['motion'])
+                bounds[i] = bounds[instance_of[i]]
+                flags[i] |= self.FLAG_INSTANCE
+            else:
+                points = np.asarray(shape['points'], dtype=float).reshape(-1, 3)
+                shape_edges = np.asarray(shape.get('edges', []), dtype=np.int32).reshape(-1, 2)
+                shape_triangles = np.asarray(shape.get('triangles', []), dtype=np.int32).reshape(-1, 3)
+                # Meshes may be non-convex, so they get no H-representation
+                shape_planes = np.zeros((0, 4)) if 'triangles' in shape else self._face_planes(points, shape_edges)
+                bounds[i] = (points.min(axis=0), points.max(axis=0))
+                if 'triangles' in shape:
+                    flags[i] |= self.FLAG_MESH
+            vertices.append(points)
+            edges.append(shape_edges)
+            planes.append(shape_planes)
+            triangles.append(shape_triangles)
+            triangle_offsets[i + 1] = triangle_offsets[i] + len(shape_triangles)
+            vertex_offsets[i + 1] = vertex_offsets[i] + len(points)
+            edge_offsets[i + 1] = edge_offsets[i] + len(shape_edges)
+            plane_offsets[i + 1] = plane_offsets[i] + len(shape_planes)
+            if i < len(prototypes):
+                flags[i] |= self.FLAG_PROTOTYPE
+            if 'color' in shape:
+                color = shape['color']
+                colors[i] = (color.get('r', 0.0), color.get('g', 0.0), color.get('b', 0.0))
+                flags[i] |= self.FLAG_HAS_COLOR
+            if shape.get('is_target'):
+                flags[i] |= self.FLAG_TARGET
+
+        enemies = config.get('enemies', [])
+        return {
+            'format_version': np.int64(self.FORMAT_VERSION),
+            'settings': np.array(json.dumps(config.get('settings', {}))),
+            'names': np.array([shape.get('name', '') for shape in records], dtype=str),
+            'vertices': np.concatenate(vertices) if vertices else np.zeros((0, 3)),
+            'vertex_offsets': vertex_offsets,
+            'edges': np.concatenate(edges) if edges else np.zeros((0, 2), dtype=np.int32),
+            'edge_offsets': edge_offsets,
+            'planes': np.concatenate(planes) if planes else np.zeros((0, 4)),
+            'plane_offsets': plane_offsets,
+            'triangles': np.concatenate(triangles) if triangles else np.zeros((0, 3), dtype=np.int32),
+            'triangle_offsets': triangle_offsets,
+            'bounds': bounds,
+            'colors': colors,
+            'flags': flags,
+            'instance_of': instance_of,
+            'transforms': transforms,
+            'motions': np.array(motions, dtype=str),
+            'enemy_positions': np.array([enemy['position'] for enemy in enemies], dtype=float).reshape(-1, 3),
+            'enemy_sizes': np.array([enemy.get('size', 1.0) for enemy in enemies], dtype=float),
+            'enemy_speeds': np.array([enemy.get('speed', 0.1) for enemy in enemies], dtype=float),
+        }
+
+    def _validate_shapes(self, shapes: List[dict], source_path: str,
+                         prototypes: Optional[Dict[str, int]] = None) -> List[dict]:
+        """Drop shapes whose topology would break slicing, warning about each one"""
+        valid = []
+        for index, shape in enumerate(shapes):
+            name = shape.get('name', f"#{index}")
+            if 'prototype' in shape:
+                if prototypes is None or shape['prototype'] not in prototypes:
+                    print(f"Warning: Shape {name} in {source_path} uses unknown prototype {shape['prototype']}, skipping it")
+                    continue
+                position = shape.get('transform', {}).get('position', [0.0, 0.0, 0.0])
+                if len(position) != 3:
+                    print(f"Warning: Shape {name} in {source_path} needs a 3D position, skipping it")
+                    continue
+                valid.append(shape)
+                continue
+            points = shape.get('points', [])
+            edges = shape.get('edges', [])
+            if not points or any(len(point) != 3 for point in points):
+                print(f"Warning: Shape {name} in {source_path} needs 3D points, skipping it")
+                continue
+            if any(len(edge) != 2 or not all(0 <= i < len(points) for i in edge) for edge in edges):
+                print(f"Warning: Shape {name} in {source_path} has edges outside its points, skipping it")
+                continue
+            triangles = shape.get('triangles', [])
+            if any(len(triangle) != 3 or not all(0 <= i < len(points) for i in triangle) for triangle in triangles):
+                print(f"Warning: Mesh {name} in {source_path} has triangles outside its points, skipping it")
+                continue
+            if any(len(set(triangle)) != 3 for triangle in triangles):
+                print(f"Warning: Mesh {name} in {source_path} has degenerate triangles")
+            if any(edge[0] == edge[1] for edge in edges):
+                print(f"Warning: Shape {name} in {source_path} has an edge from a point to itself")
+            if len({tuple(sorted(edge)) for edge in edges}) != len(edges):
+                print(f"Warning: Shape {name} in {source_path} has duplicate edges")
+            valid.append(shape)
+        return valid
+
+    @classmethod
+    def _face_planes(cls, points: np.ndarray, edges: np.ndarray) -> np.ndarray:
+        """
+        H-representation of the shape's convex hull: rows (nx, ny, nz, d) with
+        n.p + d <= 0 for points inside. Flat shapes become a thin slab bounded by
+        their outline; lines and points get no planes.
+
+        The viewer draws the hull of where the listed edges cross the plane, which
+        is the hull's cross-section only if every hull edge is listed. Shapes that
+        miss one get no planes, so they keep colliding against their drawn slice.
+        """
+        from scipy.spatial import ConvexHull
+        # Repeated points (e.g. a collapsed corner) are one vertex
+        _, canonical = np.unique(np.round(points, 9), axis=0, return_inverse=True)
+        canonical = canonical.reshape(-1)
+        drawn = {frozenset(edge) for edge in canonical[edges].tolist() if edge[0] != edge[1]}
+        try:
+            hull = ConvexHull(points)
+        except Exception:
+            return cls._slab_planes(points, canonical, drawn)
+        # The hull is triangulated, so coplanar facets repeat the same plane
+        equations = np.round(hull.equations, 9)
+        for facet, neighbors in enumerate(hull.neighbors):
+            for k, neighbor in enumerate(neighbors):
+                if np.allclose(equations[facet], equations[neighbor], atol=1e-7):
+                    continue  # A diagonal of a face, not an edge of the hull
+                a, b = np.delete(hull.simplices[facet], k)
+                if not cls._edge_drawn(points, canonical, drawn, a, b):
+                    return np.zeros((0, 4))
+        return np.unique(equations, axis=0)
+
+    @staticmethod
+    def _edge_drawn(points: np.ndarray, canonical: np.ndarray, drawn: set, a: int, b: int) -> bool:
+        """Whether the listed edges cover the segment a-b, possibly split at points along it"""
+        direction = points[b] - points[a]
+        t = (points - points[a]) @ direction / (direction @ direction)
+        off_line = np.linalg.norm(points - points[a] - np.outer(t, direction), axis=1)
+        on_segment = (off_line < 1e-9) & (t > -1e-9) & (t < 1 + 1e-9)
+        # Walk a to b through the distinct points on the segment
+        stops = []
+        for i in np.flatnonzero(on_segment)[np.argsort(t[on_segment])]:
+            if not stops or canonical[i] != stops[-1]:
+                stops.append(canonical[i])
+        return all(frozenset(pair) in drawn for pair in zip(stops, stops[1:]))
+
+    @classmethod
+    def _slab_planes(cls, points: np.ndarray, canonical: np.ndarray, drawn: set) -> np.ndarray:
+        from scipy.spatial import ConvexHull
+        center = points.mean(axis=0)
+        _, spread, axes = np.linalg.svd(points - center)
+        if len(spread) < 2 or spread[1] < 1e-9:
+            return np.zeros((0, 4))
+        u, v, normal = axes
+        try:
+            hull = ConvexHull((points - center) @ np.stack([u, v]).T)
+        except Exception:
+            return np.zeros((0, 4))
+        if not all(cls._edge_drawn(points, canonical, drawn, *simplex) for simplex in hull.simplices):
+            return np.zeros((0, 4))
+        outline = hull.equations
+        # Lift each 2D outline edge (a, b, c) back to 3D: (a*u + b*v).(p - center) + c <= 0
+        edge_normals = outline[:, :1] * u + outline[:, 1:2] * v
+        edge_planes = np.column_stack([edge_normals, outline[:, 2] - edge_normals @ center])
+        offset = normal @ center
+        slab = np.array([
+            [*normal, -offset - cls.SLAB_HALF_THICKNESS],
+            [*-normal, offset - cls.SLAB_HALF_THICKNESS],
+        ])
+        return np.unique(np.round(np.vstack([edge_planes, slab]), 9), axis=0)
+
+    def _to_config(self, arrays) -> dict:
+        vertex_offsets = arrays['vertex_offsets']
+        edge_offsets = arrays['edge_offsets']
+        plane_offsets = arrays['plane_offsets']
+        triangle_offsets = arrays['triangle_offsets']
+        vertices, edges, planes = arrays['vertices'], arrays['edges'], arrays['planes']
+        records, shapes = [], []
+        for i, name in enumerate(arrays['names']):
+            flags = int(arrays['flags'][i])
+            if flags & self.FLAG_INSTANCE:
+                prototype = records[arrays['instance_of'][i]]
+                transform = RigidTransform(arrays['transforms'][i, :3].copy(), float(arrays['transforms'][i, 3]))
+                # Shares the prototype's arrays; slicing moves the plane into its frame instead
+                shape = {
+                    'name': str(name),
+                    'prototype': prototype,
+                    'points': prototype['points'],
+                    'edges': prototype['edges'],
+                    'planes': prototype['planes'],
+                    'bounds': prototype['bounds'],
+                    'transform': transform,
+                }
+                if 'triangles' in prototype:
+                    shape['triangles'] = prototype['triangles']
+                motion = str(arrays['motions'][i])
+                if motion:
+                    shape['motion'] = ShapeMotion.from_dict(json.loads(motion), transform)
+            else:
+                shape = {
+                    'name': str(name),
+                    'points': vertices[vertex_offsets[i]:vertex_offsets[i + 1]],
+                    'edges': edges[edge_offsets[i]:edge_offsets[i + 1]],
+                    'planes': planes[plane_offsets[i]:plane_offsets[i + 1]],
+                    'bounds': arrays['bounds'][i],
+                }
+                if flags & self.FLAG_MESH:
+                    shape['triangles'] = arrays['triangles'][triangle_offsets[i]:triangle_offsets[i + 1]]
+            if flags & self.FLAG_HAS_COLOR:
+                r, g, b = arrays['colors'][i]
+                shape['color'] = {'r': float(r), 'g': float(g), 'b': float(b)}
+            if flags & self.FLAG_TARGET:
+                shape['is_target'] = True
+            records.append(shape)
+            if not flags & self.FLAG_PROTOTYPE:
+                shapes.append(shape)
+
+        enemies = [{'position': position.tolist(), 'size': float(size), 'speed': float(speed)}
+                   for position, size, speed in zip(arrays['enemy_positions'],
+                                                    arrays['enemy_sizes'], arrays['enemy_speeds'])]
+        return {
+            'settings': json.loads(str(arrays['settings'])),
+            'shapes': shapes,
+            'enemies': enemies,
+        }
+
+    def _cache_path(self, source_path: str) -> str:
+        name = os.path.splitext(os.path.basename(source_path))[0]
+        return os.path.join(self.cache_dir, f"{name}.npz")
+
+    def _read_cache(self, cache_path: str) -> Optional[dict]:
+        if not os.path.exists(cache_path):
+            return None
+        try:
+            # Uncompressed, so each array is read straight out of the file
+            with np.load(cache_path, allow_pickle=False) as data:
+                if int(data['format_version']) != self.FORMAT_VERSION:
+                    return None
+                return {name: data[name] for name in data.files}
+        except Exception as e:
+            print(f"Warning: Ignoring unreadable level cache {cache_path}: {str(e)}")
+            return None
+
+    def _write_cache(self, cache_path: str, arrays: dict):
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # Per thread, since the level loader and the level catalog may compile the same level
+            temp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(temp_path, 'wb') as f:
+                np.savez(f, **arrays)
+            # Replace atomically so a crash never leaves a half-written cache
+            os.replace(temp_path, cache_path)
+        except OSError as e:
+            print(f"Warning: Could not write level cache {cache_path}: {str(e)}")
@@ -0,0 +1,99 @@
+import os
+import json
+import numpy as np
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+from settings import Settings
+from level_compiler import LevelCompiler
+from chunk_streamer import ChunkStreamer
+from level_manager import LevelManager
+from geometry import GeometryHelper
+
+@dataclass
+class SpawnSlice:
+    """The level shapes sliced at the spawn point, ready for the viewer's first frame"""
+    pose: tuple
+    coords_2d: List[List[Tuple[float, float]]]
+    edges: List[List[Tuple[int, int]]]
+
+@dataclass
+class LoadedLevel:
+    level: int
+    settings: Settings
+    spawn_slice: SpawnSlice
+    # Set for chunked levels; settings.shapes then holds only the resident chunks
+    streamer: Optional[ChunkStreamer] = None
+
+class LevelLoader:
+    """
+    Loads levels on a worker thread: reads the compiled level (compiling and
+    validating it if the cache is stale), then slices the shapes at the spawn
+    point. While level N is played, level N+1 is prefetched so the next level
+    starts without a parse or slicing stall.
+    """
+    def __init__(self, level_manager: LevelManager):
+        self.level_manager = level_manager
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.pending: Dict[int, Future] = {}
+        self.compiler = LevelCompiler()
+        # The menus list the levels, so scan the folder before they open
+        self.executor.submit(level_manager.list_levels)
+
+    def prefetch(self, level: int):
+        if level not in self.pending:
+            self.pending[level] = self.executor.submit(self._load, level)
+
+    def get(self, level: int) -> LoadedLevel:
+        """Return a level, waiting for its prefetch or loading it now if there was none"""
+        future = self.pending.pop(level, None)
+        if future is None:
+            return self._load(level)
+        return future.result()
+
+    def shutdown(self):
+        for future in self.pending.values():
+            future.cancel()
+        self.executor.shutdown(wait=False)
+
+    def _load(self, level: int) -> LoadedLevel:
+        config_path = self.level_manager.get_level_path(level)
+        if os.path.isdir(config_path):
+            return self._load_chunked(level, config_path)
+        try:
+            config_data = self.compiler.load(config_path)
+        except Exception as e:
+            # Settings reports the error itself and falls back to its default level
+            print(f"Warning: Could not compile {config_path}: {str(e)}")
+            config_data = None
+        settings = Settings(config_path, config_data)
+        return LoadedLevel(level, settings, self._slice_spawn(settings))
+
+    def _load_chunked(self, level: int, level_dir: str) -> LoadedLevel:
+        """Load the chunks around the spawn point; the viewer streams the rest"""
+        with open(os.path.join(level_dir, ChunkStreamer.LEVEL_FILE), 'r') as f:
+            level_data = json.load(f)
+        settings = Settings(level_dir, {'settings': level_data.get('settings', {}), 'shapes': [], 'enemies': []})
+        streamer = ChunkStreamer(level_dir, settings.config_data['settings'].get('streaming', {}),
+                                 os.path.join(self.compiler.cache_dir, str(level)))
+        streamer.update(settings.gameplay.spawn_position, wait=True)
+        settings.shapes = streamer.shapes
+        settings.enemies = streamer.take_new_enemies()
+        return LoadedLevel(level, settings, self._slice_spawn(settings), streamer)
+
+    def _slice_spawn(self, settings: Settings) -> SpawnSlice:
+        # Same pose the viewer starts at: the spawn point with the plane unrotated
+        user_pos = np.array(settings.gameplay.spawn_position, dtype=float)
+        plane_angle = 0.0
+        coords_2d = []
+        edges = []
+        for shape in settings.shapes:
+            if 'motion' in shape:
+                # The viewer slices moving shapes itself, every frame
+                coords_2d.append([])
+                edges.append([])
+                continue
+            points_2d, shape_edges = GeometryHelper.compute_intersections(shape, user_pos, plane_angle)
+            coords_2d.append(points_2d)
+            edges.append(shape_edges)
+        return SpawnSlice((tuple(user_pos), plane_angle), coords_2d, edges)
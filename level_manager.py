@@ -1,5 +1,6 @@
 import os
 from enum import Enum, auto
+from typing import List, Optional
 
 class GameState(Enum):
     MAIN_MENU = auto()
@@ -13,14 +14,34 @@ class LevelManager:
     def __init__(self, start_level=None):
         self.current_level = start_level
         self.level_folder = os.path.join(os.getenv('GAME_ROOT'), 'levels')
+        self.levels: Optional[List[str]] = None
+
+    def list_levels(self) -> List[str]:
+        """Level names in play order. The folder is scanned once and then cached."""
+        if self.levels is None:
+            levels = []
+            for filename in os.listdir(self.level_folder):
+                if filename.endswith('.json'):
+                    levels.append(filename[:-len('.json')])
+                elif os.path.exists(os.path.join(self.level_folder, filename, 'level.json')):
+                    # Chunked level folder (see ChunkStreamer)
+                    levels.append(filename)
+            levels.sort(key=lambda x: int(x))
+            self.levels = levels
+        return self.levels
+
+    def get_level_path(self, level: int) -> str:
+        """Path of the level's JSON file, or of its folder for a chunked level"""
+        chunked_path = os.path.join(self.level_folder, str(level))
+        if os.path.isdir(chunked_path):
+            return chunked_path
+        return os.path.join(self.level_folder, f"{level}.json")
 
     def get_current_level_path(self) -> str:
-        return os.path.join(self.level_folder, f"{self.current_level}.json")
+        return self.get_level_path(self.current_level)
 
     def advance_level(self):
         self.current_level += 1
 
     def has_next_level(self) -> bool:
-        next_level = self.current_level + 1
-        next_level_path = os.path.join(self.level_folder, f"{next_level}.json")
-        return os.path.exists(next_level_path)
\ No newline at end of file
+        return str(self.current_level + 1) in self.list_levels()
\ No newline at end of file
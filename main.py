@@ -1,66 +1,123 @@
+import time
+LAUNCH_TIME = time.perf_counter()
+
 import sys
+import json
 import pygame
 from level_manager import LevelManager
-from settings import Settings
-from viewer import GameViewer
+from level_loader import LevelLoader
+from level_catalog import LevelCatalog
 from menu_manager import MenuManager
 from asset_manager import AssetManager
 from high_score_manager import HighScoreManager
 from options_manager import OptionsManager
+from screen_helper import ScreenHelper
+from startup_timer import StartupTimer
+from event_helper import EventHelper
 import os
+# viewer and renderer (numpy, scipy) are imported when the first level starts
+
+def load_dev_env():
+    """Load .env for development runs. Frozen builds get GAME_ROOT from run.bat."""
+    if getattr(sys, 'frozen', False):
+        return
+    try:
+        from dotenv import load_dotenv
+    except ImportError:
+        return
+    load_dotenv()
 
-from dotenv import load_dotenv
-# Only used for dev, not needed for prod
-load_dotenv()
+def show_loading_splash(assets: AssetManager):
+    """Draw a progress bar until everything the menus need has loaded"""
+    screen = pygame.display.get_surface()
+    clock = pygame.time.Clock()
+    # The font is small and first in the manifest, so this wait is short
+    label = assets.text.render('pixel_24', "Loading...", (255, 255, 255))
+    while (progress := assets.load_progress(AssetManager.MENU_ASSETS)) < 1.0:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                sys.exit()
+        width, height = screen.get_size()
+        bar = pygame.Rect(width // 4, height // 2 + 20, width // 2, 16)
+        screen.fill((0, 0, 0))
+        screen.blit(label, label.get_rect(center=(width // 2, height // 2 - 20)))
+        pygame.draw.rect(screen, (255, 255, 255), bar, 1)
+        pygame.draw.rect(screen, (255, 255, 255), (bar.x, bar.y, int(bar.width * progress), bar.height))
+        pygame.display.flip()
+        clock.tick(30)
+    assets.wait_for(AssetManager.MENU_ASSETS)
 
 def main():
-    pygame.init()
-    # Store original window size
-    windowed_size = (800, 600)
-    screen = pygame.display.set_mode(windowed_size, pygame.RESIZABLE)
-    icon_path = os.path.join(os.getenv('GAME_ROOT'), 'assets', 'art', 'icon.png')
-    icon = pygame.image.load(icon_path)
-    pygame.display.set_icon(icon)
-    pygame.display.set_caption("Rotander")
-    
-    is_fullscreen = False
+    startup = StartupTimer(LAUNCH_TIME)
+    startup.record('imports', LAUNCH_TIME)
+    load_dev_env()
 
-    def toggle_fullscreen():
-        nonlocal screen, is_fullscreen
-        if is_fullscreen:
-            screen = pygame.display.set_mode(windowed_size, pygame.RESIZABLE)
-            is_fullscreen = False
-        else:
-            screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
-            is_fullscreen = True
-    
+    with startup.phase('window'):
+        pygame.init()
+        # The window lives for the whole session; levels reuse it
+        display = ScreenHelper((800, 600))
+        display.open()
+        pygame.display.set_caption("Rotander")
 
-    assets = AssetManager()
+    with startup.phase('assets'):
+        assets = AssetManager()
+        icon = assets.open_asset('art/icon.png')
+        if icon is not None:
+            pygame.display.set_icon(pygame.image.load(icon, 'icon.png'))
+        show_loading_splash(assets)
     options_manager = OptionsManager()
     assets.set_options_manager(options_manager)
-    assets.play_menu_music()
     level_manager = LevelManager()
+    level_loader = LevelLoader(level_manager)
+    # Rescans changed levels and renders their thumbnails in the background
+    level_catalog = LevelCatalog(level_manager)
+    level_catalog.refresh()
     high_score_manager = HighScoreManager()
+    renderer = None
     running = True
     username = ""
     total_score = 0
 
     while running:
         if level_manager.current_level is None:
-            menu = MenuManager(level_manager, assets, high_score_manager, options_manager)
+            assets.play_menu_music()
+            menu = MenuManager(level_manager, assets, high_score_manager, options_manager, catalog=level_catalog)
+            startup.milestone('time to menu')
+            if os.getenv('STARTUP_BENCHMARK'):
+                # Used by startup_benchmark.py: report and quit instead of showing the menu
+                print("STARTUP " + json.dumps(startup.as_dict()))
+                pygame.quit()
+                return
             selected_option = menu.run()
             username = menu.username
-            if selected_option == 'Start Game':
-                level_manager.current_level = 1
+            if selected_option in ('Start Game', 'Select Level'):
+                level_manager.current_level = menu.start_level
+                high_score_manager.start_run()
             elif selected_option == 'Exit':
                 running = False
                 continue
 
-        level_path = level_manager.get_current_level_path()
         try:
-            settings = Settings(config_path=level_path)
-            settings.display.window_size = pygame.display.get_surface().get_size()
-            viewer = GameViewer(settings, level_manager, assets, username, high_score_manager, total_score, options_manager)
+            with startup.phase('game imports'):
+                from viewer import GameViewer
+                from renderer import Renderer
+            with startup.phase('level parse'):
+                level = level_loader.get(level_manager.current_level)
+            settings = level.settings
+            began = time.perf_counter()
+            if renderer is None:
+                renderer = Renderer(settings, assets, display)
+            viewer = GameViewer(settings, level_manager, assets, username, high_score_manager, total_score, options_manager, renderer, level.spawn_slice, level.streamer)
+            # Load and slice the next level while this one is played
+            if level_manager.has_next_level():
+                level_loader.prefetch(level_manager.current_level + 1)
+            if 'first frame' not in startup.phases:
+                def on_first_frame():
+                    startup.record('first frame', began)
+                    startup.milestone('time to play')
+                    startup.print_report()
+                viewer.on_first_frame = on_first_frame
             viewer.run()
             total_score += viewer.points
 
@@ -68,21 +125,22 @@ def main():
                 level_manager.current_level = None
                 total_score = 0
             elif viewer.level_complete:
+                high_score_manager.record_level(level_manager.current_level, viewer.points, viewer.level_time)
                 if level_manager.has_next_level():
                     level_manager.advance_level()
                 else:
                     # Ultimate Victory!
                     assets.stop_music()
                     assets.play_sound('victory')
-                    current_high_score = high_score_manager.high_scores.get(username, 0)
+                    current_high_score = high_score_manager.get_best_score(username)
                     is_high_score = total_score > current_high_score
                     viewer.renderer.render_ultimate_victory_message(total_score, is_high_score)
-                    high_score_manager.add_score(username, total_score)
+                    high_score_manager.add_score(username, total_score, completed=True)
                     
                     # Wait for space key
                     waiting = True
                     while waiting:
-                        for event in pygame.event.get():
+                        for event in EventHelper.wait_events():
                             if event.type == pygame.QUIT:
                                 pygame.quit()
                                 sys.exit()
@@ -90,9 +148,9 @@ def main():
                                 if event.key in (pygame.K_SPACE, pygame.K_RETURN):
                                     waiting = False
                                 if event.key == pygame.K_F11 or (event.key == pygame.K_RETURN and event.mod & pygame.KMOD_ALT):
-                                    toggle_fullscreen()
-                    
-                        pygame.time.Clock().tick(30)
+                                    renderer.toggle_fullscreen()
+                                    # The new window is blank; draw the message again
+                                    renderer.render_ultimate_victory_message(total_score, is_high_score)
                         
                     level_manager.current_level = None
                     total_score = 0
@@ -103,6 +161,8 @@ def main():
             print(f"Error: {e}", file=sys.stderr)
             running = False
 
+    level_loader.shutdown()
+    level_catalog.shutdown()
     high_score_manager.save_high_scores()
     pygame.quit()
     sys.exit()
@@ -5,18 +5,27 @@ from level_manager import LevelManager
 from high_score_manager import HighScoreManager
 from options_manager import OptionsManager
 from settings import MovementSettings
-import os
+from event_helper import EventHelper
+from level_catalog import LevelCatalog
 import math
 import sys
+import time
 
 class MenuManager:
-    def __init__(self, level_manager: LevelManager, assets: AssetManager, high_score_manager: HighScoreManager, options_manager: OptionsManager, in_game=False):
+    # The main menu character is the only animation; other screens redraw only on input
+    ANIMATION_FPS = 30
+    # Thumbnails per row on the level select screen
+    LEVEL_COLUMNS = 3
+    # Rows per page on the high scores screen
+    HIGH_SCORES_PER_PAGE = 5
+
+    def __init__(self, level_manager: LevelManager, assets: AssetManager, high_score_manager: HighScoreManager, options_manager: OptionsManager, in_game=False, catalog: LevelCatalog = None):
         self.level_manager = level_manager
+        self.catalog = catalog
         self.high_score_manager = high_score_manager
         self.options_manager = options_manager
         self.assets = assets
         self.in_game = in_game
-        self.screen = pygame.display.get_surface()
         self.sm_font = self.assets.get_font('pixel_16')
         self.font = self.assets.get_font('pixel_24')
         self.title_font = self.assets.get_font('pixel_64')
@@ -24,6 +33,10 @@ class MenuManager:
             self.options = ['Resume', 'Return to Main Menu']
         else:
             self.options = ['Start Game', 'Options', 'Read This', 'High Scores', 'Exit']
+            if catalog is not None:
+                self.options.insert(1, 'Select Level')
+        # Level to play from, set by the level select screen
+        self.start_level = 1
         self.selected_index = 0
         self.running = True
         self.resume_game = False
@@ -38,23 +51,35 @@ class MenuManager:
         self.menu_start_y = 300      # Moved up
         self.is_jumping = False      # Track jump state
 
+        # Main menu text, rendered once per selection and screen size
+        self.background = None
+        self.background_key = None
+        self.sprite_rect = None
+
+
+    @property
+    def screen(self) -> pygame.Surface:
+        # Looked up each time so the menu follows fullscreen toggles
+        return pygame.display.get_surface()
 
     def run_pause_menu(self):
         self.assets.play_menu_music()
         self.resume_game = False
         self.return_to_main = False
         self.running = True  # Reset running state
-        clock = pygame.time.Clock()
+        redraw = True
         while self.running:
-            self._handle_pause_events()
-            self._render_pause_menu()
-            pygame.display.flip()
-            clock.tick(60)
+            if redraw:
+                self._render_pause_menu()
+                pygame.display.flip()
+            events = EventHelper.wait_events()
+            redraw = EventHelper.needs_redraw(events)
+            self._handle_pause_events(events)
         if self.resume_game:
             self.assets.play_game_music()
 
-    def _handle_pause_events(self):
-        for event in pygame.event.get():
+    def _handle_pause_events(self, events: List[pygame.event.Event]):
+        for event in events:
             if event.type == pygame.QUIT:
                 self.running = False
                 pygame.quit()
@@ -78,31 +103,39 @@ class MenuManager:
                     self.running = False
 
     def _load_levels(self) -> List[str]:
-        levels = []
-        level_folder = self.level_manager.level_folder
-        for filename in os.listdir(level_folder):
-            if filename.endswith('.json'):
-                levels.append(filename.replace('.json', ''))
-        levels.sort(key=lambda x: int(x))
-        return levels
+        # Scanned once per session (and prefetched by the level loader at startup)
+        return self.level_manager.list_levels()
 
     def run(self) -> str:
-        clock = pygame.time.Clock()
         if not self.in_game:
-            self.username = self._get_username(clock)
-            self._main_menu(clock)  # Add main menu after username
+            self.username = self._get_username()
+            self._main_menu()  # Add main menu after username
+        redraw = True
         while self.running:
-            self._handle_events()
-            self._render()
-            pygame.display.flip()
-            clock.tick(60)
+            if redraw:
+                self._render()
+                pygame.display.flip()
+            events = EventHelper.wait_events()
+            redraw = EventHelper.needs_redraw(events)
+            self._handle_events(events)
         self.assets.play_game_music()
         return self.options[self.selected_index]  # Removed int() cast
     
 
-    def _main_menu(self, clock: pygame.time.Clock):
+    def _main_menu(self):
+        """
+        Sleeps between animation frames. Input redraws the whole menu; otherwise
+        only the bouncing character is redrawn, over the cached menu text.
+        """
+        frame_ms = 1000 // self.ANIMATION_FPS
+        self._render_main_menu()
+        next_frame = pygame.time.get_ticks() + frame_ms
         while self.running:
-            for event in pygame.event.get():
+            # Nothing animates while the window is minimized
+            animating = pygame.display.get_active()
+            timeout = next_frame - pygame.time.get_ticks() if animating else EventHelper.IDLE_TIMEOUT_MS
+            events = EventHelper.wait_events(timeout)
+            for event in events:
                 if event.type == pygame.QUIT:
                     self.running = False
                     pygame.quit()
@@ -118,6 +151,9 @@ class MenuManager:
                         self.assets.play_sound('select')
                         if self.options[self.selected_index] == 'Start Game':
                             self.running = False
+                        elif self.options[self.selected_index] == 'Select Level':
+                            if self._show_level_select():
+                                self.running = False
                         elif self.options[self.selected_index] == 'Read This':
                             self._show_instructions()
                         elif self.options[self.selected_index] == 'Options':
@@ -128,8 +164,87 @@ class MenuManager:
                             pygame.quit()
                             sys.exit()
 
-            self._render_main_menu()
-            clock.tick(60)
+            if not self.running:
+                break
+            if EventHelper.needs_redraw(events):
+                # Also covers returning from a sub-screen, which drew over everything
+                self._render_main_menu()
+            elif animating and pygame.time.get_ticks() >= next_frame:
+                self._animate_main_menu()
+            else:
+                continue
+            next_frame = pygame.time.get_ticks() + frame_ms
+
+    def _show_level_select(self) -> bool:
+        """
+        Thumbnail grid of the level catalog. Returns True once a level is
+        picked (see start_level). Thumbnails still rendering are drawn as soon
+        as the catalog has them.
+        """
+        selected = 0
+        redraw = True
+        while True:
+            entries = self.catalog.get_entries()
+            if redraw:
+                self._render_level_select(entries, selected)
+                pygame.display.flip()
+            # Wake up often while thumbnails are still being rendered
+            timeout = 100 if self.catalog.pending else EventHelper.IDLE_TIMEOUT_MS
+            events = EventHelper.wait_events(timeout)
+            redraw = EventHelper.needs_redraw(events) or self.catalog.collect()
+            for event in events:
+                if event.type == pygame.QUIT:
+                    pygame.quit()
+                    sys.exit()
+                elif event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_ESCAPE:
+                        self.assets.play_sound('select')
+                        return False
+                    elif event.key in (pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_DOWN) and entries:
+                        step = {pygame.K_LEFT: -1, pygame.K_RIGHT: 1,
+                                pygame.K_UP: -self.LEVEL_COLUMNS, pygame.K_DOWN: self.LEVEL_COLUMNS}[event.key]
+                        selected = max(0, min(len(entries) - 1, selected + step))
+                        self.assets.play_sound('highlight')
+                    elif event.key in (pygame.K_RETURN, pygame.K_SPACE) and entries:
+                        self.assets.play_sound('select')
+                        self.start_level = int(entries[min(selected, len(entries) - 1)].level)
+                        return True
+
+    def _render_level_select(self, entries: list, selected: int):
+        self.screen.fill((0, 0, 0))
+        title = self.assets.text.render('pixel_64', "Select Level", (255, 215, 0))
+        title_rect = title.get_rect(center=(self.screen.get_width() // 2, 80))
+        self.screen.blit(title, title_rect)
+
+        thumb_width, thumb_height = LevelCatalog.THUMBNAIL_SIZE
+        cell_width, cell_height = thumb_width + 40, thumb_height + 60
+        visible_rows = max(1, (self.screen.get_height() - 230) // cell_height)
+        # Scroll so the selected row stays on screen
+        first_row = max(0, selected // self.LEVEL_COLUMNS - visible_rows + 1)
+        left = self.screen.get_width() // 2 - cell_width * self.LEVEL_COLUMNS // 2
+        for i, entry in enumerate(entries):
+            row, column = divmod(i, self.LEVEL_COLUMNS)
+            if not first_row <= row < first_row + visible_rows:
+                continue
+            x = left + column * cell_width + 20
+            y = 150 + (row - first_row) * cell_height
+            thumbnail = self.catalog.get_thumbnail(entry.level)
+            if thumbnail is not None:
+                self.screen.blit(thumbnail, (x, y))
+            else:
+                pygame.draw.rect(self.screen, (60, 60, 60), (x, y, thumb_width, thumb_height))
+            color = (255, 215, 0) if i == selected else (100, 100, 100)
+            pygame.draw.rect(self.screen, color, (x - 2, y - 2, thumb_width + 4, thumb_height + 4), 2)
+
+            name = self.assets.text.render('pixel_16', entry.name, (255, 215, 0) if i == selected else (255, 255, 255))
+            self.screen.blit(name, name.get_rect(midtop=(x + thumb_width // 2, y + thumb_height + 6)))
+            counts = self.assets.text.render(
+                'pixel_8', f"{entry.shape_count} shapes, {entry.enemy_count} enemies", (150, 150, 150))
+            self.screen.blit(counts, counts.get_rect(midtop=(x + thumb_width // 2, y + thumb_height + 26)))
+
+        back_text = self.assets.text.render('pixel_16', "ENTER to play, ESC to return", (100, 100, 100))
+        back_rect = back_text.get_rect(center=(self.screen.get_width() // 2, self.screen.get_height() - 40))
+        self.screen.blit(back_text, back_rect)
 
     def _show_options(self):
         waiting = True
@@ -140,8 +255,14 @@ class MenuManager:
             'Sound Effects',
             'Back'
         ]
+        redraw = True
         while waiting:
-            for event in pygame.event.get():
+            if redraw:
+                self._render_options(options_list, selected_option)
+                pygame.display.flip()
+            events = EventHelper.wait_events()
+            redraw = EventHelper.needs_redraw(events)
+            for event in events:
                 if event.type == pygame.QUIT:
                     pygame.quit()
                     sys.exit()
@@ -161,57 +282,56 @@ class MenuManager:
                     elif event.key == pygame.K_RETURN and options_list[selected_option] == 'Back':
                         waiting = False
 
-            self.screen.fill((0, 0, 0))
-            
-            # Title
-            title = self.title_font.render("Options", True, (255, 215, 0))
-            title_rect = title.get_rect(center=(self.screen.get_width() // 2, 80))
-            self.screen.blit(title, title_rect)
-            
-            y_pos = 180
-            for i, option in enumerate(options_list):
-                # Option name
-                color = (255, 215, 0) if i == selected_option else (255, 255, 255)
-                text = self.sm_font.render(option, True, color)
-                text_rect = text.get_rect(x=self.screen.get_width() // 4, centery=y_pos)
-                self.screen.blit(text, text_rect)
-                
-                # Value bar for adjustable options
-                if option != 'Back':
-                    value = self._get_option_value(option)
-                    bar_width = 200
-                    bar_height = 20
-                    bar_x = self.screen.get_width() * 3 // 4 - bar_width // 2
-                    bar_y = y_pos - bar_height // 2
-                    
-                    # Background bar
-                    pygame.draw.rect(self.screen, (100, 100, 100), 
-                                   (bar_x, bar_y, bar_width, bar_height))
-                    
-                    # Value bar
-                    value_width = int(bar_width * value)
-                    pygame.draw.rect(self.screen, color,
-                                   (bar_x, bar_y, value_width, bar_height))
-                    
-                    # Value text
-                    value_text = f"{int(value * 100)}%"
-                    text = self.sm_font.render(value_text, True, (255, 255, 255))
-                    text_rect = text.get_rect(midleft=(bar_x + bar_width + 10, y_pos))
-                    self.screen.blit(text, text_rect)
-                
-                y_pos += 50
-            
-            # Instructions
-            instructions = self.sm_font.render("← → to adjust, ESC to save & return", True, (100, 100, 100))
-            instructions_rect = instructions.get_rect(center=(self.screen.get_width() // 2, self.screen.get_height() - 40))
-            self.screen.blit(instructions, instructions_rect)
-            
-            pygame.display.flip()
-        
         # Save options when leaving menu
         self.options_manager.save_options()
         self.options_manager.apply_volume_settings(self.assets)
 
+    def _render_options(self, options_list: List[str], selected_option: int):
+        self.screen.fill((0, 0, 0))
+
+        # Title
+        title = self.assets.text.render('pixel_64', "Options", (255, 215, 0))
+        title_rect = title.get_rect(center=(self.screen.get_width() // 2, 80))
+        self.screen.blit(title, title_rect)
+
+        y_pos = 180
+        for i, option in enumerate(options_list):
+            # Option name
+            color = (255, 215, 0) if i == selected_option else (255, 255, 255)
+            text = self.assets.text.render('pixel_16', option, color)
+            text_rect = text.get_rect(x=self.screen.get_width() // 4, centery=y_pos)
+            self.screen.blit(text, text_rect)
+
+            # Value bar for adjustable options
+            if option != 'Back':
+                value = self._get_option_value(option)
+                bar_width = 200
+                bar_height = 20
+                bar_x = self.screen.get_width() * 3 // 4 - bar_width // 2
+                bar_y = y_pos - bar_height // 2
+
+                # Background bar
+                pygame.draw.rect(self.screen, (100, 100, 100), 
+                               (bar_x, bar_y, bar_width, bar_height))
+
+                # Value bar
+                value_width = int(bar_width * value)
+                pygame.draw.rect(self.screen, color,
+                               (bar_x, bar_y, value_width, bar_height))
+
+                # Value text
+                value_text = f"{int(value * 100)}%"
+                text = self.assets.text.render('pixel_16', value_text, (255, 255, 255))
+                text_rect = text.get_rect(midleft=(bar_x + bar_width + 10, y_pos))
+                self.screen.blit(text, text_rect)
+
+            y_pos += 50
+
+        # Instructions
+        instructions = self.assets.text.render('pixel_16', "← → to adjust, ESC to save & return", (100, 100, 100))
+        instructions_rect = instructions.get_rect(center=(self.screen.get_width() // 2, self.screen.get_height() - 40))
+        self.screen.blit(instructions, instructions_rect)
+
     def _adjust_option(self, selected_option, direction):
         option_name = ['Master Volume', 'Music Volume', 'Sound Effects',
                       'Rotate Speed', 'Gravity', 'Jump Power'][selected_option]
@@ -262,8 +382,14 @@ class MenuManager:
     def _show_instructions(self):
         waiting = True
         current_page = 1
+        redraw = True
         while waiting:
-            for event in pygame.event.get():
+            if redraw:
+                self._render_instructions(current_page)
+                pygame.display.flip()
+            events = EventHelper.wait_events()
+            redraw = EventHelper.needs_redraw(events)
+            for event in events:
                 if event.type == pygame.QUIT:
                     pygame.quit()
                     sys.exit()
@@ -278,84 +404,106 @@ class MenuManager:
                         else:
                             waiting = False
 
-            self.screen.fill((0, 0, 0))
-            
-            if current_page == 1:
-                # Title
-                title = self.title_font.render("The Story", True, (255, 215, 0))
-                title_rect = title.get_rect(center=(self.screen.get_width() // 2, 80))
-                self.screen.blit(title, title_rect)
-                
-                # Scenario
-                story = [
-                    "You are a lost 2D explorer in a 3D world,",
-                    "stranded far from your home.",
-                    "",
-                    "Your mission is to reach the golden targets",
-                    "while navigating through increasingly difficult",
-                    "geometric landscapes that rotate at your command.",
-                    "",
-                    "But beware! Your energy depletes with time,",
-                    "and each jump brings you closer to exhaustion.",
-                    "Enemies will also attempt to thwart your progress.",
-                    "",
-                    "Can you master the art of dimensional rotation",
-                    "& complete your mission before your energy fades?"
-                ]
-                
-                y_pos = 160
-                for line in story:
-                    text = self.sm_font.render(line, True, (255, 255, 255))
-                    text_rect = text.get_rect(center=(self.screen.get_width() // 2, y_pos))
-                    self.screen.blit(text, text_rect)
-                    y_pos += 30
-                
-                # Next page instruction
-                next_text = self.sm_font.render("Press SPACE/ENTER for controls", True, (100, 100, 100))
-                next_rect = next_text.get_rect(center=(self.screen.get_width() // 2, self.screen.get_height() - 50))
-                self.screen.blit(next_text, next_rect)
-            
-            else:  # Page 2
-                # Title
-                title = self.title_font.render("How to Play", True, (255, 215, 0))
-                title_rect = title.get_rect(center=(self.screen.get_width() // 2, 80))
-                self.screen.blit(title, title_rect)
-                
-                # Instructions
-                instructions = [
-                    "Controls:",
-                    "A/D - Move left/right",
-                    "SPACE/W - Jump",
-                    "Mouse Wheel - Rotate plane about player",
-                    "ESC - Pause game",
-                    "",
-                    "Gameplay:",
-                    "- Reach the golden target to complete levels",
-                    "- Don't fall off or run out of points",
-                    "- Jumping costs points",
-                    "- Points decrease over time",
-                    "- Falling & enemies causes point penalty",
-                    "- Complete all levels for ultimate victory!",
-                ]
-                
-                y_pos = 160
-                for line in instructions:
-                    text = self.sm_font.render(line, True, (255, 255, 255))
-                    text_rect = text.get_rect(center=(self.screen.get_width() // 2, y_pos))
-                    self.screen.blit(text, text_rect)
-                    y_pos += 30
-                
-                # Back instruction
-                back_text = self.sm_font.render("Press ESC/SPACE/ENTER to return", True, (100, 100, 100))
-                back_rect = back_text.get_rect(center=(self.screen.get_width() // 2, self.screen.get_height() - 50))
-                self.screen.blit(back_text, back_rect)
-            
-            pygame.display.flip()
+    def _render_instructions(self, current_page: int):
+        self.screen.fill((0, 0, 0))
+
+        if current_page == 1:
+            # Title
+            title = self.assets.text.render('pixel_64', "The Story", (255, 215, 0))
+            title_rect = title.get_rect(center=(self.screen.get_width() // 2, 80))
+            self.screen.blit(title, title_rect)
+
+            # Scenario
+            story = [
+                "You are a lost 2D explorer in a 3D world,",
+                "stranded far from your home.",
+                "",
+                "Your mission is to reach the golden targets",
+                "while navigating through increasingly difficult",
+                "geometric landscapes that rotate at your command.",
+                "",
+                "But beware! Your energy depletes with time,",
+                "and each jump brings you closer to exhaustion.",
+                "Enemies will also attempt to thwart your progress.",
+                "",
+                "Can you master the art of dimensional rotation",
+                "& complete your mission before your energy fades?"
+            ]
+
+            y_pos = 160
+            for line in story:
+                text = self.assets.text.render('pixel_16', line, (255, 255, 255))
+                text_rect = text.get_rect(center=(self.screen.get_width() // 2, y_pos))
+                self.screen.blit(text, text_rect)
+                y_pos += 30
+
+            # Next page instruction
+            next_text = self.assets.text.render('pixel_16', "Press SPACE/ENTER for controls", (100, 100, 100))
+            next_rect = next_text.get_rect(center=(self.screen.get_width() // 2, self.screen.get_height() - 50))
+            self.screen.blit(next_text, next_rect)
+
+        else:  # Page 2
+            # Title
+            title = self.assets.text.render('pixel_64', "How to Play", (255, 215, 0))
+            title_rect = title.get_rect(center=(self.screen.get_width() // 2, 80))
+            self.screen.blit(title, title_rect)
+
+            # Instructions
+            instructions = [
+                "Controls:",
+                "A/D - Move left/right",
+                "SPACE/W - Jump",
+                "Mouse Wheel - Rotate plane about player",
+                "ESC - Pause game",
+                "",
+                "Gameplay:",
+                "- Reach the golden target to complete levels",
+                "- Don't fall off or run out of points",
+                "- Jumping costs points",
+                "- Points decrease over time",
+                "- Falling & enemies causes point penalty",
+                "- Complete all levels for ultimate victory!",
+            ]
+
+            y_pos = 160
+            for line in instructions:
+                text = self.assets.text.render('pixel_16', line, (255, 255, 255))
+                text_rect = text.get_rect(center=(self.screen.get_width() // 2, y_pos))
+                self.screen.blit(text, text_rect)
+                y_pos += 30
+
+            # Back instruction
+            back_text = self.assets.text.render('pixel_16', "Press ESC/SPACE/ENTER to return", (100, 100, 100))
+            back_rect = back_text.get_rect(center=(self.screen.get_width() // 2, self.screen.get_height() - 50))
+            self.screen.blit(back_text, back_rect)
 
     def _show_high_scores(self):
+        """
+        Paged leaderboards: best score per player, each level's best results and
+        the player's own runs. LEFT/RIGHT switch boards, UP/DOWN turn pages.
+        """
+        # (title, kind, level or username)
+        boards = [('Top Players', 'players', None)]
+        boards += [(f"Level {level}", 'level', int(level)) for level in self.level_manager.list_levels()]
+        if self.username:
+            boards.append(('Your Runs', 'history', self.username))
+        board_index = page = 0
+        # Counting is the one query that touches every row, so once per board
+        counts = {}
         waiting = True
+        redraw = True
         while waiting:
-            for event in pygame.event.get():
+            if redraw:
+                title, kind, key = boards[board_index]
+                if title not in counts:
+                    counts[title] = self._count_high_scores(kind, key)
+                pages = max(1, -(-counts[title] // self.HIGH_SCORES_PER_PAGE))
+                rows = self._get_high_score_rows(kind, key, page)
+                self._render_high_scores(title, rows, page, pages)
+                pygame.display.flip()
+            events = EventHelper.wait_events()
+            redraw = EventHelper.needs_redraw(events)
+            for event in events:
                 if event.type == pygame.QUIT:
                     pygame.quit()
                     sys.exit()
@@ -363,112 +511,184 @@ class MenuManager:
                     if event.key in (pygame.K_ESCAPE, pygame.K_RETURN, pygame.K_SPACE):
                         self.assets.play_sound('select')
                         waiting = False
+                    elif event.key in (pygame.K_LEFT, pygame.K_RIGHT):
+                        step = -1 if event.key == pygame.K_LEFT else 1
+                        board_index = (board_index + step) % len(boards)
+                        page = 0
+                        self.assets.play_sound('highlight')
+                    elif event.key in (pygame.K_UP, pygame.K_DOWN):
+                        step = -1 if event.key == pygame.K_UP else 1
+                        page = max(0, min(pages - 1, page + step))
+                        self.assets.play_sound('highlight')
 
-            self.screen.fill((0, 0, 0))
-            
-            # Title
-            title = self.title_font.render("High Scores", True, (255, 215, 0))
-            title_rect = title.get_rect(center=(self.screen.get_width() // 2, 80))
-            self.screen.blit(title, title_rect)
-            
-            # Get top 5 scores
-            top_scores = sorted(self.high_score_manager.high_scores.items(), 
-                              key=lambda x: x[1], reverse=True)[:5]
-            
-            y_pos = 180
-            for i, (username, score) in enumerate(top_scores, 1):
-                # Rank
-                rank_text = self.font.render(f"{i}.", True, (255, 215, 0))
-                rank_rect = rank_text.get_rect(right=self.screen.get_width() // 2 - 50, centery=y_pos)
-                self.screen.blit(rank_text, rank_rect)
-                
-                # Username
-                name_text = self.font.render(username, True, (255, 255, 255))
-                name_rect = name_text.get_rect(x=self.screen.get_width() // 2 - 40, centery=y_pos)
-                self.screen.blit(name_text, name_rect)
-                
-                # Score
-                score_text = self.font.render(str(int(score)), True, (255, 255, 255))
-                score_rect = score_text.get_rect(x=self.screen.get_width() // 2 + 100, centery=y_pos)
-                self.screen.blit(score_text, score_rect)
-                
-                y_pos += 50
-            
-            # Back instruction
-            back_text = self.sm_font.render("Press ESC/SPACE/ENTER to return", True, (100, 100, 100))
-            back_rect = back_text.get_rect(center=(self.screen.get_width() // 2, self.screen.get_height() - 50))
-            self.screen.blit(back_text, back_rect)
-            
-            pygame.display.flip()
+    def _count_high_scores(self, kind: str, key) -> int:
+        if kind == 'players':
+            return self.high_score_manager.count_players()
+        if kind == 'history':
+            return self.high_score_manager.count_history(key)
+        return self.high_score_manager.count_level_scores(key)
 
-    def _render_main_menu(self):
+    def _get_high_score_rows(self, kind: str, key, page: int) -> List[tuple]:
+        """(rank, name, score, note) for one page of a board"""
+        offset = page * self.HIGH_SCORES_PER_PAGE
+        ranks = range(offset + 1, offset + self.HIGH_SCORES_PER_PAGE + 1)
+        if kind == 'players':
+            scores = self.high_score_manager.get_top_scores(self.HIGH_SCORES_PER_PAGE, offset)
+            return [(rank, username, score, "") for rank, (username, score) in zip(ranks, scores)]
+        if kind == 'history':
+            runs = self.high_score_manager.get_history(key, self.HIGH_SCORES_PER_PAGE, offset)
+            return [(rank, time.strftime('%b %d', time.localtime(run.finished_at)), run.score,
+                     "cleared" if run.completed else f"{run.levels} levels")
+                    for rank, run in zip(ranks, runs)]
+        results = self.high_score_manager.get_level_scores(key, self.HIGH_SCORES_PER_PAGE, offset)
+        return [(rank, username, score, f"{seconds:.1f}s") for rank, (username, score, seconds) in zip(ranks, results)]
+
+    def _render_high_scores(self, board: str, rows: List[tuple], page: int, pages: int):
         self.screen.fill((0, 0, 0))
-        
-        # Update animation and jump state
-        self.animation_time = (self.animation_time + 0.016) % self.animation_speed
+        center_x = self.screen.get_width() // 2
+
+        # Title
+        title = self.assets.text.render('pixel_64', "High Scores", (255, 215, 0))
+        title_rect = title.get_rect(center=(center_x, 80))
+        self.screen.blit(title, title_rect)
+
+        board_text = self.assets.text.render('pixel_24', f"< {board} >", (255, 255, 255))
+        self.screen.blit(board_text, board_text.get_rect(center=(center_x, 140)))
+
+        if not rows:
+            empty_text = self.assets.text.render('pixel_24', "No scores yet", (100, 100, 100))
+            self.screen.blit(empty_text, empty_text.get_rect(center=(center_x, 250)))
+
+        y_pos = 200
+        for rank, name, score, note in rows:
+            # Rank
+            rank_text = self.assets.text.render('pixel_24', f"{rank}.", (255, 215, 0))
+            rank_rect = rank_text.get_rect(right=center_x - 150, centery=y_pos)
+            self.screen.blit(rank_text, rank_rect)
+
+            # Username
+            name_text = self.assets.text.render('pixel_24', name, (255, 255, 255))
+            name_rect = name_text.get_rect(x=center_x - 140, centery=y_pos)
+            self.screen.blit(name_text, name_rect)
+
+            # Score
+            score_text = self.assets.text.render('pixel_24', str(int(score)), (255, 255, 255))
+            score_rect = score_text.get_rect(x=center_x + 60, centery=y_pos)
+            self.screen.blit(score_text, score_rect)
+
+            # Time, or how far the run got
+            if note:
+                note_text = self.assets.text.render('pixel_16', note, (150, 150, 150))
+                note_rect = note_text.get_rect(x=center_x + 190, centery=y_pos)
+                self.screen.blit(note_text, note_rect)
+
+            y_pos += 50
+
+        page_text = self.assets.text.render('pixel_16', f"Page {page + 1}/{pages}", (150, 150, 150))
+        self.screen.blit(page_text, page_text.get_rect(center=(center_x, self.screen.get_height() - 90)))
+
+        # Back instruction
+        back_text = self.assets.text.render('pixel_16', "Press ESC/SPACE/ENTER to return", (100, 100, 100))
+        back_rect = back_text.get_rect(center=(center_x, self.screen.get_height() - 50))
+        self.screen.blit(back_text, back_rect)
+
+    def _render_main_menu(self):
+        """Draw the whole main menu: the cached text, then the character"""
+        self.screen.blit(self._get_main_menu_background(), (0, 0))
+        self.sprite_rect = self._draw_menu_character()
+        pygame.display.flip()
+
+    def _animate_main_menu(self):
+        """Move the character, updating only the area it left and the area it now covers"""
+        background = self._get_main_menu_background()
+        dirty = []
+        if self.sprite_rect is not None:
+            dirty.append(self.screen.blit(background, self.sprite_rect, self.sprite_rect))
+        self.sprite_rect = self._draw_menu_character()
+        if self.sprite_rect is not None:
+            dirty.append(self.sprite_rect)
+        pygame.display.update(dirty)
+
+    def _get_main_menu_background(self) -> pygame.Surface:
+        key = (self.selected_index, self.screen.get_size())
+        if self.background is None or key != self.background_key:
+            self.background = pygame.Surface(self.screen.get_size()).convert()
+            self.background.fill((0, 0, 0))
+
+            # Draw title
+            title_surface = self.assets.text.render('pixel_64', "Rotander", (255, 255, 255))
+            title_rect = title_surface.get_rect(center=(self.background.get_width() // 2, 80))
+            self.background.blit(title_surface, title_rect)
+
+            # Draw menu options
+            for idx, option in enumerate(self.options):
+                color = (255, 215, 0) if idx == self.selected_index else (255, 255, 255)
+                option_surface = self.assets.text.render('pixel_24', option, color)
+                option_rect = option_surface.get_rect(center=(self.background.get_width() // 2, self.menu_start_y + idx * 50))
+                self.background.blit(option_surface, option_rect)
+            self.background_key = key
+        return self.background
+
+    def _draw_menu_character(self):
+        """Draw the bouncing character and return the rect it covers"""
+        # Driven by the clock rather than the frame count, since frames are not evenly spaced
+        self.animation_time = (pygame.time.get_ticks() / 1000) % self.animation_speed
         bounce_offset = math.sin(self.animation_time * math.pi / (self.animation_speed/2)) * self.bounce_height
         self.is_jumping = bounce_offset > 5  # Switch to jump sprite when bouncing up
-        
-        # Draw title
-        title_surface = self.title_font.render("Rotander", True, (255, 255, 255))
-        title_rect = title_surface.get_rect(center=(self.screen.get_width() // 2, 80))
-        self.screen.blit(title_surface, title_rect)
 
         # Draw character sprite
         sprite_name = 'player_jump_up' if self.is_jumping else 'player_stand'
         sprite = self.assets.get_sprite(sprite_name)
-        if sprite:
-            scaled_width = MovementSettings.user_width_pixels * 2
-            scaled_height = MovementSettings.user_height_pixels * 2
-            scaled_sprite = pygame.transform.scale(sprite, (scaled_width, scaled_height))
-            
-            sprite_x = self.screen.get_width() // 2 - scaled_width // 2
-            sprite_y = self.character_base_y - scaled_height // 2 - bounce_offset
-            self.screen.blit(scaled_sprite, (sprite_x, sprite_y))
-
-        # Draw menu options
-        for idx, option in enumerate(self.options):
-            color = (255, 215, 0) if idx == self.selected_index else (255, 255, 255)
-            option_surface = self.font.render(option, True, color)
-            option_rect = option_surface.get_rect(center=(self.screen.get_width() // 2, self.menu_start_y + idx * 50))
-            self.screen.blit(option_surface, option_rect)
+        if not sprite:
+            return None
+        scaled_width = MovementSettings.user_width_pixels * 2
+        scaled_height = MovementSettings.user_height_pixels * 2
+        scaled_sprite = self.assets.get_scaled_sprite(sprite_name, (scaled_width, scaled_height))
 
-        pygame.display.flip()
+        sprite_x = self.screen.get_width() // 2 - scaled_width // 2
+        sprite_y = self.character_base_y - scaled_height // 2 - bounce_offset
+        return self.screen.blit(scaled_sprite, (sprite_x, sprite_y))
 
-    def _get_username(self, clock: pygame.time.Clock) -> str:
-                username = ""
-                input_active = True
-                while input_active:
-                    for event in pygame.event.get():
-                        if event.type == pygame.QUIT:
-                            self.running = False
-                            pygame.quit()
-                            sys.exit()
-                        elif event.type == pygame.KEYDOWN:
-                            if event.key == pygame.K_RETURN:
-                                self.assets.play_sound('select')
-                                input_active = False
-                            elif event.key == pygame.K_BACKSPACE:
-                                self.assets.play_sound('highlight')
-                                username = username[:-1]
-                            else:
-                                if len(event.unicode.strip()) > 0:  # Only play sound for actual characters
-                                    self.assets.play_sound('highlight')
-                                username += event.unicode
-                    self.screen.fill((0, 0, 0))
-                    prompt_surface = self.font.render("Enter Username:", True, (255, 255, 255))
-                    prompt_rect = prompt_surface.get_rect(center=(self.screen.get_width() // 2, 200))
-                    self.screen.blit(prompt_surface, prompt_rect)
-                    
-                    username_surface = self.font.render(username, True, (255, 255, 255))
-                    username_rect = username_surface.get_rect(center=(self.screen.get_width() // 2, 250))
-                    self.screen.blit(username_surface, username_rect)
-                    pygame.display.flip()
-                    clock.tick(30)
-                return username
-
-    def _handle_events(self):
-        for event in pygame.event.get():
+    def _get_username(self) -> str:
+        username = ""
+        input_active = True
+        redraw = True
+        while input_active:
+            if redraw:
+                self._render_username(username)
+                pygame.display.flip()
+            events = EventHelper.wait_events()
+            redraw = EventHelper.needs_redraw(events)
+            for event in events:
+                if event.type == pygame.QUIT:
+                    self.running = False
+                    pygame.quit()
+                    sys.exit()
+                elif event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_RETURN:
+                        self.assets.play_sound('select')
+                        input_active = False
+                    elif event.key == pygame.K_BACKSPACE:
+                        self.assets.play_sound('highlight')
+                        username = username[:-1]
+                    else:
+                        if len(event.unicode.strip()) > 0:  # Only play sound for actual characters
+                            self.assets.play_sound('highlight')
+                        username += event.unicode
+        return username
+
+    def _render_username(self, username: str):
+        self.screen.fill((0, 0, 0))
+        prompt_surface = self.assets.text.render('pixel_24', "Enter Username:", (255, 255, 255))
+        prompt_rect = prompt_surface.get_rect(center=(self.screen.get_width() // 2, 200))
+        self.screen.blit(prompt_surface, prompt_rect)
+
+        username_surface = self.assets.text.render('pixel_24', username, (255, 255, 255))
+        username_rect = username_surface.get_rect(center=(self.screen.get_width() // 2, 250))
+        self.screen.blit(username_surface, username_rect)
+
+    def _handle_events(self, events: List[pygame.event.Event]):
+        for event in events:
             if event.type == pygame.QUIT:
                 self.running = False
                 pygame.quit()
@@ -486,7 +706,7 @@ class MenuManager:
 
     def _render_pause_menu(self):
         self.screen.fill((0, 0, 0))
-        title_surface = self.title_font.render("Paused", True, (255, 255, 255))
+        title_surface = self.assets.text.render('pixel_64', "Paused", (255, 255, 255))
         title_rect = title_surface.get_rect(center=(self.screen.get_width() // 2, 150))
         self.screen.blit(title_surface, title_rect)
 
@@ -495,14 +715,14 @@ class MenuManager:
                 color = (255, 215, 0)  # Highlighted color
             else:
                 color = (255, 255, 255)
-            option_surface = self.font.render(option, True, color)
+            option_surface = self.assets.text.render('pixel_24', option, color)
             option_rect = option_surface.get_rect(center=(self.screen.get_width() // 2, 300 + idx * 50))
             self.screen.blit(option_surface, option_rect)
 
 
     def _render(self):
         self.screen.fill((0, 0, 0))
-        title_surface = self.title_font.render("Rotander", True, (255, 255, 255))
+        title_surface = self.assets.text.render('pixel_64', "Rotander", (255, 255, 255))
         title_rect = title_surface.get_rect(center=(self.screen.get_width() // 2, 100))
         self.screen.blit(title_surface, title_rect)
 
@@ -511,6 +731,6 @@ class MenuManager:
                 color = (255, 215, 0)  # Highlighted color
             else:
                 color = (255, 255, 255)
-            option_surface = self.font.render(f"Level {option}", True, color)
+            option_surface = self.assets.text.render('pixel_24', f"Level {option}", color)
             option_rect = option_surface.get_rect(center=(self.screen.get_width() // 2, 200 + idx * 40))
             self.screen.blit(option_surface, option_rect)
\ No newline at end of file
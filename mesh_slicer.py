@@ -0,0 +1,254 @@
+import numpy as np
+from typing import List, Tuple
+
+class MeshIndex:
+    """
+    Per-mesh acceleration structure: triangles bucketed into a uniform xy grid.
+    The slicing plane is vertical, so it crosses the grid along a line and only
+    the triangles in the cells on that line need to be tested.
+    """
+    TRIANGLES_PER_CELL = 32
+
+    def __init__(self, points: np.ndarray, triangles: np.ndarray):
+        self.points = np.asarray(points, dtype=float).reshape(-1, 3)
+        self.triangles = np.asarray(triangles, dtype=np.int64).reshape(-1, 3)
+        corners = self.points[self.triangles]  # (T, 3, 3)
+        tri_min = corners[:, :, :2].min(axis=1)
+        tri_max = corners[:, :, :2].max(axis=1)
+
+        self.origin = tri_min.min(axis=0) if len(self.triangles) else np.zeros(2)
+        extent = np.maximum((tri_max.max(axis=0) if len(self.triangles) else np.ones(2)) - self.origin, 1e-9)
+        cells_per_axis = max(1, int(np.sqrt(len(self.triangles) / self.TRIANGLES_PER_CELL)))
+        self.shape = np.array([cells_per_axis, cells_per_axis])
+        self.cell_size = extent / self.shape
+
+        # Every triangle goes into each cell its xy bounding box overlaps
+        low = self._cell_of(tri_min)
+        high = self._cell_of(tri_max)
+        spans = high - low + 1
+        counts = spans[:, 0] * spans[:, 1]
+        triangle_ids = np.repeat(np.arange(len(self.triangles)), counts)
+        local = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        span_y = np.repeat(spans[:, 1], counts)
+        cells_x = np.repeat(low[:, 0], counts) + local // span_y
+        cells_y = np.repeat(low[:, 1], counts) + local % span_y
+        cell_ids = cells_x * self.shape[1] + cells_y
+
+        order = np.argsort(cell_ids, kind='stable')
+        self.cell_triangles = triangle_ids[order]
+        self.cell_offsets = np.zeros(self.shape.prod() + 1, dtype=np.int64)
+        np.cumsum(np.bincount(cell_ids, minlength=self.shape.prod()), out=self.cell_offsets[1:])
+
+        grid_x, grid_y = np.meshgrid(np.arange(self.shape[0]), np.arange(self.shape[1]), indexing='ij')
+        cell_min = self.origin + np.stack([grid_x.ravel(), grid_y.ravel()], axis=1) * self.cell_size
+        # Corners of every cell, used to find the cells the plane's line crosses
+        self.cell_corners = np.stack([cell_min, cell_min + [self.cell_size[0], 0],
+                                      cell_min + self.cell_size, cell_min + [0, self.cell_size[1]]], axis=1)
+
+    def _cell_of(self, xy: np.ndarray) -> np.ndarray:
+        cells = np.floor((xy - self.origin) / self.cell_size).astype(np.int64)
+        return np.clip(cells, 0, self.shape - 1)
+
+    def candidates(self, user_pos: np.ndarray, normal_xy: np.ndarray) -> np.ndarray:
+        """Triangles in the grid cells the plane passes through"""
+        distances = (self.cell_corners - user_pos[:2]) @ normal_xy
+        crossed = np.flatnonzero((distances.min(axis=1) <= 0) & (distances.max(axis=1) >= 0))
+        if not len(crossed):
+            return np.zeros(0, dtype=np.int64)
+        starts, ends = self.cell_offsets[crossed], self.cell_offsets[crossed + 1]
+        counts = ends - starts
+        positions = np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(counts.sum())
+        return np.unique(self.cell_triangles[positions])
+
+class MeshSlicer:
+    """Slices triangle meshes with the vertical plane, producing polygons with holes"""
+
+    @staticmethod
+    def get_index(shape: dict) -> MeshIndex:
+        # Built on first use and kept on the shape, or on the prototype its instances share
+        owner = shape.get('prototype', shape)
+        if '_mesh_index' not in owner:
+            owner['_mesh_index'] = MeshIndex(owner['points'], owner['triangles'])
+        return owner['_mesh_index']
+
+    @staticmethod
+    def slice_segments(shape: dict, user_pos: np.ndarray, plane_angle: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Cut every crossing triangle. Returns 2D segment endpoints (S, 2, 2) in
+        plane coordinates and the mesh edge each endpoint lies on (S, 2, 2),
+        which is what the chaining step joins segments by.
+        """
+        index = MeshSlicer.get_index(shape)
+        normal = np.array([np.cos(plane_angle), np.sin(plane_angle), 0.0])
+        triangles = index.triangles[index.candidates(user_pos, normal[:2])]
+        if not len(triangles):
+            return np.zeros((0, 2, 2)), np.zeros((0, 2, 2), dtype=np.int64)
+
+        corners = index.points[triangles]  # (T, 3, 3)
+        distances = (corners - user_pos) @ normal  # (T, 3)
+        # Vertices exactly on the plane count as in front, so every crossing
+        # triangle has exactly two crossing edges
+        front = distances >= 0
+        crossing = front.any(axis=1) & ~front.all(axis=1)
+        triangles, corners, distances, front = (triangles[crossing], corners[crossing],
+                                                distances[crossing], front[crossing])
+
+        a_side, b_side = [0, 1, 2], [1, 2, 0]
+        edge_crosses = front[:, a_side] != front[:, b_side]  # (T, 3)
+        d_a, d_b = distances[:, a_side], distances[:, b_side]
+        t = np.where(edge_crosses, d_a / np.where(edge_crosses, d_a - d_b, 1.0), 0.0)
+        points = corners[:, a_side] + t[:, :, None] * (corners[:, b_side] - corners[:, a_side])
+        edge_keys = np.sort(np.stack([triangles[:, a_side], triangles[:, b_side]], axis=2), axis=2)
+
+        # Pick the two crossing edges of each triangle
+        which = np.argsort(~edge_crosses, axis=1, kind='stable')[:, :2]
+        rows = np.arange(len(triangles))[:, None]
+        points_3d = points[rows, which]  # (T, 2, 3)
+        keys = edge_keys[rows, which]  # (T, 2, 2)
+
+        p_x = np.array([-np.sin(plane_angle), np.cos(plane_angle), 0.0])
+        relative = points_3d - user_pos
+        points_2d = np.stack([relative @ p_x, relative[:, :, 2]], axis=2)
+        return points_2d, keys
+
+    @staticmethod
+    def chain_segments(points_2d: np.ndarray, keys: np.ndarray) -> Tuple[List[np.ndarray], List[np.ndarray]]:
+        """
+        Join segments that share a mesh edge into polylines. Returns closed loops
+        and open chains (from meshes that are not watertight).
+        """
+        keys = [[tuple(key_a), tuple(key_b)] for key_a, key_b in keys.tolist()]
+        ends = {}
+        for segment, (key_a, key_b) in enumerate(keys):
+            ends.setdefault(key_a, []).append((segment, 0))
+            ends.setdefault(key_b, []).append((segment, 1))
+
+        used = np.zeros(len(keys), dtype=bool)
+        loops, chains = [], []
+        for start in range(len(keys)):
+            if used[start]:
+                continue
+            used[start] = True
+            forward, closed = MeshSlicer._walk(start, 1, keys, ends, used)
+            # Each crossing point is shared by two segments, so a segment adds the
+            # point it was entered through
+            polyline = [points_2d[start, 0]] + [points_2d[segment, side] for segment, side in forward]
+            if closed:
+                loops.append(np.array(polyline))
+                continue
+            backward, _ = MeshSlicer._walk(start, 0, keys, ends, used)
+            head = [points_2d[segment, 1 - side] for segment, side in reversed(backward)]
+            last_segment, last_side = forward[-1] if forward else (start, 0)
+            chains.append(np.array(head + polyline + [points_2d[last_segment, 1 - last_side]]))
+        return loops, chains
+
+    @staticmethod
+    def _walk(start: int, side: int, keys: list, ends: dict, used: np.ndarray) -> Tuple[list, bool]:
+        """
+        Follow segments through shared edges, leaving start through side.
+        Returns the (segment, entry side) path and whether it came back to start.
+        """
+        path = []
+        segment = start
+        while True:
+            step = next(((other, other_side) for other, other_side in ends[keys[segment][side]]
+                         if other != segment), None)
+            if step is None:
+                return path, False
+            other, other_side = step
+            if other == start:
+                return path, True
+            if used[other]:
+                return path, False
+            used[other] = True
+            path.append(step)
+            segment, side = other, 1 - other_side
+
+    @staticmethod
+    def build_polygons(loops: List[np.ndarray]) -> List[np.ndarray]:
+        """
+        Sort loops into outer boundaries and holes by nesting depth and bridge
+        each hole into its outer polygon, so every result is one simple polygon.
+        """
+        if not loops:
+            return []
+        areas = [MeshSlicer._signed_area(loop) for loop in loops]
+        depth = [sum(1 for j, other in enumerate(loops) if j != i and MeshSlicer.contains_point(other, loop[0]))
+                 for i, loop in enumerate(loops)]
+        polygons = []
+        for i, loop in enumerate(loops):
+            if depth[i] % 2:
+                continue
+            outer = loop if areas[i] > 0 else loop[::-1]
+            holes = [loops[j] for j in range(len(loops))
+                     if depth[j] == depth[i] + 1 and MeshSlicer.contains_point(loop, loops[j][0])]
+            # Bridge holes right to left so later bridges cannot cross earlier ones
+            for hole in sorted(holes, key=lambda hole: -hole[:, 0].max()):
+                hole = hole if MeshSlicer._signed_area(hole) < 0 else hole[::-1]
+                outer = MeshSlicer._bridge(outer, hole)
+            polygons.append(outer)
+        return polygons
+
+    @staticmethod
+    def _bridge(outer: np.ndarray, hole: np.ndarray) -> np.ndarray:
+        """Join a hole into the outer polygon through a two-way cut (keyhole)"""
+        h = int(np.argmax(hole[:, 0]))
+        anchor = hole[h]
+        # Nearest outer vertex whose cut does not cross the outer boundary
+        order = np.argsort(np.linalg.norm(outer - anchor, axis=1))
+        o = int(order[0])
+        for candidate in order:
+            if not MeshSlicer._crosses(outer, anchor, outer[candidate]):
+                o = int(candidate)
+                break
+        hole_walk = np.vstack([hole[h:], hole[:h + 1]])
+        return np.vstack([outer[:o + 1], hole_walk, outer[o:]])
+
+    @staticmethod
+    def _crosses(polygon: np.ndarray, a: np.ndarray, b: np.ndarray) -> bool:
+        """True if segment ab properly crosses an edge of the polygon"""
+        p, q = polygon, np.roll(polygon, -1, axis=0)
+        def side(u, v, w):
+            return (v[..., 0] - u[..., 0]) * (w[..., 1] - u[..., 1]) - (v[..., 1] - u[..., 1]) * (w[..., 0] - u[..., 0])
+        d1, d2 = side(a, b, p), side(a, b, q)
+        d3, d4 = side(p, q, a), side(p, q, b)
+        return bool(((d1 * d2 < -1e-12) & (d3 * d4 < -1e-12)).any())
+
+    @staticmethod
+    def _signed_area(loop: np.ndarray) -> float:
+        x, y = loop[:, 0], loop[:, 1]
+        return 0.5 * float(np.dot(x, np.roll(y, -1)) - np.dot(y, np.roll(x, -1)))
+
+    @staticmethod
+    def contains_point(loop: np.ndarray, point: np.ndarray) -> bool:
+        """Even-odd point in polygon test"""
+        p, q = loop, np.roll(loop, -1, axis=0)
+        straddles = (p[:, 1] > point[1]) != (q[:, 1] > point[1])
+        with np.errstate(divide='ignore', invalid='ignore'):
+            x_cross = p[:, 0] + (point[1] - p[:, 1]) * (q[:, 0] - p[:, 0]) / (q[:, 1] - p[:, 1])
+        return bool(np.count_nonzero(straddles & (x_cross > point[0])) % 2)
+
+    @staticmethod
+    def slice_mesh(shape: dict, user_pos: np.ndarray, plane_angle: float) -> Tuple[List[Tuple[float, float]], List[Tuple[int, int]]]:
+        """
+        Slice a mesh shape into the (points, edges) form used for convex shapes.
+        Each polygon (holes bridged in) is a contiguous run of points closed by
+        its last edge; open chains follow as unclosed runs.
+        """
+        points_2d, keys = MeshSlicer.slice_segments(shape, np.asarray(user_pos, dtype=float), plane_angle)
+        loops, chains = MeshSlicer.chain_segments(points_2d, keys)
+        points, edges = [], []
+        runs = [(polygon, True) for polygon in MeshSlicer.build_polygons(loops)]
+        runs += [(chain, False) for chain in chains]
+        for run, closed in runs:
+            start = len(points)
+            points.extend(map(tuple, run.tolist()))
+            edges.extend((i, i + 1) for i in range(start, len(points) - 1))
+            if closed:
+                edges.append((len(points) - 1, start))
+        return points, edges
+
+    @staticmethod
+    def polygons_from_edges(points: List[Tuple[float, float]], edges: List[Tuple[int, int]]) -> List[List[Tuple[float, float]]]:
+        """Recover the closed polygons from slice_mesh's output: each ends with an edge back to its start"""
+        return [points[b:a + 1] for a, b in edges if b < a]
@@ -0,0 +1,81 @@
+import os
+import threading
+import pygame
+from typing import BinaryIO, Callable, Dict, Optional, Union
+
+class MusicPlayer:
+    """
+    Streams music tracks through pygame.mixer.music so they are never decoded
+    whole into memory. Switching tracks fades the current one out and fades the
+    next one in; pygame has a single music stream, so the two run back to back.
+    """
+    FADE_MS = 600
+
+    def __init__(self, tracks: Dict[str, str],
+                 open_asset: Callable[[str], Optional[Union[str, BinaryIO]]]):
+        self.tracks = tracks  # Track name -> asset path
+        self.open_asset = open_asset  # Asset path -> file path or file object
+        self.current = None
+        self.volume = 1.0
+        self.lock = threading.Lock()
+        self.switch_timer: Optional[threading.Timer] = None
+        # The stream reads from this while the track plays, so keep it referenced
+        self.source = None
+
+    def play(self, name: str, fade_ms: int = FADE_MS):
+        """Play a looping track, fading out whatever is playing first. Keeps playing if it already is."""
+        if name not in self.tracks:
+            print(f"Warning: Unknown music track: {name}")
+            return
+        with self.lock:
+            playing = pygame.mixer.music.get_busy()
+            if name == self.current and (playing or self.switch_timer):
+                return
+            self._cancel_switch()
+            self.current = name
+            if playing and fade_ms > 0:
+                pygame.mixer.music.fadeout(fade_ms)
+                self.switch_timer = threading.Timer(fade_ms / 1000, self._switch, (name, fade_ms))
+                self.switch_timer.daemon = True
+                self.switch_timer.start()
+            else:
+                self._start(name, fade_ms)
+
+    def _switch(self, name: str, fade_ms: int):
+        """Runs on the timer thread once the previous track has faded out"""
+        with self.lock:
+            # A later play() or stop() supersedes this switch
+            if self.current == name:
+                self._start(name, fade_ms)
+
+    def _start(self, name: str, fade_ms: int):
+        path = self.tracks[name]
+        source = self.open_asset(path)
+        if source is None:
+            print(f"Warning: Music file not found: {path}")
+            return
+        try:
+            pygame.mixer.music.load(source, os.path.basename(path))
+            self.source = source
+            pygame.mixer.music.set_volume(self.volume)
+            pygame.mixer.music.play(-1, fade_ms=fade_ms)
+        except pygame.error as e:
+            print(f"Warning: Error playing music {os.path.basename(path)}: {str(e)}")
+
+    def _cancel_switch(self):
+        if self.switch_timer:
+            self.switch_timer.cancel()
+            self.switch_timer = None
+
+    def stop(self, fade_ms: int = 0):
+        with self.lock:
+            self._cancel_switch()
+            self.current = None
+            if fade_ms > 0:
+                pygame.mixer.music.fadeout(fade_ms)
+            else:
+                pygame.mixer.music.stop()
+
+    def set_volume(self, volume: float):
+        self.volume = volume
+        pygame.mixer.music.set_volume(volume)
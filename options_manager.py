@@ -10,6 +10,11 @@ class OptionsManager:
             'master_volume': 1.0,
             'music_volume': 1.0,
             'sfx_volume': 1.0,
+            'dirty_rect_presentation': False,
+            'dynamic_resolution': True,
+            # Memoize static level slices; off by default, worth it for heavy levels
+            'slice_cache': False,
+            'slice_cache_mb': 16,
         }
         self.options = self._load_options()
 
@@ -33,7 +38,7 @@ class OptionsManager:
         self.apply_volume_settings()
 
     def apply_volume_settings(self, asset_manager):
-        pygame.mixer.music.set_volume(self.options['master_volume'] * self.options['music_volume'])
+        asset_manager.music.set_volume(self.options['master_volume'] * self.options['music_volume'])
         for sound in asset_manager.sounds.values():
             if sound:
                 sound.set_volume(self.options['master_volume'] * self.options['sfx_volume'])
\ No newline at end of file
@@ -1,17 +1,29 @@
 import pygame
 import numpy as np
 from typing import List, Tuple, Optional
-from scipy.spatial import ConvexHull
 from settings import Settings
 from asset_manager import AssetManager
-from geometry import GeometryHelper
+from geometry import GeometryHelper, PolygonBatch
+from screen_helper import ScreenHelper
 
 class Renderer:
-    def __init__(self, settings: Settings, assets: AssetManager):
-        pygame.init()
+    # Pixel offsets of a radius-3 disk, used to stamp enemy markers on the minimap
+    MINIMAP_MARKER = tuple(offsets[np.hypot(*np.mgrid[-3:4, -3:4]) <= 3] for offsets in np.mgrid[-3:4, -3:4])
+    MINIMAP_SIZE = (150, 150)  # You can adjust these base dimensions
+    MINIMAP_MARGIN = 10
+    MINIMAP_LAYER_MAX_SIZE = 4096
+    # Dynamic resolution: the world layer is drawn at render_scale of the window
+    # size and upscaled, trading sharpness for fill cost when frames run long
+    FRAME_BUDGET_MS = 1000 / 60
+    MIN_RENDER_SCALE = 0.5
+    RENDER_SCALE_STEP = 0.1
+    RENDER_SCALE_COOLDOWN = 30  # Frames to wait between scale changes
+
+    def __init__(self, settings: Settings, assets: AssetManager, display: Optional[ScreenHelper] = None):
+        # The renderer lives for the whole session; levels are swapped in with load_level
+        self.display = display or ScreenHelper(settings.display.window_size)
+        self.screen = self.display.open()
         self.settings = settings
-        self.screen = pygame.display.set_mode(settings.display.window_size)
-        pygame.display.set_caption("Rotander")
         self.assets = assets
         self.font = {
             8: self.assets.get_font('pixel_8'),
@@ -19,122 +31,198 @@ class Renderer:
             48: self.assets.get_font('pixel_48'),
             64: self.assets.get_font('pixel_64'),
         }
-        self.center_2D = (settings.display.window_size[0] // 2, 
-                         settings.display.window_size[1] // 2)
+        self.text = self.assets.text
+        self.center_2D = (self.screen.get_width() // 2, 
+                         self.screen.get_height() // 2)
+        settings.display.window_size = self.screen.get_size()
+        # Cached surface holding the background and level shapes for one slice
+        self.static_layer = None
+        self.static_layer_key = None
+        # Dirty-rectangle presentation: only regions drawn this frame and last
+        # frame are pushed to the display, unless a full redraw is pending
+        self.dirty_rect_presentation = False
+        self.dirty_rects = []
+        self.previous_dirty_rects = []
+        self.full_redraw = True
+        # Minimap surface and baked top-down level layers: scale -> (geometry version, layer, origin)
+        self.minimap_surface = None
+        self.minimap_layers = {}
+        # World layer target; the screen itself unless render_scale < 1
+        self.dynamic_resolution = True
+        self.render_scale = 1.0
+        self.world = self.screen
+        self.frame_time_ms = 0.0
+        self.render_scale_cooldown = 0
+
+    def load_level(self, settings: Settings):
+        """Swap in a new level's settings, keeping the window, fonts and sprite caches"""
+        self.settings = settings
+        self.static_layer_key = None
+        self.minimap_layers = {}
+        # Otherwise the first frames show the previous level's minimap
+        self.minimap_surface = None
+        self.on_display_changed()
+
+    def on_display_changed(self):
+        """Pick up a new display surface after a resize or fullscreen toggle"""
+        self.screen = pygame.display.get_surface()
+        self.settings.display.window_size = self.screen.get_size()
+        self.center_2D = (self.screen.get_width() // 2, 
+                         self.screen.get_height() // 2)
+        self.world = self.screen
+        self.static_layer = None
+        self.dirty_rects = []
+        self.previous_dirty_rects = []
+        self.full_redraw = True
+
+    def toggle_fullscreen(self):
+        self.display.toggle_fullscreen()
+        self.assets.invalidate_display_cache()
+        self.on_display_changed()
 
     def clear_screen(self):
         self.screen.fill(self.settings.display.background_color)
+        self.full_redraw = True
+
+    def invalidate(self):
+        """Force the next update_display to present the whole window"""
+        self.full_redraw = True
+
+    def _mark_dirty(self, rect: Optional[pygame.Rect]):
+        if rect:
+            self.dirty_rects.append(pygame.Rect(rect))
+
+    @property
+    def pixels_per_unit(self) -> float:
+        """Pixels per world unit on the world layer"""
+        return self.settings.display.pixels_per_unit * self.render_scale
+
+    @property
+    def world_center(self) -> Tuple[int, int]:
+        """Position of the user on the world layer"""
+        return (int(self.center_2D[0] * self.render_scale),
+                int(self.center_2D[1] * self.render_scale))
+
+    def adapt_resolution(self, frame_time_ms: float):
+        """Lower the world layer resolution when frames run over budget, raise it when there is headroom"""
+        if not self.dynamic_resolution:
+            self.render_scale = 1.0
+            return
+        self.frame_time_ms = 0.9 * self.frame_time_ms + 0.1 * frame_time_ms
+        if self.render_scale_cooldown > 0:
+            self.render_scale_cooldown -= 1
+            return
+        if self.frame_time_ms > 0.9 * self.FRAME_BUDGET_MS and self.render_scale > self.MIN_RENDER_SCALE:
+            self.render_scale = round(max(self.MIN_RENDER_SCALE, self.render_scale - self.RENDER_SCALE_STEP), 2)
+            self.render_scale_cooldown = self.RENDER_SCALE_COOLDOWN
+        elif self.frame_time_ms < 0.6 * self.FRAME_BUDGET_MS and self.render_scale < 1.0:
+            self.render_scale = round(min(1.0, self.render_scale + self.RENDER_SCALE_STEP), 2)
+            self.render_scale_cooldown = self.RENDER_SCALE_COOLDOWN
+
+    def begin_world_layer(self):
+        """Select the surface the world layer is drawn to for this frame"""
+        if self.render_scale >= 1.0:
+            self.world = self.screen
+            return
+        size = (int(self.screen.get_width() * self.render_scale),
+                int(self.screen.get_height() * self.render_scale))
+        if self.world is self.screen or self.world.get_size() != size:
+            self.world = pygame.Surface(size).convert()
+        # The upscaled layer covers the whole window
+        self.full_redraw = True
+
+    def finish_world_layer(self):
+        """Upscale the world layer to the window; HUD drawing stays at native resolution"""
+        if self.world is not self.screen:
+            pygame.transform.scale(self.world, self.screen.get_size(), self.screen)
     
 
-    def draw_pulsing_target(self, coords_2d: List[Tuple[float, float]], 
-                            edges: List[Tuple[int, int]], pulse_factor: float):
-        try:
-            hull = ConvexHull(coords_2d)
-            hull_indices = hull.vertices
-            polygon = [coords_2d[j] for j in hull_indices]
-            
-            # Convert to screen coordinates
-            polygon_screen = [self._to_screen_coords(pt) for pt in polygon]
-            
-            # Define golden color pulsing
-            golden_color = (
-                int(255 * pulse_factor), 
-                int(215 * pulse_factor), 
-                0
-            )
-            
-            pygame.draw.polygon(self.screen, golden_color, polygon_screen, 3)
-        except:
-            pass
-
-    def draw_shapes(self, shapes: List[dict], 
-                   intersection_coords_2D: List[List[Tuple[float, float]]], 
-                   intersection_edges: List[List[Tuple[int, int]]]):
-        for i, shape in enumerate(shapes):
-            color = self.settings.get_shape_color(shape)
-            coords_2d = intersection_coords_2D[i]
-            edges_2d = intersection_edges[i]
-
-            if len(coords_2d) >= 3:
-                self._draw_polygon(coords_2d, color)
-            elif len(coords_2d) == 2:
-                self._draw_line_segment(coords_2d[0], coords_2d[1], color)
-
-    def _draw_polygon(self, coords_2d: List[Tuple[float, float]], color: Tuple[int, int, int]):
-        try:
-            hull = ConvexHull(coords_2d)
-            hull_indices = hull.vertices
-            polygon = [coords_2d[j] for j in hull_indices]
-            
-            # Convert to screen coordinates
-            polygon_screen = [self._to_screen_coords(pt) for pt in polygon]
-            
-            pygame.draw.polygon(self.screen, color, polygon_screen)
-            pygame.draw.polygon(self.screen, (0, 0, 0), polygon_screen, 1)
-        except:
-            pass
+    def draw_pulsing_target(self, batch: PolygonBatch, pulse_factor: float):
+        # Define golden color pulsing
+        golden_color = (
+            int(255 * pulse_factor), 
+            int(215 * pulse_factor), 
+            0
+        )
+        self.draw_polygon_batch(batch, [golden_color] * len(batch), width=3)
+
+    def draw_static_layer(self, shapes: List[dict], batch: PolygonBatch, version: int):
+        """
+        Blit the background and level shapes for the current slice. The layer is
+        re-rendered only when the slice version or the screen mapping changes.
+        """
+        key = (version, self.world.get_size(), self.world_center, self.pixels_per_unit)
+        if self.static_layer is None or key != self.static_layer_key:
+            if self.static_layer is None or self.static_layer.get_size() != self.world.get_size():
+                self.static_layer = pygame.Surface(self.world.get_size()).convert()
+            self.static_layer.fill(self.settings.display.background_color)
+            self.draw_shapes(shapes, batch, surface=self.static_layer)
+            self.static_layer_key = key
+            self.full_redraw = True
 
-    def draw_enemies(self, enemies_intersections: List[dict]):
+        if self.full_redraw or not self.dirty_rect_presentation:
+            self.world.blit(self.static_layer, (0, 0))
+        else:
+            # Same slice as last frame: only erase what the dynamic layers drew
+            for rect in self.previous_dirty_rects:
+                self._mark_dirty(self.screen.blit(self.static_layer, rect, rect))
+
+    def draw_shapes(self, shapes: List[dict], batch: PolygonBatch, surface: Optional[pygame.Surface] = None):
+        colors = [self.settings.get_shape_color(shapes[i]) for i in batch.source]
+        self.draw_polygon_batch(batch, colors, outline_color=(0, 0, 0), surface=surface)
+
+    def draw_enemies(self, batch: PolygonBatch):
         """Draw enemy shapes."""
-        for enemy_data in enemies_intersections:
-            coords_2d = enemy_data['points_2d']
-            if len(coords_2d) >= 3:
-                try:
-                    hull = ConvexHull(coords_2d)
-                    hull_indices = hull.vertices
-                    polygon = [coords_2d[j] for j in hull_indices]
-                    
-                    # Convert to screen coordinates
-                    polygon_screen = [self._to_screen_coords(pt) for pt in polygon]
-                    
-                    # Draw solid red polygon without outline
-                    pygame.draw.polygon(self.screen, (255, 0, 0), polygon_screen, 0)
-                except:
-                    pass
-
-    def _draw_shape(self, coords_2d: List[Tuple[float, float]], edges: List[Tuple[int, int]], color: Tuple[int, int, int]):
-        """Helper method to draw shapes and enemies."""
-        # Convert to screen coordinates
-        screen_coords = [self._to_screen_coords(pt) for pt in coords_2d]
-        # Draw edges
-        for edge in edges:
-            start_idx, end_idx = edge
-            if start_idx < len(screen_coords) and end_idx < len(screen_coords):
-                pygame.draw.line(
-                    self.screen, color,
-                    screen_coords[start_idx],
-                    screen_coords[end_idx],
-                    2
-                )
-        # Optionally, fill the shape if it's closed
-        if len(screen_coords) >= 3:
-            try:
-                pygame.draw.polygon(self.screen, color, screen_coords, 0)
-            except:
-                pass
+        # Draw solid red polygons without outline
+        self.draw_polygon_batch(batch, [(255, 0, 0)] * len(batch))
+
+    def draw_polygon_batch(self, batch: PolygonBatch, colors: List[Tuple[int, int, int]],
+                           width: int = 0, outline_color: Optional[Tuple[int, int, int]] = None,
+                           surface: Optional[pygame.Surface] = None):
+        """
+        Draw pre-ordered polygons. All vertices are transformed to screen space at once
+        and polygons whose screen bounding box lies outside the window are skipped.
+        Two-point entries are drawn as line segments.
+        """
+        if not len(batch):
+            return
+        surface = surface or self.world
+        mark_dirty = surface is self.screen
+        screen_points = self._to_screen_array(batch.vertices)
+        starts = batch.offsets[:-1]
+        mins = np.minimum.reduceat(screen_points, starts, axis=0)
+        maxs = np.maximum.reduceat(screen_points, starts, axis=0)
+        screen_width, screen_height = surface.get_size()
+        visible = ((maxs[:, 0] >= 0) & (mins[:, 0] < screen_width) &
+                   (maxs[:, 1] >= 0) & (mins[:, 1] < screen_height))
 
-    def _draw_line_segment(self, pt1: Tuple[float, float], pt2: Tuple[float, float], 
-                          color: Tuple[int, int, int]):
-        screen_pt1 = self._to_screen_coords(pt1)
-        screen_pt2 = self._to_screen_coords(pt2)
-        pygame.draw.line(self.screen, color, screen_pt1, screen_pt2, 2)
+        for i in np.flatnonzero(visible):
+            polygon_screen = screen_points[batch.offsets[i]:batch.offsets[i + 1]].tolist()
+            if len(polygon_screen) == 2:
+                rect = pygame.draw.line(surface, colors[i], polygon_screen[0], polygon_screen[1], 2)
+            else:
+                rect = pygame.draw.polygon(surface, colors[i], polygon_screen, width)
+                if outline_color is not None:
+                    pygame.draw.polygon(surface, outline_color, polygon_screen, 1)
+            if mark_dirty:
+                self._mark_dirty(rect)
 
     def draw_debug_hulls(self, user_hull, shape_hulls):
         """Debug visualization of collision hulls"""
         # Draw user hull
         if user_hull:
             points = [self._to_screen_coords(p) for p in user_hull]
-            pygame.draw.polygon(self.screen, (0, 255, 0), points, 1)
+            pygame.draw.polygon(self.world, (0, 255, 0), points, 1)
         
         # Draw shape hulls
         for hull in shape_hulls:
             if hull:
                 points = [self._to_screen_coords(p) for p in hull]
-                pygame.draw.polygon(self.screen, (255, 0, 0), points, 1)
+                pygame.draw.polygon(self.world, (255, 0, 0), points, 1)
 
     def draw_origin_marker(self):
-        pygame.draw.circle(self.screen, self.settings.display.origin_color, 
-                         self.center_2D, 5)
+        self._mark_dirty(pygame.draw.circle(self.world, self.settings.display.origin_color, 
+                                            self.world_center, 5))
         
     def draw_user(self, is_jumping: bool, jump_direction: str = 'up'):
         if is_jumping:
@@ -143,39 +231,36 @@ class Renderer:
             sprite_name = 'player_stand'
             
         sprite = self.assets.get_sprite(sprite_name)
+        scaled_width = int(self.settings.movement.user_width_pixels * self.render_scale)
+        scaled_height = int(self.settings.movement.user_height_pixels * self.render_scale)
+        center = self.world_center
         if sprite:
-            scaled_width = self.settings.movement.user_width_pixels
-            scaled_height = self.settings.movement.user_height_pixels
-            scaled_sprite = pygame.transform.scale(sprite, (scaled_width, scaled_height))
+            scaled_sprite = self.assets.get_scaled_sprite(sprite_name, (scaled_width, scaled_height))
             
-            sprite_x = self.center_2D[0] - scaled_width // 2
-            sprite_y = self.center_2D[1] - scaled_height // 2
-            self.screen.blit(scaled_sprite, (sprite_x, sprite_y))
+            sprite_x = center[0] - scaled_width // 2
+            sprite_y = center[1] - scaled_height // 2
+            self._mark_dirty(self.world.blit(scaled_sprite, (sprite_x, sprite_y)))
         else:
             # Fallback to rectangle if sprite not found
-            rect_x = self.center_2D[0] - self.settings.movement.user_width_pixels // 2
-            rect_y = self.center_2D[1] - self.settings.movement.user_height_pixels // 2
-            pygame.draw.rect(self.screen, self.settings.display.user_color,
-                           (rect_x, rect_y, 
-                            self.settings.movement.user_width_pixels,
-                            self.settings.movement.user_height_pixels))
+            rect_x = center[0] - scaled_width // 2
+            rect_y = center[1] - scaled_height // 2
+            self._mark_dirty(pygame.draw.rect(self.world, self.settings.display.user_color,
+                                              (rect_x, rect_y, scaled_width, scaled_height)))
 
     def draw_status_text(self, user_pos: np.ndarray, plane_angle: float, points: int, min_distance_enemy = "N/A"):
-        coord_text = f"User Position: (X: {user_pos[0]:.2f}, Y: {user_pos[1]:.2f}, Z: {user_pos[2]:.2f})"
         angle_degrees = np.degrees(plane_angle) % 360
-        angle_text = f"Plane Angle: {angle_degrees:.1f}°"
-        points_text = f"Points: {int(points)}"
-        min_distance_text = f"Distance to Nearest Enemy: {min_distance_enemy}"
-
-        text_surface1 = self.font[8].render(coord_text, True, (255, 255, 255))
-        text_surface2 = self.font[8].render(angle_text, True, (255, 255, 255))
-        text_surface3 = self.font[8].render(points_text, True, (255, 255, 255))
-        text_surface4 = self.font[8].render(min_distance_text, True, (255, 255, 255))
+        text_surface1 = self.text.render_field(
+            'hud_position', 'pixel_8', "User Position: ",
+            f"(X: {user_pos[0]:.2f}, Y: {user_pos[1]:.2f}, Z: {user_pos[2]:.2f})")
+        text_surface2 = self.text.render_field('hud_angle', 'pixel_8', "Plane Angle: ", f"{angle_degrees:.1f}°")
+        text_surface3 = self.text.render_field('hud_points', 'pixel_8', "Points: ", f"{int(points)}")
+        text_surface4 = self.text.render_field(
+            'hud_enemy_distance', 'pixel_8', "Distance to Nearest Enemy: ", f"{min_distance_enemy}")
         
-        self.screen.blit(text_surface1, (10, 10))
-        self.screen.blit(text_surface2, (10, 20))
-        self.screen.blit(text_surface3, (10, 30))
-        self.screen.blit(text_surface4, (10, 40))
+        self._mark_dirty(self.screen.blit(text_surface1, (10, 10)))
+        self._mark_dirty(self.screen.blit(text_surface2, (10, 20)))
+        self._mark_dirty(self.screen.blit(text_surface3, (10, 30)))
+        self._mark_dirty(self.screen.blit(text_surface4, (10, 40)))
 
     def render_win_message(self):
         """Draw centered win message overlay and wait for input"""
@@ -185,53 +270,51 @@ class Renderer:
 
     def _render_win_message(self):
         """Draw centered win message overlay"""
+        self.invalidate()
         # Semi-transparent overlay
-        overlay = pygame.Surface(self.settings.display.window_size)
-        overlay.set_alpha(128)
-        overlay.fill((0, 0, 0))
+        overlay = self.assets.get_overlay(self.screen.get_size(), (0, 0, 0), 128)
         self.screen.blit(overlay, (0,0))
         
         # Win message
-        text = self.font[48].render("Level Complete!", True, (255, 215, 0))
+        text = self.text.render('pixel_48', "Level Complete!", (255, 215, 0))
         text_rect = text.get_rect(center=(self.settings.display.window_size[0]/2,
                                         self.settings.display.window_size[1]/2 - 50))
         self.screen.blit(text, text_rect)
         
         # Instruction to continue
-        continue_text = self.font[24].render("Press Space to Continue", True, (255, 255, 255))
+        continue_text = self.text.render('pixel_24', "Press Space to Continue", (255, 255, 255))
         continue_rect = continue_text.get_rect(center=(self.settings.display.window_size[0]/2,
                                                     self.settings.display.window_size[1]/2 + 20))
         self.screen.blit(continue_text, continue_rect)
 
     def render_elimination_message(self, points: int, is_high_score: bool):
         """Draw centered elimination message overlay and score info"""
+        self.invalidate()
         # Semi-transparent overlay
-        overlay = pygame.Surface(self.settings.display.window_size)
-        overlay.set_alpha(128)
-        overlay.fill((0, 0, 0))
+        overlay = self.assets.get_overlay(self.screen.get_size(), (0, 0, 0), 128)
         self.screen.blit(overlay, (0,0))
         
         # Elimination message
-        text = self.font[48].render("ELIMINATED", True, (255, 0, 0))
+        text = self.text.render('pixel_48', "ELIMINATED", (255, 0, 0))
         text_rect = text.get_rect(center=(self.settings.display.window_size[0]/2,
                                         self.settings.display.window_size[1]/2 - 80))
         self.screen.blit(text, text_rect)
         
         # Final score
-        score_text = self.font[24].render(f"Final Score: {int(points)}", True, (255, 255, 255))
+        score_text = self.text.render('pixel_24', f"Final Score: {int(points)}", (255, 255, 255))
         score_rect = score_text.get_rect(center=(self.settings.display.window_size[0]/2,
                                                self.settings.display.window_size[1]/2 - 20))
         self.screen.blit(score_text, score_rect)
 
         # High score message if applicable
         if is_high_score:
-            hs_text = self.font[24].render("NEW HIGH SCORE!", True, (255, 215, 0))
+            hs_text = self.text.render('pixel_24', "NEW HIGH SCORE!", (255, 215, 0))
             hs_rect = hs_text.get_rect(center=(self.settings.display.window_size[0]/2,
                                              self.settings.display.window_size[1]/2 + 20))
             self.screen.blit(hs_text, hs_rect)
         
         # Continue instruction
-        continue_text = self.font[24].render("Press Space to Continue", True, (255, 255, 255))
+        continue_text = self.text.render('pixel_24', "Press Space to Continue", (255, 255, 255))
         continue_rect = continue_text.get_rect(center=(self.settings.display.window_size[0]/2,
                                                     self.settings.display.window_size[1]/2 + 60))
         self.screen.blit(continue_text, continue_rect)
@@ -240,92 +323,180 @@ class Renderer:
 
     def render_ultimate_victory_message(self, total_score: int, is_high_score: bool):
         """Draw centered ultimate victory message overlay"""
+        self.invalidate()
         # Black overlay
-        overlay = pygame.Surface(self.settings.display.window_size)
-        overlay.fill((0, 0, 0))
+        overlay = self.assets.get_overlay(self.screen.get_size(), (0, 0, 0))
         self.screen.blit(overlay, (0,0))
         
         # Victory message
-        text = self.font[48].render("ULTIMATE VICTORY", True, (255, 215, 0))
+        text = self.text.render('pixel_48', "ULTIMATE VICTORY", (255, 215, 0))
         text_rect = text.get_rect(center=(self.settings.display.window_size[0]/2,
                                         self.settings.display.window_size[1]/2 - 100))
         self.screen.blit(text, text_rect)
         
         # Final score
-        score_text = self.font[24].render(f"Final Score: {int(total_score)}", True, (255, 255, 255))
+        score_text = self.text.render('pixel_24', f"Final Score: {int(total_score)}", (255, 255, 255))
         score_rect = score_text.get_rect(center=(self.settings.display.window_size[0]/2,
                                                self.settings.display.window_size[1]/2 - 20))
         self.screen.blit(score_text, score_rect)
 
         # High score message if applicable
         if is_high_score:
-            hs_text = self.font[24].render("NEW HIGH SCORE!", True, (255, 215, 0))
+            hs_text = self.text.render('pixel_24', "NEW HIGH SCORE!", (255, 215, 0))
             hs_rect = hs_text.get_rect(center=(self.settings.display.window_size[0]/2,
                                              self.settings.display.window_size[1]/2 + 20))
             self.screen.blit(hs_text, hs_rect)
         
         # Continue instruction
-        continue_text = self.font[24].render("Press Space to Continue", True, (255, 255, 255))
+        continue_text = self.text.render('pixel_24', "Press Space to Continue", (255, 255, 255))
         continue_rect = continue_text.get_rect(center=(self.settings.display.window_size[0]/2,
                                                     self.settings.display.window_size[1]/2 + 60))
         self.screen.blit(continue_text, continue_rect)
         
         self.update_display()
 
-    def draw_minimap(self, user_pos, enemies):
-        import numpy as np
-        minimap_width, minimap_height = 150, 150  # You can adjust these base dimensions
-        margin = 10
-        x_pos = self.settings.display.window_size[0] - minimap_width - margin
-        y_pos = margin
+    def draw_minimap(self, user_pos=None, enemies=None, geometry_version: int = 0):
+        """Blit the minimap, refreshing it first if a position and enemies are given"""
+        if user_pos is not None:
+            self.refresh_minimap(user_pos, enemies or [], geometry_version)
+        if self.minimap_surface is None:
+            return
+        minimap_width, minimap_height = self.MINIMAP_SIZE
+        x_pos = self.settings.display.window_size[0] - minimap_width - self.MINIMAP_MARGIN
+        y_pos = self.MINIMAP_MARGIN
+        self._mark_dirty(self.screen.blit(self.minimap_surface, (x_pos, y_pos)))
 
-        # Draw background with border
-        pygame.draw.rect(self.screen, (50, 50, 50), (x_pos, y_pos, minimap_width, minimap_height))
-        pygame.draw.rect(self.screen, (100, 100, 100), (x_pos, y_pos, minimap_width, minimap_height), 1)
+        # Draw zoom level indicator
+        zoom_text = self.text.render_field('minimap_zoom', 'pixel_8', "Zoom: ",
+                                           f"{self.settings.viewer.minimap_zoom:.1f}x")
+        self._mark_dirty(self.screen.blit(zoom_text, (x_pos + 5, y_pos + minimap_height + 5)))
+
+    def refresh_minimap(self, user_pos, enemies, geometry_version: int = 0):
+        """
+        Redraw the minimap surface around user_pos. geometry_version changes
+        whenever the level's shapes do (e.g. chunks streaming in or out).
+        """
+        minimap_width, minimap_height = self.MINIMAP_SIZE
+        if self.minimap_surface is None:
+            self.minimap_surface = pygame.Surface((minimap_width, minimap_height), 0, 32)
+        minimap = self.minimap_surface
+        minimap.fill((50, 50, 50))
         
-        center_x = x_pos + minimap_width // 2
-        center_y = y_pos + minimap_height // 2
+        center_x = minimap_width // 2
+        center_y = minimap_height // 2
         
         # Use the viewer's zoom level
         map_scale = 20.0 / self.settings.viewer.minimap_zoom  # Inverse relationship - higher zoom = smaller scale
+
+        # Top-down level geometry, positioned so the user sits at the center
+        layer, origin = self._get_minimap_layer(map_scale, geometry_version)
+        if layer is not None:
+            minimap.blit(layer, (int(center_x + (origin[0] - user_pos[0]) * map_scale),
+                                 int(center_y - (origin[1] - user_pos[1]) * map_scale)))
         
         # Draw user at center
-        pygame.draw.circle(self.screen, (0, 255, 0), (center_x, center_y), 5)
+        pygame.draw.circle(minimap, (0, 255, 0), (center_x, center_y), 5)
 
-        # Draw enemies with zoom factor
-        for enemy in enemies:
-            enemy_pos = np.array(enemy['position'])
-            user_array = np.array(user_pos)
-            relative = enemy_pos - user_array
-            
-            # Scale positions by zoom level
-            ex = int(center_x + relative[0] * map_scale)
-            ey = int(center_y - relative[1] * map_scale)
-            
-            # Only draw if within minimap bounds
-            if (x_pos <= ex <= x_pos + minimap_width and 
-                y_pos <= ey <= y_pos + minimap_height):
-                pygame.draw.circle(self.screen, (255, 0, 0), (ex, ey), 3)
+        # Draw enemies with zoom factor, all markers in one pass
+        if enemies:
+            positions = np.array([enemy['position'] for enemy in enemies], dtype=float)
+            relative = positions[:, :2] - np.asarray(user_pos, dtype=float)[:2]
+            ex = (center_x + relative[:, 0] * map_scale).astype(int)
+            ey = (center_y - relative[:, 1] * map_scale).astype(int)
+            inside = (ex >= 0) & (ex <= minimap_width) & (ey >= 0) & (ey <= minimap_height)
+            if inside.any():
+                xs = (ex[inside, None] + self.MINIMAP_MARKER[0]).ravel()
+                ys = (ey[inside, None] + self.MINIMAP_MARKER[1]).ravel()
+                on_map = (xs >= 0) & (xs < minimap_width) & (ys >= 0) & (ys < minimap_height)
+                pixels = pygame.surfarray.pixels3d(minimap)
+                pixels[xs[on_map], ys[on_map]] = (255, 0, 0)
+                del pixels  # Unlock the surface
 
-        # Draw zoom level indicator
-        zoom_text = self.font[8].render(f"Zoom: {self.settings.viewer.minimap_zoom:.1f}x", True, (255, 255, 255))
-        self.screen.blit(zoom_text, (x_pos + 5, y_pos + minimap_height + 5))
+        pygame.draw.rect(minimap, (100, 100, 100), (0, 0, minimap_width, minimap_height), 1)
+
+    def _get_minimap_layer(self, map_scale: float, geometry_version: int) -> Tuple[Optional[pygame.Surface], Tuple[float, float]]:
+        """
+        Rasterize a top-down projection of the level shapes once per geometry
+        version and zoom. Only the current version is kept for each zoom.
+        Returns the surface and the world (x, y) of its top-left corner.
+        """
+        cached = self.minimap_layers.get(map_scale)
+        if cached is not None and cached[0] == geometry_version:
+            return cached[1], cached[2]
+
+        footprints = []
+        for shape in self.settings.shapes:
+            if 'motion' in shape:
+                continue  # Moving shapes would leave a stale footprint
+            points = np.asarray(shape['points'], dtype=float)
+            if 'transform' in shape:
+                points = shape['transform'].apply(points)
+            if len(points):
+                footprints.append((points[:, 2].max(), points[:, :2], self.settings.get_shape_color(shape)))
+        if not footprints:
+            self.minimap_layers[map_scale] = (geometry_version, None, (0.0, 0.0))
+            return None, (0.0, 0.0)
+
+        all_points = np.concatenate([footprint[1] for footprint in footprints])
+        padding = 5
+        min_x, min_y = all_points.min(axis=0)
+        max_x, max_y = all_points.max(axis=0)
+        width = min(int((max_x - min_x) * map_scale) + 2 * padding, self.MINIMAP_LAYER_MAX_SIZE)
+        height = min(int((max_y - min_y) * map_scale) + 2 * padding, self.MINIMAP_LAYER_MAX_SIZE)
+        layer = pygame.Surface((width, height), pygame.SRCALPHA)
+
+        from scipy.spatial import ConvexHull
+        # Higher shapes are drawn last so they cover the ones below them
+        for _, points_xy, color in sorted(footprints, key=lambda footprint: footprint[0]):
+            pixels = np.empty(points_xy.shape, dtype=float)
+            pixels[:, 0] = (points_xy[:, 0] - min_x) * map_scale + padding
+            pixels[:, 1] = (max_y - points_xy[:, 1]) * map_scale + padding
+            try:
+                outline = pixels[ConvexHull(pixels).vertices].astype(int).tolist()
+                pygame.draw.polygon(layer, color, outline)
+            except Exception:
+                # Flat footprint (e.g. a vertical wall): draw its extent as a line
+                order = np.lexsort((pixels[:, 1], pixels[:, 0]))
+                pygame.draw.line(layer, color, pixels[order[0]].astype(int).tolist(),
+                                 pixels[order[-1]].astype(int).tolist(), 2)
+
+        origin = (min_x - padding / map_scale, max_y + padding / map_scale)
+        self.minimap_layers[map_scale] = (geometry_version, layer, origin)
+        return layer, origin
 
     def draw_level_info(self, level_name: str, level_number: int):
         """Draw level information in top-right corner"""
         text = f"Level {level_number}: {level_name}"
-        text_surface = self.font.render(text, True, (255, 255, 255))
+        text_surface = self.text.render('pixel_24', text, (255, 255, 255))
         text_rect = text_surface.get_rect(topright=(self.settings.display.window_size[0] - 10, 10))
         self.screen.blit(text_surface, text_rect)
 
     def _to_screen_coords(self, point: Tuple[float, float]) -> Tuple[int, int]:
+        """Map plane coordinates to pixels on the world layer"""
+        center = self.world_center
         return (
-            int(self.center_2D[0] + point[0] * self.settings.display.pixels_per_unit),
-            int(self.center_2D[1] - point[1] * self.settings.display.pixels_per_unit)
+            int(center[0] + point[0] * self.pixels_per_unit),
+            int(center[1] - point[1] * self.pixels_per_unit)
         )
 
+    def _to_screen_array(self, points: np.ndarray) -> np.ndarray:
+        """Vectorized _to_screen_coords for an (N, 2) array of plane coordinates"""
+        ppu = self.pixels_per_unit
+        center = self.world_center
+        screen_points = np.empty(points.shape, dtype=float)
+        screen_points[:, 0] = center[0] + points[:, 0] * ppu
+        screen_points[:, 1] = center[1] - points[:, 1] * ppu
+        return screen_points.astype(int)
+
     def update_display(self):
-        pygame.display.flip()
+        """Present the frame: changed regions only in dirty-rect mode, otherwise a full flip"""
+        if self.dirty_rect_presentation and not self.full_redraw:
+            pygame.display.update(self.dirty_rects)
+        else:
+            pygame.display.flip()
+        self.previous_dirty_rects = self.dirty_rects
+        self.dirty_rects = []
+        self.full_redraw = False
 
     def quit(self):
         pygame.quit()
\ No newline at end of file
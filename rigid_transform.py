@@ -0,0 +1,67 @@
+import numpy as np
+from dataclasses import dataclass
+from typing import Tuple
+
+@dataclass
+class RigidTransform:
+    """
+    Places a prototype shape in the world: a rotation of yaw radians about the
+    z axis, then a translation to position. Rotation is limited to yaw so the
+    slicing plane stays vertical in the shape's local frame.
+    """
+    position: np.ndarray
+    yaw: float = 0.0
+
+    def to_local(self, user_pos: np.ndarray, plane_angle: float) -> Tuple[np.ndarray, float]:
+        """
+        Move the slicing plane into the shape's frame. Slicing the prototype with
+        the returned pose gives the same 2D coordinates as slicing the placed shape.
+        """
+        cos_yaw, sin_yaw = np.cos(self.yaw), np.sin(self.yaw)
+        dx, dy, dz = np.asarray(user_pos, dtype=float) - self.position
+        local_pos = np.array([cos_yaw * dx + sin_yaw * dy, cos_yaw * dy - sin_yaw * dx, dz])
+        return local_pos, plane_angle - self.yaw
+
+    def apply(self, points: np.ndarray) -> np.ndarray:
+        """Local points to world points"""
+        points = np.asarray(points, dtype=float).reshape(-1, 3)
+        cos_yaw, sin_yaw = np.cos(self.yaw), np.sin(self.yaw)
+        world = np.empty_like(points)
+        world[:, 0] = cos_yaw * points[:, 0] - sin_yaw * points[:, 1] + self.position[0]
+        world[:, 1] = sin_yaw * points[:, 0] + cos_yaw * points[:, 1] + self.position[1]
+        world[:, 2] = points[:, 2] + self.position[2]
+        return world
+
+@dataclass
+class ShapeMotion:
+    """
+    Animates an instance's transform: it travels from its own position through
+    the path waypoints and back once per period, and spins about z at spin
+    radians per second.
+    """
+    waypoints: np.ndarray
+    period: float = 4.0
+    spin: float = 0.0
+    base_yaw: float = 0.0
+
+    @classmethod
+    def from_dict(cls, data: dict, transform: RigidTransform) -> 'ShapeMotion':
+        path = np.asarray(data.get('path', []), dtype=float).reshape(-1, 3)
+        return cls(
+            waypoints=np.vstack([transform.position, path]),
+            period=float(data.get('period', 4.0)),
+            spin=float(data.get('spin', 0.0)),
+            base_yaw=transform.yaw,
+        )
+
+    def update(self, transform: RigidTransform, time: float):
+        """Set transform to where the shape is time seconds into the level"""
+        legs = len(self.waypoints) - 1
+        if legs > 0 and self.period > 0:
+            phase = (time / self.period) % 1.0
+            # 0 -> legs on the way out, legs -> 0 on the way back
+            progress = (1.0 - abs(2.0 * phase - 1.0)) * legs
+            leg = min(int(progress), legs - 1)
+            start, end = self.waypoints[leg], self.waypoints[leg + 1]
+            transform.position = start + (end - start) * (progress - leg)
+        transform.yaw = self.base_yaw + self.spin * time
@@ -0,0 +1,58 @@
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List
+
+@dataclass
+class ScheduledTask:
+    name: str
+    callback: Callable[[], None]
+    interval: int       # Run every `interval` frames
+    priority: int       # Lower runs first; priority 0 is never deferred
+    next_frame: int = 0
+    runs: int = 0
+    deferred: int = 0
+
+class FrameScheduler:
+    """
+    Runs game subsystems at declared rates. Tasks with the same rate are
+    staggered across frames, run in priority order, and once the update budget
+    for the frame is spent, the remaining low-priority tasks are deferred to a
+    later frame. Priority 0 tasks (physics, enemy motion) always run.
+    """
+    def __init__(self, frame_rate: int = 60, budget_ms: float = None):
+        self.frame_rate = frame_rate
+        # By default leave half of the frame for rendering and presentation
+        self.budget_ms = budget_ms if budget_ms is not None else 500 / frame_rate
+        self.tasks: List[ScheduledTask] = []
+        self.frame = 0
+
+    def add_task(self, name: str, callback: Callable[[], None], rate_hz: float, priority: int):
+        interval = max(1, round(self.frame_rate / rate_hz))
+        # Offset the first run so tasks sharing a rate land on different frames
+        phase = sum(1 for task in self.tasks if task.interval == interval) % interval
+        self.tasks.append(ScheduledTask(name, callback, interval, priority, next_frame=phase))
+        self.tasks.sort(key=lambda task: task.priority)
+
+    def get_task(self, name: str) -> ScheduledTask:
+        return next(task for task in self.tasks if task.name == name)
+
+    def run_frame(self):
+        """Run the tasks due this frame, deferring low-priority ones once over budget"""
+        start = time.perf_counter()
+        for task in self.tasks:
+            if self.frame < task.next_frame:
+                continue
+            over_budget = (time.perf_counter() - start) * 1000 > self.budget_ms
+            # A task is deferred by at most one interval, so it degrades to half rate instead of starving
+            starving = self.frame - task.next_frame >= task.interval
+            if task.priority > 0 and over_budget and not starving:
+                # Still due, so it is retried next frame
+                task.deferred += 1
+                continue
+            task.callback()
+            task.runs += 1
+            task.next_frame = self.frame + task.interval
+        self.frame += 1
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        return {task.name: {'runs': task.runs, 'deferred': task.deferred} for task in self.tasks}
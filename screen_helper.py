@@ -1,9 +1,19 @@
 import pygame
+from typing import Tuple
 
 class ScreenHelper:
-    def __init__(self):
-        self.windowed_size = (800, 600)
+    """Owns the game window for the whole session, so fullscreen state survives level changes"""
+    def __init__(self, windowed_size: Tuple[int, int] = (800, 600)):
+        self.windowed_size = windowed_size
         self.is_fullscreen = False
+        self.screen = None
+
+    def open(self) -> pygame.Surface:
+        """Create the window, reusing it if one is already open"""
+        self.screen = pygame.display.get_surface()
+        if self.screen is None:
+            self.screen = pygame.display.set_mode(self.windowed_size, pygame.RESIZABLE)
+        return self.screen
         
     def toggle_fullscreen(self):
         if self.is_fullscreen:
@@ -11,4 +21,5 @@ class ScreenHelper:
         else:
             screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
         self.is_fullscreen = not self.is_fullscreen
-        return screen
\ No newline at end of file
+        self.screen = screen
+        return screen
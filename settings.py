@@ -58,7 +58,6 @@ class GameplaySettings:
     debug_mode: bool = True
 
     def __init__(self, settings_dict: dict = None):
-        print("SETTINGS DICT", settings_dict)
         object.__setattr__(self, 'points_decrease_rate', 
                           float(settings_dict.get('points_decrease_rate', 1.0)) if settings_dict else 1.0)
         object.__setattr__(self, 'points',   # TODO NOT WORKING
@@ -71,9 +70,10 @@ class ViewerSettings:
     MAX_ZOOM: float = 5.0
 
 class Settings:
-    def __init__(self, config_path: str):
+    def __init__(self, config_path: str, config_data: Optional[dict] = None):
         self.config_path = config_path
-        self.config_data = self._load_config()
+        # config_data comes from the level compiler when the level was loaded through it
+        self.config_data = config_data if config_data is not None else self._load_config()
         self.display = self._init_display_settings()
         self.gameplay = GameplaySettings(self.config_data.get('settings', {}))
         self.movement = MovementSettings()
@@ -0,0 +1,87 @@
+import numpy as np
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+from geometry import PolygonBatch
+
+class SliceCache:
+    """
+    LRU memo of static level slices, for players who rock back and forth
+    between a few plane angles. Entries are keyed on the quantized plane angle,
+    the quantized plane offset (user_pos along the plane normal) and a geometry
+    version that the caller bumps whenever the level's shapes change.
+
+    Moving within the plane only shifts a slice, so batches are stored in
+    plane-absolute coordinates and shifted back to the player on lookup. Only
+    static shapes belong here; moving shapes and enemies are sliced every frame.
+    """
+    # Fine enough that a hit is off by far less than a pixel
+    ANGLE_STEP = 1e-6
+    OFFSET_STEP = 1e-6
+    # Rough per-entry cost of the key, the dict slot and the batch objects
+    ENTRY_OVERHEAD = 512
+
+    def __init__(self, budget_bytes: int):
+        self.budget_bytes = budget_bytes
+        self.entries: OrderedDict = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _key(self, user_pos: np.ndarray, plane_angle: float, version: int) -> tuple:
+        normal = np.array([np.cos(plane_angle), np.sin(plane_angle)])
+        offset = float(np.dot(np.asarray(user_pos, dtype=float)[:2], normal))
+        return (round(plane_angle / self.ANGLE_STEP), round(offset / self.OFFSET_STEP), version)
+
+    @staticmethod
+    def _origin(user_pos: np.ndarray, plane_angle: float) -> np.ndarray:
+        """Where user_pos lies in the slicing plane's own (X, Z) coordinates"""
+        user_pos = np.asarray(user_pos, dtype=float)
+        return np.array([-np.sin(plane_angle) * user_pos[0] + np.cos(plane_angle) * user_pos[1], user_pos[2]])
+
+    @staticmethod
+    def _shift(batch: PolygonBatch, delta: np.ndarray) -> PolygonBatch:
+        return PolygonBatch(vertices=batch.vertices + delta, offsets=batch.offsets, source=batch.source)
+
+    def get(self, user_pos: np.ndarray, plane_angle: float, version: int) -> Optional[Tuple[PolygonBatch, ...]]:
+        """The cached batches for this pose, relative to user_pos, or None"""
+        key = self._key(user_pos, plane_angle, version)
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        origin = self._origin(user_pos, plane_angle)
+        return tuple(self._shift(batch, -origin) for batch in entry[0])
+
+    def put(self, user_pos: np.ndarray, plane_angle: float, version: int, batches: Tuple[PolygonBatch, ...]):
+        key = self._key(user_pos, plane_angle, version)
+        origin = self._origin(user_pos, plane_angle)
+        stored = tuple(self._shift(batch, origin) for batch in batches)
+        size = self.ENTRY_OVERHEAD + sum(
+            batch.vertices.nbytes + batch.offsets.nbytes + batch.source.nbytes for batch in stored)
+        if size > self.budget_bytes:
+            return
+        if key in self.entries:
+            self.bytes -= self.entries.pop(key)[1]
+        self.entries[key] = (stored, size)
+        self.bytes += size
+        while self.bytes > self.budget_bytes:
+            _, (_, evicted_size) = self.entries.popitem(last=False)
+            self.bytes -= evicted_size
+            self.evictions += 1
+
+    def clear(self):
+        self.entries.clear()
+        self.bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions,
+                'entries': len(self.entries), 'bytes': self.bytes}
+
+    def report(self) -> str:
+        lookups = self.hits + self.misses
+        rate = 100.0 * self.hits / lookups if lookups else 0.0
+        return (f"Slice cache: {self.hits}/{lookups} hits ({rate:.0f}%), {len(self.entries)} entries, "
+                f"{self.bytes / 1024:.0f} KB, {self.evictions} evicted")
@@ -0,0 +1,46 @@
+"""
+Measures time-to-menu by launching the game in benchmark mode several times
+and fails (exit code 1) if the median exceeds the budget.
+
+Usage: python startup_benchmark.py [budget_ms] [runs]
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+DEFAULT_BUDGET_MS = 1500
+DEFAULT_RUNS = 5
+
+def measure_startup() -> dict:
+    root = os.path.dirname(os.path.abspath(__file__))
+    env = dict(os.environ, STARTUP_BENCHMARK='1')
+    env.setdefault('GAME_ROOT', root)
+    # Run without a real window or audio device so the numbers are comparable across machines
+    env.setdefault('SDL_VIDEODRIVER', 'dummy')
+    env.setdefault('SDL_AUDIODRIVER', 'dummy')
+    result = subprocess.run([sys.executable, os.path.join(root, 'main.py')], env=env,
+                            capture_output=True, text=True, timeout=60)
+    for line in result.stdout.splitlines():
+        if line.startswith('STARTUP '):
+            return json.loads(line[len('STARTUP '):])
+    raise RuntimeError(f"Game did not report startup timings:\n{result.stdout}{result.stderr}")
+
+def main():
+    budget_ms = float(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_BUDGET_MS
+    runs = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_RUNS
+
+    samples = [measure_startup() for _ in range(runs)]
+    for phase in samples[0]['phases']:
+        print(f"{phase:<14}{statistics.median(s['phases'][phase] for s in samples):8.1f} ms")
+    time_to_menu = statistics.median(s['milestones']['time to menu'] for s in samples)
+    print(f"{'time to menu':<14}{time_to_menu:8.1f} ms (median of {runs}, budget {budget_ms:.0f} ms)")
+
+    if time_to_menu > budget_ms:
+        print("FAIL: time to menu is over budget")
+        sys.exit(1)
+    print("OK")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+import os
+import time
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+class StartupTimer:
+    """
+    Breaks startup down into phases (imports, asset load, level parse, first
+    frame, ...). Set STARTUP_REPORT=1 to print the breakdown once the first
+    frame of gameplay is on screen.
+    """
+    def __init__(self, start: Optional[float] = None):
+        # perf_counter() taken before the first heavy import, if the caller has one
+        self.start = start if start is not None else time.perf_counter()
+        self.phases: Dict[str, float] = {}
+        self.milestones: Dict[str, float] = {}
+        self.enabled = bool(os.getenv('STARTUP_REPORT'))
+        self.reported = False
+
+    @contextmanager
+    def phase(self, name: str):
+        """Time a block. Only the first run of each phase counts."""
+        began = time.perf_counter()
+        yield
+        self.record(name, began)
+
+    def record(self, name: str, began: float):
+        if name not in self.phases:
+            self.phases[name] = (time.perf_counter() - began) * 1000
+
+    def milestone(self, name: str):
+        """Note the time since startup, e.g. when the menu first appears"""
+        if name not in self.milestones:
+            self.milestones[name] = (time.perf_counter() - self.start) * 1000
+
+    def as_dict(self) -> Dict[str, Dict[str, float]]:
+        return {'phases': dict(self.phases), 'milestones': dict(self.milestones)}
+
+    def report(self) -> str:
+        lines = ["Startup:"]
+        lines += [f"  {name:<14}{ms:8.1f} ms" for name, ms in self.phases.items()]
+        lines += [f"  {name:<14}{ms:8.1f} ms since launch" for name, ms in self.milestones.items()]
+        return "\n".join(lines)
+
+    def print_report(self):
+        if self.enabled and not self.reported:
+            print(self.report())
+            self.reported = True
@@ -0,0 +1,49 @@
+import os
+import random
+import pytest
+from asset_pack import AssetPack
+
+def _write_tree(root, rng):
+    files = {}
+    for i in range(rng.randint(1, 40)):
+        name = f"dir{rng.randint(0, 3)}/file{i}.bin"
+        data = rng.randbytes(rng.choice([0, 1, 63, 64, 65, rng.randint(0, 5000)]))
+        path = os.path.join(root, *name.split('/'))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(data)
+        files[name] = data
+    return files
+
+def test_round_trip_random_trees(tmp_path):
+    rng = random.Random(1234)
+    for tree in range(200):
+        root = tmp_path / f"assets{tree}"
+        files = _write_tree(str(root), rng)
+        pack_path = str(tmp_path / f"assets{tree}.pak")
+        assert AssetPack.build(str(root), pack_path) == len(files)
+        pack = AssetPack(pack_path)
+        for name, data in files.items():
+            assert name in pack
+            assert pack.open(name).read() == data, (tree, name)
+        for offset, _ in pack.index.values():
+            assert offset % AssetPack.ALIGNMENT == 0
+
+def test_packed_file_seeks(tmp_path):
+    root = tmp_path / "assets"
+    root.mkdir()
+    (root / "a.txt").write_bytes(b"0123456789")
+    pack_path = str(tmp_path / "assets.pak")
+    AssetPack.build(str(root), pack_path)
+    file = AssetPack(pack_path).open("a.txt")
+    file.seek(-3, os.SEEK_END)
+    assert file.read() == b"789"
+    file.seek(2)
+    assert file.read(3) == b"234"
+    assert AssetPack(pack_path).open("missing.txt") is None
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "not_a_pack.pak"
+    path.write_bytes(b"\0" * 64)
+    with pytest.raises(ValueError):
+        AssetPack(str(path))
@@ -0,0 +1,42 @@
+import json
+import threading
+import time
+from high_score_manager import HighScoreManager
+
+def test_best_score_does_not_wait_for_queued_writes(tmp_path):
+    manager = HighScoreManager(str(tmp_path / 'leaderboard.db'))
+    # Hold the writer thread so every write after this stays queued
+    release = threading.Event()
+    manager.queue.put(lambda store: release.wait())
+    started = time.perf_counter()
+    manager.add_score('ana', 120)
+    manager.add_score('ana', 80)
+    assert manager.get_best_score('ana') == 120
+    assert manager.get_best_score('nobody') == 0
+    assert time.perf_counter() - started < 0.5
+    release.set()
+    manager.save_high_scores()
+    assert manager.get_top_scores() == [('ana', 120)]
+    assert [run.score for run in manager.get_history('ana')] == [80, 120]
+
+def test_runs_keep_their_level_results(tmp_path):
+    manager = HighScoreManager(str(tmp_path / 'leaderboard.db'))
+    manager.start_run()
+    manager.record_level(1, 90, 12.5)
+    manager.record_level(2, 70, 30.0)
+    manager.add_score('ana', 160, completed=True)
+    manager.start_run()
+    manager.record_level(1, 95, 10.0)
+    manager.start_run()  # Abandoned: its level result is dropped
+    manager.add_score('ben', 0)
+    assert manager.get_level_scores(1) == [('ana', 90, 12.5)]
+    history = manager.get_history('ana')
+    assert [(run.levels, run.completed) for run in history] == [(2, True)]
+    assert manager.get_history('ben')[0].levels == 0
+
+def test_old_high_scores_are_imported(tmp_path):
+    (tmp_path / 'high_scores.json').write_text(json.dumps({'ana': 300, 'ben': 50}))
+    (tmp_path / 'high_scores.journal').write_text('{"user": "ben", "score": 75}\n{"user": "ca')
+    manager = HighScoreManager(str(tmp_path / 'leaderboard.db'))
+    assert manager.get_best_score('ana') == 300
+    assert manager.get_top_scores() == [('ana', 300), ('ben', 75)]
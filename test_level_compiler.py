@@ -0,0 +1,65 @@
+import os
+import tempfile
+import numpy as np
+import pytest
+from geometry import GeometryHelper
+from level_compiler import LevelCompiler
+from settings import Settings
+
+LEVELS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'levels')
+
+CUBE_POINTS = np.array([[x, y, z] for z in (0, 1) for y in (0, 1) for x in (0, 1)], dtype=float)
+CUBE_EDGES = np.array([[0, 1], [2, 3], [4, 5], [6, 7],
+                       [0, 2], [1, 3], [4, 6], [5, 7],
+                       [0, 4], [1, 5], [2, 6], [3, 7]])
+
+def test_cube_gets_one_plane_per_face():
+    planes = LevelCompiler._face_planes(CUBE_POINTS, CUBE_EDGES)
+    assert len(planes) == 6
+    # Corners are on the boundary, the center is inside
+    assert np.all(planes[:, :3] @ [0.5, 0.5, 0.5] + planes[:, 3] < 0)
+
+def test_face_diagonals_do_not_change_the_planes():
+    edges = np.vstack([CUBE_EDGES, [[0, 3], [4, 7]]])
+    assert len(LevelCompiler._face_planes(CUBE_POINTS, edges)) == 6
+
+def test_missing_hull_edge_keeps_slice_collision():
+    assert len(LevelCompiler._face_planes(CUBE_POINTS, CUBE_EDGES[:-1])) == 0
+
+def test_edge_split_at_a_point_along_it_still_counts():
+    points = np.vstack([CUBE_POINTS, [[0, 0, 0.5]]])
+    edges = np.vstack([[edge for edge in CUBE_EDGES.tolist() if edge != [0, 4]], [[0, 8], [8, 4]]])
+    assert len(LevelCompiler._face_planes(points, edges)) == 6
+
+def test_repeated_points_are_one_vertex():
+    points = np.vstack([CUBE_POINTS, [CUBE_POINTS[7]]])
+    edges = np.vstack([CUBE_EDGES, [[7, 8]]])
+    assert len(LevelCompiler._face_planes(points, edges)) == 6
+
+def test_flat_shape_gets_a_slab_only_if_its_outline_is_drawn():
+    square = np.array([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]], dtype=float)
+    outline = np.array([[0, 1], [1, 2], [2, 3], [3, 0]])
+    assert len(LevelCompiler._face_planes(square, outline)) == 6
+    assert len(LevelCompiler._face_planes(square, outline[:3])) == 0
+
+@pytest.mark.parametrize('level', [1, 2, 3, 4])
+def test_plane_collisions_match_the_drawn_slices(level, monkeypatch):
+    monkeypatch.setenv('GAME_ROOT', os.path.dirname(LEVELS_DIR))
+    path = os.path.join(LEVELS_DIR, f"{level}.json")
+    settings = Settings(path, LevelCompiler(tempfile.mkdtemp()).load(path))
+    rng = np.random.default_rng(level)
+    for _ in range(300):
+        near = settings.shapes[rng.integers(len(settings.shapes))]['bounds']
+        user_pos = rng.uniform(np.asarray(near[0]) - 1, np.asarray(near[1]) + 1)
+        plane_angle = rng.uniform(0, 2 * np.pi)
+        user_shape = GeometryHelper.get_user_convex_hull(user_pos, plane_angle, settings)
+        half_width, half_height = user_shape[2]
+        for shape in settings.shapes:
+            if shape.get('triangles') is not None or not len(shape['planes']):
+                continue
+            local_pos, local_angle = GeometryHelper.local_pose(shape, user_pos, plane_angle)
+            by_planes = GeometryHelper.check_halfspace_collision(
+                shape['planes'], local_pos, local_angle, half_width, half_height)
+            by_slice = GeometryHelper.check_collision(
+                user_shape, GeometryHelper.get_convex_hull(shape, user_pos, plane_angle))
+            assert by_planes == by_slice, (shape.get('name'), user_pos, plane_angle)
@@ -0,0 +1,92 @@
+import pygame
+from typing import Callable, Tuple
+
+class GlyphAtlas:
+    """Pre-rendered glyphs for one font and color, used to compose changing numbers"""
+    CHARSET = "0123456789.,-+:%()/° xXYZNA"
+
+    def __init__(self, font: pygame.font.Font, color: Tuple[int, int, int], charset: str = CHARSET):
+        self.height = font.get_height()
+        self.glyphs = {}
+        glyph_surfaces = [font.render(ch, True, color) for ch in charset]
+        width = sum(surface.get_width() for surface in glyph_surfaces)
+        self.surface = pygame.Surface((max(width, 1), self.height), pygame.SRCALPHA)
+        x = 0
+        for ch, glyph in zip(charset, glyph_surfaces):
+            self.surface.blit(glyph, (x, 0), special_flags=pygame.BLEND_RGBA_MAX)
+            self.glyphs[ch] = pygame.Rect(x, 0, glyph.get_width(), self.height)
+            x += glyph.get_width()
+
+    def can_compose(self, text: str) -> bool:
+        return all(ch in self.glyphs for ch in text)
+
+    def compose(self, text: str) -> pygame.Surface:
+        """Build a text surface by blitting glyphs out of the atlas"""
+        width = sum(self.glyphs[ch].width for ch in text)
+        surface = pygame.Surface((max(width, 1), self.height), pygame.SRCALPHA)
+        x = 0
+        for ch in text:
+            area = self.glyphs[ch]
+            # Glyph rects never overlap, so copy pixels instead of alpha blending them
+            surface.blit(self.surface, (x, 0), area, special_flags=pygame.BLEND_RGBA_MAX)
+            x += area.width
+        return surface
+
+class TextCache:
+    """
+    Caches rendered text per font. Static strings are rasterized once and
+    numeric fields are composed from a per-font glyph atlas (built the first
+    time the font is used), only when the displayed string changes.
+    """
+    MAX_SURFACES = 512
+
+    def __init__(self, get_font: Callable[[str], pygame.font.Font]):
+        # Fonts are looked up through the asset manager, which may still be loading them
+        self.get_font = get_font
+        self.surfaces = {}
+        self.atlases = {}
+        self.fields = {}
+
+    def _get_atlas(self, font_name: str, color: Tuple[int, int, int]) -> GlyphAtlas:
+        key = (font_name, color)
+        if key not in self.atlases:
+            self.atlases[key] = GlyphAtlas(self.get_font(font_name), color)
+        return self.atlases[key]
+
+    def render(self, font_name: str, text: str, color: Tuple[int, int, int] = (255, 255, 255)) -> pygame.Surface:
+        """Return a cached surface for a whole string, rendering it on first use"""
+        key = (font_name, text, color)
+        surface = self.surfaces.get(key)
+        if surface is None:
+            if len(self.surfaces) >= self.MAX_SURFACES:
+                # Drop the oldest entry; dicts keep insertion order
+                self.surfaces.pop(next(iter(self.surfaces)))
+            surface = self.get_font(font_name).render(text, True, color)
+            self.surfaces[key] = surface
+        return surface
+
+    def render_field(self, slot: str, font_name: str, label: str, value: str,
+                     color: Tuple[int, int, int] = (255, 255, 255)) -> pygame.Surface:
+        """
+        Return a surface for label + value drawn in the given slot. The label is
+        cached as a static string and the value is composed from the glyph atlas.
+        """
+        key = (font_name, label, value, color)
+        cached = self.fields.get(slot)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        label_surface = self.render(font_name, label, color)
+        atlas = self._get_atlas(font_name, color)
+        if atlas.can_compose(value):
+            value_surface = atlas.compose(value)
+        else:
+            value_surface = self.get_font(font_name).render(value, True, color)
+
+        width = label_surface.get_width() + value_surface.get_width()
+        height = max(label_surface.get_height(), value_surface.get_height())
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        surface.blit(label_surface, (0, 0), special_flags=pygame.BLEND_RGBA_MAX)
+        surface.blit(value_surface, (label_surface.get_width(), 0), special_flags=pygame.BLEND_RGBA_MAX)
+        self.fields[slot] = (key, surface)
+        return surface
@@ -3,32 +3,50 @@ import pygame
 from pygame.locals import *
 from settings import Settings, ViewerSettings
 from geometry import GeometryHelper
+from mesh_slicer import MeshSlicer
 from renderer import Renderer
 from level_manager import LevelManager, GameState
 from menu_manager import MenuManager
 from asset_manager import AssetManager
 from high_score_manager import HighScoreManager
 from options_manager import OptionsManager
+from scheduler import FrameScheduler
+from level_loader import SpawnSlice
+from chunk_streamer import ChunkStreamer
+from rigid_transform import RigidTransform
+from slice_cache import SliceCache
+from input_state import InputState
+from event_helper import EventHelper
 import sys
 from math import pi
 
 class GameViewer:
-    def __init__(self, settings: Settings, level_manager: LevelManager, assets: AssetManager, username: str, high_score_manager: HighScoreManager, total_score: int, options_manager: OptionsManager):
+    # Enemy steering runs at this rate; positions are interpolated in between
+    ENEMY_AI_RATE = 20
+    MOVEMENT_KEYS = (K_w, K_s, K_a, K_d, K_SPACE)
+    # Held to rotate the plane smoothly
+    ROTATE_RIGHT_KEY = K_i
+    ROTATE_LEFT_KEY = K_o
+
+    def __init__(self, settings: Settings, level_manager: LevelManager, assets: AssetManager, username: str, high_score_manager: HighScoreManager, total_score: int, options_manager: OptionsManager, renderer: Renderer = None, spawn_slice: SpawnSlice = None, streamer: ChunkStreamer = None):
         self.settings = settings
         self.level_manager = level_manager
-        self.renderer = Renderer(settings, assets)
+        # Reuse the session's renderer across levels when one is given
+        if renderer is None:
+            renderer = Renderer(settings, assets)
+        else:
+            renderer.load_level(settings)
+        self.renderer = renderer
+        self.renderer.dirty_rect_presentation = options_manager.options.get('dirty_rect_presentation', False)
+        self.renderer.dynamic_resolution = options_manager.options.get('dynamic_resolution', True)
         self.geometry = GeometryHelper()
 
-        # Initialize enemies
+        # Initialize enemies. Each one is an instance of a cube prototype of its size.
         self.enemies = []
-        for enemy_data in settings.enemies:
-            enemy = {
-                'position': np.array(enemy_data['position'], dtype=float),
-                'size': enemy_data.get('size', 1.0),
-                'speed': enemy_data.get('speed', 0.1),
-                'shape': self._create_enemy_shape(enemy_data)
-            }
-            self.enemies.append(enemy)
+        self.enemy_prototypes = {}
+        self._add_enemies(settings.enemies)
+        # Chunked levels stream shapes and enemy spawns in as the player moves
+        self.streamer = streamer
 
         self.username = username
         self.high_score_manager = high_score_manager
@@ -44,14 +62,8 @@ class GameViewer:
         self.plane_angle = 0.0
         self.velocity = np.array([0.0, 0.0, 0.0], dtype=float)
         
-        # Movement tracking
-        self.keys_pressed = {
-            K_w: False,
-            K_s: False,
-            K_a: False,
-            K_d: False,
-            K_SPACE: False,
-        }
+        # Movement tracking. Held keys and wheel ticks are gathered per frame.
+        self.input = InputState(self.MOVEMENT_KEYS + (self.ROTATE_RIGHT_KEY, self.ROTATE_LEFT_KEY))
         self.ground_contact = False
         self.last_jump_time = 0
         self.is_jumping = False
@@ -59,13 +71,27 @@ class GameViewer:
         
         # Clock for consistent framerate
         self.clock = pygame.time.Clock()
+        # Called once the first frame is on screen (used for startup timing)
+        self.on_first_frame = None
         
-        # Compute initial intersections
-        self._compute_all_intersections()
-
         self.level_complete = False
         self.spawn_position = np.array(settings.gameplay.spawn_position, dtype=float)
         self.user_pos = self.spawn_position.copy()
+
+        # Compute initial intersections at the spawn point, unless the level loader
+        # already sliced it. slice_version identifies the current static slice so
+        # the renderer can reuse its cached layer.
+        self.slice_pose = None
+        self.slice_version = 0
+        # Bumped whenever settings.shapes changes, so cached slices of old geometry never match
+        self.geometry_version = 0
+        self.slice_cache = None
+        if options_manager.options.get('slice_cache', False):
+            self.slice_cache = SliceCache(int(options_manager.options.get('slice_cache_mb', 16) * 1024 * 1024))
+        self._find_dynamic_shapes()
+        if spawn_slice is not None and spawn_slice.pose == self._slice_pose():
+            self._set_shape_slice(spawn_slice.pose, spawn_slice.coords_2d, spawn_slice.edges)
+        self._compute_all_intersections()
         self.target_pulse_time = 0
 
         self.total_score = total_score
@@ -76,38 +102,72 @@ class GameViewer:
         self.alarm_playing = False
         self.alarm_distance = 2.0  # Distance threshold for alarm
 
-        self.rotating_left = False
-        self.rotating_right = False
         self.rotation_speed = pi / 6
 
+        # Subsystems run at their own rates. Physics and enemy motion run every
+        # frame; under load the minimap and HUD are the first to be deferred.
+        self.scheduler = FrameScheduler()
+        self.scheduler.add_task('physics', self._update_player, 60, 0)
+        self.scheduler.add_task('enemy_motion', self._update_enemy_motion, 60, 0)
+        self.scheduler.add_task('platforms', self._update_platforms, 60, 0)
+        self.scheduler.add_task('enemy_ai', self._update_enemies, self.ENEMY_AI_RATE, 1)
+        self.scheduler.add_task('enemy_distance', self._update_enemy_distance, 10, 2)
+        self.scheduler.add_task('target_pulse', self._update_target_pulse, 30, 3)
+        self.scheduler.add_task('hud', self._update_hud, 15, 4)
+        self.scheduler.add_task('minimap', self._update_minimap, 15, 5)
+        if self.streamer is not None:
+            self.scheduler.add_task('streaming', self._update_streaming, 10, 2)
+        self.enemy_ai_frame = 0
+        self.min_distance_enemy = "N/A"
+        self._update_hud()
+
+
+    def _add_enemies(self, enemies: list):
+        for enemy_data in enemies:
+            enemy = {
+                'position': np.array(enemy_data['position'], dtype=float),
+                'ai_from': np.array(enemy_data['position'], dtype=float),
+                'ai_to': np.array(enemy_data['position'], dtype=float),
+                'size': enemy_data.get('size', 1.0),
+                'speed': enemy_data.get('speed', 0.1),
+                'shape': self._create_enemy_shape(enemy_data)
+            }
+            self.enemies.append(enemy)
 
     def _create_enemy_shape(self, enemy_data: dict) -> dict:
-        """Create a cube shape for the enemy."""
-        size = enemy_data.get('size', 1.0)
-        half_size = size / 2.0
-        px, py, pz = enemy_data['position']
-        points = [
-            [px - half_size, py - half_size, pz - half_size],
-            [px + half_size, py - half_size, pz - half_size],
-            [px + half_size, py + half_size, pz - half_size],
-            [px - half_size, py + half_size, pz - half_size],
-            [px - half_size, py - half_size, pz + half_size],
-            [px + half_size, py - half_size, pz + half_size],
-            [px + half_size, py + half_size, pz + half_size],
-            [px - half_size, py + half_size, pz + half_size],
-        ]
-        edges = [
-            [0, 1], [1, 2], [2, 3], [3, 0],
-            [4, 5], [5, 6], [6, 7], [7, 4],
-            [0, 4], [1, 5], [2, 6], [3, 7],
-        ]
+        """Create a cube shape for the enemy, placed at its position."""
+        prototype = self._get_enemy_prototype(enemy_data.get('size', 1.0))
         return {
             'name': 'Enemy',
-            'points': points,
-            'edges': edges,
+            'prototype': prototype,
+            'points': prototype['points'],
+            'edges': prototype['edges'],
+            'bounds': prototype['bounds'],
+            'transform': RigidTransform(np.array(enemy_data['position'], dtype=float)),
             'color': {'r': 1.0, 'g': 0.0, 'b': 0.0},  # Red color
             'is_enemy': True  # Mark as enemy
         }
+
+    def _get_enemy_prototype(self, size: float) -> dict:
+        """A cube of the given size centered on the origin, shared by all enemies of that size."""
+        if size not in self.enemy_prototypes:
+            half_size = size / 2.0
+            points = np.array([
+                [-1, -1, -1], [1, -1, -1], [1, 1, -1], [-1, 1, -1],
+                [-1, -1, 1], [1, -1, 1], [1, 1, 1], [-1, 1, 1],
+            ], dtype=float) * half_size
+            edges = np.array([
+                [0, 1], [1, 2], [2, 3], [3, 0],
+                [4, 5], [5, 6], [6, 7], [7, 4],
+                [0, 4], [1, 5], [2, 6], [3, 7],
+            ], dtype=np.int32)
+            self.enemy_prototypes[size] = {
+                'name': 'Enemy',
+                'points': points,
+                'edges': edges,
+                'bounds': np.array([points.min(axis=0), points.max(axis=0)]),
+            }
+        return self.enemy_prototypes[size]
                 
     def _check_fall_condition(self):
         """Check if player has fallen below threshold"""
@@ -122,23 +182,22 @@ class GameViewer:
         self.assets.play_sound('elimination')
         
         # Check if this is a high score -- note this has to be 0 points, so just refer to total_score in elim case
-        current_high_score = self.high_score_manager.high_scores.get(self.username, 0)
+        current_high_score = self.high_score_manager.get_best_score(self.username)
         is_high_score = self.total_score > current_high_score
         
         self.renderer.render_elimination_message(self.total_score, is_high_score)
         self.high_score_manager.add_score(self.username, self.total_score)
         
-        # Wait for space key
+        # Wait for space key. The message is already on screen, so just sleep until input.
         waiting = True
         while waiting:
-            for event in pygame.event.get():
+            for event in EventHelper.wait_events():
                 if event.type == pygame.QUIT:
                     pygame.quit()
                     sys.exit()
                 elif event.type == pygame.KEYDOWN:
                     if event.key in (pygame.K_SPACE, pygame.K_RETURN):
                         waiting = False
-            self.clock.tick(30)
         
         self.running = False
         self.level_complete = False
@@ -152,7 +211,7 @@ class GameViewer:
         
     def _update_target_pulse(self):
         """Update target pulsing animation"""
-        self.target_pulse_time += 1/30  # Assuming 60 FPS
+        self.target_pulse_time = self.scheduler.frame / 30  # Advances 1/30 per frame
         pulse_factor = (np.sin(self.target_pulse_time * 2 * np.pi * 
                         self.settings.gameplay.target_pulse_rate) + 1) / 2
         self.current_pulse_factor = pulse_factor
@@ -168,8 +227,7 @@ class GameViewer:
             collision = False
             user_shape = self.geometry.get_user_convex_hull(self.user_pos, self.plane_angle, self.settings)
             for shape in self.settings.shapes:
-                shape_hull = self.geometry.get_convex_hull(shape, self.user_pos, self.plane_angle)
-                if self.geometry.check_collision(user_shape, shape_hull):
+                if self._collides(shape, user_shape):
                     collision = True
                     break
             if collision:
@@ -178,8 +236,10 @@ class GameViewer:
             else:
                 break
 
-    def _handle_events(self):
-        for event in pygame.event.get():
+    def _handle_events(self, events: list = None):
+        self.input.begin_frame()
+        for event in events if events is not None else pygame.event.get():
+            self.input.handle_event(event)
             if event.type == pygame.QUIT:
                 self.running = False
                 self.high_score_manager.add_score(self.username, self.total_score + self.points)
@@ -188,42 +248,29 @@ class GameViewer:
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     self._pause_game()
+                elif event.key == pygame.K_F11 or (event.key == pygame.K_RETURN and event.mod & pygame.KMOD_ALT):
+                    self.renderer.toggle_fullscreen()
                 elif event.key == pygame.K_F5 and self.settings.gameplay.debug_mode:
                     self.level_complete = True
                     self.running = False
 
-                if event.key in self.keys_pressed:
-                    self.keys_pressed[event.key] = True
-
                 if event.key == pygame.K_k:  # Zoom in
                     self.settings.viewer.minimap_zoom = min(self.settings.viewer.MAX_ZOOM, self.settings.viewer.minimap_zoom + 0.5)
                 elif event.key == pygame.K_l:  # Zoom out
                     self.settings.viewer.minimap_zoom = max(self.settings.viewer.MIN_ZOOM, self.settings.viewer.minimap_zoom - 0.5)
 
-                if event.key == pygame.K_i:
-                    self.rotating_right = True
-                elif event.key == pygame.K_o:
-                    self.rotating_left = True
-
-            elif event.type == pygame.KEYUP:
-                if event.key in self.keys_pressed:
-                    self.keys_pressed[event.key] = False
-
-                if event.key == pygame.K_i:
-                    self.rotating_right = False
-                elif event.key == pygame.K_o:
-                    self.rotating_left = False
+            elif event.type == pygame.VIDEORESIZE:
+                self.assets.invalidate_display_cache()
+                self.renderer.on_display_changed()
+        self._apply_wheel_rotation()
 
-            
-            if event.type == MOUSEBUTTONDOWN:
-                if event.button == 4:  # Scroll up
-                    self.plane_angle = (self.plane_angle + self.settings.movement.rotate_speed) % (2 * np.pi)
-                    self._compute_all_intersections()
-                    self._adjust_user_position_after_rotation()
-                elif event.button == 5:  # Scroll down
-                    self.plane_angle = (self.plane_angle - self.settings.movement.rotate_speed) % (2 * np.pi)
-                    self._compute_all_intersections()
-                    self._adjust_user_position_after_rotation()
+    def _apply_wheel_rotation(self):
+        """Rotate by the frame's net wheel ticks, reslicing and resolving collisions once"""
+        if self.input.wheel_steps == 0:
+            return
+        self.plane_angle = (self.plane_angle + self.input.wheel_steps * self.settings.movement.rotate_speed) % (2 * np.pi)
+        self._compute_all_intersections()
+        self._adjust_user_position_after_rotation()
 
     def _pause_game(self):
         self.state = GameState.PAUSE
@@ -236,21 +283,21 @@ class GameViewer:
 
     def _resume_game(self):
         self.state = GameState.GAME
+        # The pause menu drew over the whole window
+        self.renderer.invalidate()
         # Reset keys to allow pausing again
-        self.keys_pressed = {key: False for key in self.keys_pressed}
+        self.input.release(self.MOVEMENT_KEYS)
 
 
     def _handle_level_completion(self):
         self.renderer.render_win_message()
         self.assets.stop_music()
         self.assets.play_sound('complete')
-        self.renderer.update_display()
         waiting = True
         while waiting:
-            for event in pygame.event.get():
+            for event in EventHelper.wait_events():
                 if event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
                     waiting = False
-            self.clock.tick(30)
         self.level_complete = True
         self.running = False
 
@@ -263,19 +310,19 @@ class GameViewer:
         can_jump = (current_time - self.last_jump_time) >= self.settings.movement.jump_cooldown
         
         # Handle jumping
-        if (self.keys_pressed[K_SPACE] or self.keys_pressed[K_w]) and self.ground_contact and can_jump:
+        if (self.input.held[K_SPACE] or self.input.held[K_w]) and self.ground_contact and can_jump:
             self.velocity[2] = self.settings.movement.jump_velocity
             self.ground_contact = False
             self.assets.play_sound('jump')
             self.points -= self.jump_penalty
             self.last_jump_time = current_time
 
-        if self.keys_pressed[K_s]:
+        if self.input.held[K_s]:
             movement_acceleration[2] -= self.settings.movement.acceleration
-        if self.keys_pressed[K_a]:
+        if self.input.held[K_a]:
             p_x = np.array([-np.sin(self.plane_angle), np.cos(self.plane_angle), 0.0], dtype=float)
             movement_acceleration += -self.settings.movement.acceleration * p_x
-        if self.keys_pressed[K_d]:
+        if self.input.held[K_d]:
             p_x = np.array([-np.sin(self.plane_angle), np.cos(self.plane_angle), 0.0], dtype=float)
             movement_acceleration += self.settings.movement.acceleration * p_x
 
@@ -314,8 +361,9 @@ class GameViewer:
         user_shape = self.geometry.get_user_convex_hull(self.user_pos, self.plane_angle, self.settings)
         collision = False
         for shape in self.settings.shapes:
-            shape_hull = self.geometry.get_convex_hull(shape, self.user_pos, self.plane_angle)
-            if self.geometry.check_collision(user_shape, shape_hull):
+            if self._collides(shape, user_shape):
+                # Only a hit needs the slice, for the collision normal
+                shape_hull = self.geometry.get_convex_hull(shape, self.user_pos, self.plane_angle)
                 if shape.get('is_target', False):
                     self.level_complete = True
 
@@ -342,17 +390,130 @@ class GameViewer:
         if collision:
             self.user_pos = previous_pos
 
+    def _collides(self, shape: dict, user_shape: list) -> bool:
+        """
+        Test the player against a shape. Compiled convex shapes carry face planes
+        and are tested directly in 3D (in the shape's frame for instances); meshes are tested against their slice
+        outline; others are sliced and tested with SAT.
+        """
+        if shape.get('triangles') is not None:
+            points_2d, edges = self.geometry.compute_intersections(shape, self.user_pos, self.plane_angle)
+            half_width, half_height = user_shape[2]
+            return self.geometry.check_slice_collision(points_2d, edges, half_width, half_height)
+        planes = shape.get('planes')
+        if planes is not None and len(planes):
+            half_width, half_height = user_shape[2]
+            user_pos, plane_angle = self.geometry.local_pose(shape, self.user_pos, self.plane_angle)
+            return self.geometry.check_halfspace_collision(
+                planes, user_pos, plane_angle, half_width, half_height)
+        shape_hull = self.geometry.get_convex_hull(shape, self.user_pos, self.plane_angle)
+        return self.geometry.check_collision(user_shape, shape_hull)
+
+    def _update_streaming(self):
+        """Swap in the chunks the streamer finished loading or evicted"""
+        if not self.streamer.update(self.user_pos):
+            return
+        self.settings.shapes = self.streamer.shapes
+        self.geometry_version += 1
+        self._find_dynamic_shapes()
+        self._add_enemies(self.streamer.take_new_enemies())
+        # Force a re-slice: the pose is unchanged but the shapes are not
+        self.slice_pose = None
+        self._compute_all_intersections()
+
     def _compute_all_intersections(self):
-        self.intersection_coords_2D = []
-        self.intersection_edges = []
-        
+        self._compute_shape_intersections()
+        self._compute_dynamic_intersections()
+        self._compute_enemy_intersections()
+
+    def _compute_shape_intersections(self):
+        """Slice the static level shapes, bumping slice_version whenever the pose changed."""
+        pose = self._slice_pose()
+        if pose == self.slice_pose:
+            return
+        if self.slice_cache is not None:
+            cached = self.slice_cache.get(self.user_pos, self.plane_angle, self.geometry_version)
+            if cached is not None:
+                self._set_slice_batches(pose, *cached)
+                return
+
+        coords_2d = []
+        edges = []
         for shape in self.settings.shapes:
-            points_2d, edges = self.geometry.compute_intersections(
-                shape, self.user_pos, self.plane_angle)
-            self.intersection_coords_2D.append(points_2d)
-            self.intersection_edges.append(edges)
-
-        # Compute intersections for enemies
+            if 'motion' in shape:
+                # Moving shapes are sliced every frame on the dynamic layer
+                points_2d, shape_edges = [], []
+            else:
+                points_2d, shape_edges = self.geometry.compute_intersections(
+                    shape, self.user_pos, self.plane_angle)
+            coords_2d.append(points_2d)
+            edges.append(shape_edges)
+        self._set_shape_slice(pose, coords_2d, edges)
+
+    def _find_dynamic_shapes(self):
+        """Indices of the level shapes that move, i.e. instances with a motion"""
+        self.dynamic_shapes = [i for i, shape in enumerate(self.settings.shapes) if 'motion' in shape]
+
+    def _update_platforms(self):
+        """Move the animated instances by updating their transforms; their points never change."""
+        time = self.scheduler.frame / 60
+        for i in self.dynamic_shapes:
+            shape = self.settings.shapes[i]
+            shape['motion'].update(shape['transform'], time)
+        if self.dynamic_shapes:
+            self._compute_dynamic_intersections()
+
+    def _compute_dynamic_intersections(self):
+        """Slice the moving shapes. Drawn over the cached static layer, like enemies."""
+        slices = [self.geometry.compute_intersections(self.settings.shapes[i], self.user_pos, self.plane_angle)
+                  for i in self.dynamic_shapes]
+        self.dynamic_batch, self.dynamic_target_batch = self._build_slice_batches(
+            self.dynamic_shapes, [coords for coords, _ in slices], [edges for _, edges in slices])
+
+    def _slice_pose(self) -> tuple:
+        return (tuple(self.user_pos), self.plane_angle)
+
+    def _set_shape_slice(self, pose: tuple, coords_2d: list, edges: list):
+        """Install the slice of the level shapes for pose"""
+        static_shapes = [i for i, shape in enumerate(self.settings.shapes) if 'motion' not in shape]
+        batches = self._build_slice_batches(
+            static_shapes, [coords_2d[i] for i in static_shapes], [edges[i] for i in static_shapes])
+        self._set_slice_batches(pose, *batches)
+        if self.slice_cache is not None:
+            self.slice_cache.put(pose[0], pose[1], self.geometry_version, batches)
+
+    def _set_slice_batches(self, pose: tuple, shape_batch, target_batch):
+        self.slice_pose = pose
+        self.slice_version += 1
+        self.shape_batch = shape_batch
+        self.target_batch = target_batch
+
+    def _build_slice_batches(self, shape_indices: list, coords_2d: list, edges: list) -> tuple:
+        """
+        Pack the hull-ordered slices of the given shapes into a render batch and a
+        batch of their target outlines. Slices without edges are degenerate (e.g.
+        collinear points) and are not drawn. Mesh slices can hold several
+        polygons, so each polygon keeps its shape index.
+        """
+        polygons, sources = [], []
+        for i, coords, shape_edges in zip(shape_indices, coords_2d, edges):
+            if not shape_edges:
+                continue
+            if self.settings.shapes[i].get('triangles') is not None:
+                shape_polygons = MeshSlicer.polygons_from_edges(coords, shape_edges)
+            else:
+                shape_polygons = [coords]
+            polygons.extend(shape_polygons)
+            sources.extend([i] * len(shape_polygons))
+        shape_batch = self.geometry.build_polygon_batch(polygons, sources=sources)
+        target_batch = self.geometry.build_polygon_batch(
+            [polygon if self.settings.shapes[i].get('is_target') else []
+             for polygon, i in zip(polygons, sources)],
+            min_points=3, sources=sources)
+        return shape_batch, target_batch
+
+    def _compute_enemy_intersections(self):
+        """Slice the enemies. They move every frame, so this is never cached."""
         self.enemy_intersections = []
         for enemy in self.enemies:
             points_2d, edges_2d = self.geometry.compute_intersections(
@@ -367,6 +528,10 @@ class GameViewer:
                 'enemy': enemy
             })
 
+        self.enemy_batch = self.geometry.build_polygon_batch(
+            [data['points_2d'] if data['edges_2d'] else [] for data in self.enemy_intersections],
+            min_points=3)
+
     def _check_enemy_collisions(self):
         """Check for collisions between the player and enemies."""
         user_hull = self.geometry.get_user_convex_hull(
@@ -380,32 +545,56 @@ class GameViewer:
                 break
 
     def _update_enemies(self):
-        """Move enemies towards the player."""
+        """Steer enemies towards the player, setting where they should be by the next AI tick."""
+        interval = self.scheduler.get_task('enemy_ai').interval
         for enemy in self.enemies:
+            enemy['ai_from'] = enemy['position'].copy()
+            enemy['ai_to'] = enemy['position'].copy()
             direction = self.user_pos - enemy['position']
             distance = np.linalg.norm(direction)
             if distance > 0:
                 direction /= distance  # Normalize
-                enemy['position'] += direction * enemy['speed']
-                # Update enemy shape points
-                self._update_enemy_shape(enemy)
-
-    def _update_enemy_shape(self, enemy):
-        """Update the enemy's shape points based on its new position."""
-        size = enemy['size']
-        half_size = size / 2.0
-        px, py, pz = enemy['position']
-        points = [
-            [px - half_size, py - half_size, pz - half_size],
-            [px + half_size, py - half_size, pz - half_size],
-            [px + half_size, py + half_size, pz - half_size],
-            [px - half_size, py + half_size, pz - half_size],
-            [px - half_size, py - half_size, pz + half_size],
-            [px + half_size, py - half_size, pz + half_size],
-            [px + half_size, py + half_size, pz + half_size],
-            [px - half_size, py + half_size, pz + half_size],
-        ]
-        enemy['shape']['points'] = points
+                enemy['ai_to'] += direction * enemy['speed'] * interval
+        self.enemy_ai_frame = self.scheduler.frame
+
+    def _update_enemy_motion(self):
+        """Interpolate enemies between AI ticks, then slice them and check for hits."""
+        interval = self.scheduler.get_task('enemy_ai').interval
+        # enemy_motion runs before enemy_ai within a frame, so the AI tick is (frame - enemy_ai_frame) frames back
+        alpha = min(1.0, (self.scheduler.frame - self.enemy_ai_frame) / interval)
+        for enemy in self.enemies:
+            enemy['position'] = enemy['ai_from'] + (enemy['ai_to'] - enemy['ai_from']) * alpha
+            # Only the transform moves; the prototype's points are shared
+            enemy['shape']['transform'].position = enemy['position']
+        self._compute_enemy_intersections()
+        self._check_enemy_collisions()
+
+    def _update_enemy_distance(self):
+        """Track the nearest enemy and drive the proximity alarm."""
+        self.min_distance_enemy = "N/A"
+        if self.enemies:
+            distances = [np.linalg.norm(self.user_pos - enemy['position']) for enemy in self.enemies]
+            min_dist = min(distances)
+            self.min_distance_enemy = f"{min_dist:.2f}"
+
+            # Handle alarm sound
+            if min_dist <= self.alarm_distance and not self.alarm_playing:
+                self.assets.play_sound('alarm')
+                self.alarm_playing = True
+            elif min_dist > self.alarm_distance and self.alarm_playing:
+                self.assets.stop_sound('alarm')
+                self.alarm_playing = False
+
+    def _update_player(self):
+        self._update_physics()
+        self._check_fall_condition()
+
+    def _update_hud(self):
+        """Snapshot the values shown in the status text."""
+        self.hud_status = (self.user_pos.copy(), self.plane_angle, self.points, self.min_distance_enemy)
+
+    def _update_minimap(self):
+        self.renderer.refresh_minimap(self.user_pos, self.enemies, self.geometry_version)
 
     def _handle_death(self):
         """Handle player's death when colliding with an enemy."""
@@ -416,38 +605,19 @@ class GameViewer:
     def _update(self):
         dt = 1/60  # Fixed timestep
         # Add smooth rotation update
-        if self.rotating_right:
+        if self.input.held[self.ROTATE_RIGHT_KEY]:
             rotation_amount = (self.rotation_speed * 2 * np.pi * dt)
             self.plane_angle = (self.plane_angle + rotation_amount) % (2 * np.pi)
             self._compute_all_intersections()
             self._adjust_user_position_after_rotation()
-        elif self.rotating_left:
+        elif self.input.held[self.ROTATE_LEFT_KEY]:
             rotation_amount = (self.rotation_speed * 2 * np.pi * dt)
             self.plane_angle = (self.plane_angle - rotation_amount) % (2 * np.pi)
             self._compute_all_intersections()
             self._adjust_user_position_after_rotation()
 
         if not self.level_complete:
-            self._update_physics()
-            self._check_fall_condition()
-            self._update_enemies()
-            self._check_enemy_collisions()
-            self._update_target_pulse()
-            
-            # Calculate minimum distance to enemies
-            self.min_distance_enemy = "N/A"
-            if self.enemies:
-                distances = [np.linalg.norm(self.user_pos - enemy['position']) for enemy in self.enemies]
-                min_dist = min(distances)
-                self.min_distance_enemy = f"{min_dist:.2f}"
-
-                # Handle alarm sound
-                if min_dist <= self.alarm_distance and not self.alarm_playing:
-                    self.assets.play_sound('alarm')
-                    self.alarm_playing = True
-                elif min_dist > self.alarm_distance and self.alarm_playing:
-                    self.assets.sounds['alarm'].stop()
-                    self.alarm_playing = False
+            self.scheduler.run_frame()
             
             self.points -= self.settings.gameplay.points_decrease_rate
             if self.points < 0:
@@ -455,39 +625,38 @@ class GameViewer:
                 self._handle_elim()
 
     def _render(self):
-        self.renderer.clear_screen()
-        self.renderer.draw_shapes(self.settings.shapes,
-                                self.intersection_coords_2D,
-                                self.intersection_edges)
+        self.renderer.adapt_resolution(self.clock.get_rawtime())
+        self.renderer.begin_world_layer()
+        self.renderer.draw_static_layer(self.settings.shapes, self.shape_batch, self.slice_version)
+        self.renderer.draw_shapes(self.settings.shapes, self.dynamic_batch)
         
-        self.renderer.draw_enemies(self.enemy_intersections)
+        self.renderer.draw_enemies(self.enemy_batch)
         
         # Target shapes with pulsing border
-        target_shapes = [s for s in self.settings.shapes if s.get('is_target')]
-        target_idx = [i for i, s in enumerate(self.settings.shapes) if s.get('is_target')]
-        if target_shapes:
-            pulse_factor = self.current_pulse_factor if hasattr(self, 'current_pulse_factor') else 1.0
-            for i in target_idx:
-                coords = self.intersection_coords_2D[i]
-                edges = self.intersection_edges[i]
-                self.renderer.draw_pulsing_target(coords, edges, pulse_factor)
+        pulse_factor = self.current_pulse_factor if hasattr(self, 'current_pulse_factor') else 1.0
+        self.renderer.draw_pulsing_target(self.target_batch, pulse_factor)
+        self.renderer.draw_pulsing_target(self.dynamic_target_batch, pulse_factor)
         
         self.renderer.draw_origin_marker()
         self.renderer.draw_user(self.is_jumping, self.jump_direction)
+        self.renderer.finish_world_layer()
 
-        self.renderer.draw_status_text(
-            self.user_pos,
-            self.plane_angle,
-            self.points,
-            self.min_distance_enemy
-        )
+        self.renderer.draw_status_text(*self.hud_status)
         
         # Handle level completion before final display update
         if self.level_complete:
             self._handle_level_completion()
         
-        self.renderer.draw_minimap(self.user_pos, self.enemies)
+        self.renderer.draw_minimap()
         self.renderer.update_display()
+        if self.on_first_frame:
+            self.on_first_frame()
+            self.on_first_frame = None
+
+    @property
+    def level_time(self) -> float:
+        """Seconds of play in this level, not counting pauses"""
+        return self.scheduler.frame / 60
 
     def run(self):
         self.assets.play_sound('spawn')
@@ -496,8 +665,11 @@ class GameViewer:
                 self._handle_events()
                 self._update()
                 self._render()
-                pygame.display.flip()
                 self.clock.tick(60)
             elif self.state == GameState.PAUSE:
-                self._handle_events()
-                self.clock.tick(60)
\ No newline at end of file
+                # Nothing moves while paused, so sleep until input
+                self._handle_events(EventHelper.wait_events())
+        if self.streamer is not None:
+            self.streamer.shutdown()
+        if self.slice_cache is not None:
+            print(self.slice_cache.report())
\ No newline at end of file